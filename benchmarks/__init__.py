@@ -0,0 +1 @@
+"""mdpo benchmarks."""
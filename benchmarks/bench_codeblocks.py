@@ -0,0 +1,31 @@
+"""Benchmark po2md translating documents with large code blocks.
+
+Run it with ``python -m benchmarks.bench_codeblocks``.
+"""
+
+import sys
+import timeit
+
+from benchmarks.corpora import code_heavy_markdown
+from mdpo.po2md import Po2Md
+
+
+def main():
+    for name, in_list_items in (
+        ('po2md', False),
+        ('po2md (inside list items)', True),
+    ):
+        content = code_heavy_markdown(
+            20,
+            n_lines=2000,
+            in_list_items=in_list_items,
+        )
+        seconds = timeit.timeit(
+            lambda: Po2Md([]).translate(content),  # noqa: B023
+            number=5,
+        ) / 5
+        sys.stdout.write(f'{name}: {seconds * 1000:.2f} ms\n')
+
+
+if __name__ == '__main__':
+    main()
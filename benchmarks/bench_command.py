@@ -0,0 +1,45 @@
+"""Benchmark mdpo HTML commands recognition.
+
+Run it with ``python -m benchmarks.bench_command``.
+"""
+
+import sys
+import timeit
+
+from benchmarks.corpora import command_heavy_markdown
+from mdpo.command import parse_mdpo_html_command
+from mdpo.md2po import markdown_to_pofile
+from mdpo.po2md import Po2Md
+
+
+def main():
+    content = command_heavy_markdown(2000)
+    nodes = content.splitlines()
+    command_aliases = {'on': 'mdpo-enable'}
+
+    results = {
+        'parse_mdpo_html_command': timeit.timeit(
+            lambda: [parse_mdpo_html_command(node) for node in nodes],
+            number=20,
+        ) / 20,
+        'md2po': timeit.timeit(
+            lambda: markdown_to_pofile(
+                content,
+                command_aliases=command_aliases,
+            ),
+            number=3,
+        ) / 3,
+        'po2md': timeit.timeit(
+            lambda: Po2Md(
+                [],
+                command_aliases=command_aliases,
+            ).translate(content),
+            number=3,
+        ) / 3,
+    }
+    for name, seconds in results.items():
+        sys.stdout.write(f'{name}: {seconds * 1000:.2f} ms\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark PO files serialization.
+
+Run it with ``python -m benchmarks.bench_po``.
+
+The first serialization, with a cold cache, is not faster than polib: it
+takes about the same time or up to a quarter more, spent filling the cache
+(2.577 s against 2.508 s of polib in one run, 3.325 s against 3.115 s in
+another). The gain comes from serializing unchanged messages again, which
+is about ten times faster with a warm cache.
+"""
+
+import sys
+import timeit
+
+import polib
+
+from mdpo.po import _wrapped_field, pofile_to_string
+
+
+def build_pofile(size=50000):
+    """Build a PO file like the ones extracted by mdpo from big documents."""
+    pofile = polib.POFile()
+    pofile.metadata = {'Content-Type': 'text/plain; charset=utf-8'}
+    for i in range(size):
+        pofile.append(
+            polib.POEntry(
+                msgid=(
+                    f'Paragraph {i} with **bold** text, a [link](#{i}) and'
+                    ' enough words to be wrapped in several lines by the'
+                    ' PO files serializer.'
+                ),
+                msgstr=f'Párrafo {i}' if i % 3 else '',
+                occurrences=[('docs/index.md', f'block {i} (paragraph)')],
+            ),
+        )
+    return pofile
+
+
+def cold_pofile_to_string(pofile):
+    """Serialize a PO file without wrapped lines cached."""
+    _wrapped_field.cache_clear()
+    return pofile_to_string(pofile)
+
+
+def main():
+    pofile = build_pofile()
+    for name, implementation in (
+        ('polib', str),
+        ('mdpo (cold cache)', cold_pofile_to_string),
+        ('mdpo (warm cache)', pofile_to_string),
+    ):
+        seconds = min(
+            timeit.repeat(
+                lambda: implementation(pofile),  # noqa: B023
+                number=1,
+                repeat=3,
+            ),
+        )
+        sys.stdout.write(f'{len(pofile)} entries - {name}: {seconds:.3f} s\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark mdpo text utilities.
+
+Run it with ``python -m benchmarks.bench_text``.
+"""
+
+import sys
+import timeit
+
+from mdpo.text import min_not_max_chars_in_a_row
+
+
+def previous_min_not_max_chars_in_a_row(char, text, default=1):
+    """Previous quadratic implementation of ``min_not_max_chars_in_a_row``."""
+    in_a_rows, _current_in_a_row, _in_the_row = ([], 0, False)
+    for ch in text:
+        if ch == char:
+            _current_in_a_row += 1
+            _in_the_row = True
+        elif _in_the_row:
+            _in_the_row = False
+            if _current_in_a_row not in in_a_rows:
+                in_a_rows.append(_current_in_a_row)
+            _current_in_a_row = 0
+    if _in_the_row and _current_in_a_row not in in_a_rows:
+        in_a_rows.append(_current_in_a_row)
+
+    if in_a_rows:
+        response = None
+        for n in range(1, max(in_a_rows) + 2):
+            if n not in in_a_rows:
+                response = n
+                break
+    else:
+        response = default
+    return response
+
+
+TEXTS = {
+    'no backticks': 'inline code without backticks ' * 4,
+    'few backticks': 'code with `` and ``` backticks',
+    'many backtick runs': ' '.join('`' * n for n in range(1, 300)),
+}
+
+
+def main():
+    for name, text in TEXTS.items():
+        for implementation in (
+            previous_min_not_max_chars_in_a_row,
+            min_not_max_chars_in_a_row,
+        ):
+            seconds = timeit.timeit(
+                lambda: implementation('`', text),  # noqa: B023
+                number=2000,
+            ) / 2000
+            sys.stdout.write(
+                f'{name} - {implementation.__name__}:'
+                f' {seconds * 1000000:.2f} us\n',
+            )
+
+
+if __name__ == '__main__':
+    main()
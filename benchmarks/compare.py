@@ -0,0 +1,70 @@
+"""Compare two results files written by ``benchmarks.run``.
+
+Run it with ``python -m benchmarks.compare BASE.json HEAD.json``.
+"""
+
+import argparse
+import json
+import sys
+
+
+def compare(base, head, threshold=0.1):
+    """Compare minimum wall times and peak memory of two results.
+
+    Args:
+        base (dict): Results of reference.
+        head (dict): Results to compare against the reference.
+        threshold (float): Relative increment of wall time considered
+            a regression.
+
+    Returns:
+        tuple: Lines of the comparison table and the number of
+        regressions found.
+    """
+    lines = [
+        f'{"corpus":<22} {"entry point":<32} {"time":>8} {"memory":>8}',
+    ]
+    regressions = 0
+    for corpus, entry_points in head['results'].items():
+        for entry_point, result in entry_points.items():
+            try:
+                base_result = base['results'][corpus][entry_point]
+            except KeyError:
+                continue
+            time_ratio = result['min'] / base_result['min']
+            memory_ratio = (
+                result['peak_memory'] / base_result['peak_memory']
+            )
+            mark = ''
+            if time_ratio > 1 + threshold:
+                mark = ' (regression)'
+                regressions += 1
+            lines.append(
+                f'{corpus:<22} {entry_point:<32}'
+                f' {time_ratio:>7.2f}x {memory_ratio:>7.2f}x{mark}',
+            )
+    return (lines, regressions)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('base', help='Results file of reference.')
+    parser.add_argument('head', help='Results file to compare.')
+    parser.add_argument(
+        '-t', '--threshold', type=float, default=0.1,
+        help='Relative increment of wall time considered a regression.',
+    )
+    opts = parser.parse_args(args)
+
+    with open(opts.base, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(opts.head, encoding='utf-8') as f:
+        head = json.load(f)
+
+    lines, regressions = compare(base, head, threshold=opts.threshold)
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
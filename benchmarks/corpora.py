@@ -0,0 +1,143 @@
+"""Generated Markdown corpora used by mdpo benchmarks.
+
+Each corpus is built by a function which takes a ``size`` argument, the
+number of top-level blocks of the document, and returns Markdown content.
+Contents are deterministic, so results are comparable between runs.
+"""
+
+import os
+
+import md4c
+
+from mdpo.md2po import markdown_to_pofile
+
+
+def paragraph_heavy_markdown(size=1000):
+    """Build Markdown content made of headers, paragraphs and lists."""
+    blocks = []
+    for i in range(size):
+        if i % 10 == 0:
+            blocks.append(f'## Section {i // 10}')
+        elif i % 10 == 5:  # noqa: PLR2004
+            blocks.append(
+                f'- First item of list {i} with **bold** text\n'
+                f'- Second item of list {i} with `code`\n'
+                f'- Third item of list {i} with *italic* text',
+            )
+        else:
+            blocks.append(
+                f'Paragraph {i} has some **bold text**, *italic text*,'
+                ' `inline code` and a [link](https://example.com/'
+                f'{i} "Title {i}"). It is long enough to be wrapped at'
+                ' the default width, so wrapping is measured too.',
+            )
+    return '\n\n'.join(blocks) + '\n'
+
+
+def table_heavy_markdown(size=1000):
+    """Build Markdown content made of tables."""
+    blocks = []
+    for i in range(0, size, 10):
+        rows = [
+            '| Name | Description | Value |',
+            '| :--- | :---: | ---: |',
+        ]
+        rows.extend(
+            f'| Row {j} | Description of row {j} | `{i * j}` |'
+            for j in range(10)
+        )
+        blocks.append('\n'.join(rows))
+    return '\n\n'.join(blocks) + '\n'
+
+
+def code_heavy_markdown(size=1000, n_lines=200, in_list_items=False):
+    """Build Markdown content with large indented and fenced code blocks.
+
+    If ``in_list_items`` is ``True``, each listing is a list item.
+    """
+    indent = '  ' if in_list_items else ''
+    code_lines = [
+        f'{indent}value_{i} = compute({i}) + {i}' for i in range(n_lines)
+    ]
+    indented = '\n'.join(f'    {line}' for line in code_lines)
+    fenced = '\n'.join(code_lines)
+    blocks = []
+    for i in range(0, size, 2):
+        blocks.append(f'- Listing {i}:' if in_list_items else f'Listing {i}:')
+        blocks.append(
+            indented if i % 4
+            else f'{indent}```python\n{fenced}\n{indent}```',
+        )
+    return '\n\n'.join(blocks) + '\n'
+
+
+def link_reference_heavy_markdown(size=1000):
+    """Build Markdown content with referenced links and images."""
+    blocks, references = ([], [])
+    for i in range(size):
+        blocks.append(
+            f'Paragraph with a [referenced link][ref{i}] and an'
+            f' image ![alt {i}][img{i}].',
+        )
+        references.append(f'[ref{i}]: https://example.com/{i} "Ref {i}"')
+        references.append(f'[img{i}]: https://example.com/{i}.png')
+    return '\n\n'.join(blocks) + '\n\n' + '\n'.join(references) + '\n'
+
+
+def command_heavy_markdown(size=1000):
+    """Build Markdown content with a HTML comment before each paragraph."""
+    blocks = []
+    for i in range(size):
+        if i % 4 == 0:
+            blocks.append('<!-- mdpo-context Context -->')
+        elif i % 4 == 1:
+            blocks.append('<!-- mdpo-disable-next-line -->')
+        elif i % 4 == 2:  # noqa: PLR2004
+            blocks.append('<!-- on -->')
+        else:
+            blocks.append('<div>Not a comment</div>')
+        blocks.append(f'Paragraph number {i}.\n')
+    return '\n'.join(blocks)
+
+
+CORPORA = {
+    'paragraph-heavy': paragraph_heavy_markdown,
+    'table-heavy': table_heavy_markdown,
+    'code-heavy': code_heavy_markdown,
+    'link-reference-heavy': link_reference_heavy_markdown,
+    'command-heavy': command_heavy_markdown,
+}
+
+
+def write_corpus(name, size, dirpath):
+    """Write a corpus to a directory, with its translated PO file and HTML.
+
+    The PO file is extracted with md2po and all its messages are translated
+    in upper case, so translations are really replaced.
+
+    Args:
+        name (str): Name of the corpus, a key of :py:data:`CORPORA`.
+        size (int): Number of top-level blocks of the document.
+        dirpath (str): Directory where the files will be written.
+
+    Returns:
+        tuple: Paths to the Markdown, the PO and the HTML files written.
+    """
+    content = CORPORA[name](size)
+
+    md_filepath = os.path.join(dirpath, f'{name}.md')
+    with open(md_filepath, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    po_filepath = os.path.join(dirpath, f'{name}.po')
+    pofile = markdown_to_pofile(md_filepath, location=False)
+    for entry in pofile:
+        entry.msgstr = entry.msgid.upper()
+        entry.flags = []
+    pofile.save(po_filepath)
+
+    html_filepath = os.path.join(dirpath, f'{name}.html')
+    with open(html_filepath, 'w', encoding='utf-8') as f:
+        f.write(md4c.HTMLRenderer(md4c.MD_FLAG_TABLES).parse(content))
+
+    return (md_filepath, po_filepath, html_filepath)
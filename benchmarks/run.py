@@ -0,0 +1,205 @@
+"""Run mdpo benchmarks writing machine-readable results.
+
+Each public entry point is executed over generated corpora measuring its
+wall time and its peak memory allocated. Run it with
+``python -m benchmarks.run``, see ``--help`` for available options.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.corpora import CORPORA, write_corpus
+from mdpo.compat import importlib_metadata
+from mdpo.md2po import markdown_to_pofile
+from mdpo.md2po2md import markdown_to_pofile_to_markdown
+from mdpo.mdpo2html import markdown_pofile_to_html
+from mdpo.po2md import pofile_to_markdown
+
+
+COMMAND_ALIASES = {'on': 'mdpo-enable'}
+
+
+def _md2po(md_filepath, po_filepath, _html_filepath, _tmpdir):
+    markdown_to_pofile(
+        md_filepath,
+        po_filepath=po_filepath,
+        command_aliases=COMMAND_ALIASES,
+    )
+
+
+def _po2md(md_filepath, po_filepath, _html_filepath, _tmpdir):
+    pofile_to_markdown(
+        md_filepath,
+        po_filepath,
+        command_aliases=COMMAND_ALIASES,
+    )
+
+
+def _md2po2md(md_filepath, _po_filepath, _html_filepath, tmpdir):
+    output_dir = os.path.join(tmpdir, 'md2po2md')
+    markdown_to_pofile_to_markdown(
+        ['es', 'fr'],
+        md_filepath,
+        os.path.join(output_dir, '{lang}'),
+        command_aliases=COMMAND_ALIASES,
+    )
+    shutil.rmtree(output_dir)
+
+
+def _mdpo2html(_md_filepath, po_filepath, html_filepath, _tmpdir):
+    markdown_pofile_to_html(
+        html_filepath,
+        po_filepath,
+        command_aliases=COMMAND_ALIASES,
+    )
+
+
+ENTRY_POINTS = {
+    'markdown_to_pofile': _md2po,
+    'pofile_to_markdown': _po2md,
+    'markdown_to_pofile_to_markdown': _md2po2md,
+    'markdown_pofile_to_html': _mdpo2html,
+}
+
+
+def measure(func, args, repeat):
+    """Measure wall times and peak memory executing a function.
+
+    Memory is measured in an additional execution, because tracing
+    allocations slows down the execution.
+
+    Returns:
+        dict: Minimum and median wall times in seconds and peak memory
+        allocated in bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'peak_memory': peak_memory,
+    }
+
+
+def _git_revision():
+    try:
+        proc = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def run(corpora, entry_points, size, repeat):
+    """Run benchmarks over corpora.
+
+    Args:
+        corpora (list): Names of corpora to use.
+        entry_points (list): Names of mdpo entry points to measure.
+        size (int): Number of top-level blocks of each corpus document.
+        repeat (int): Number of executions measuring wall times.
+
+    Returns:
+        dict: Environment information and results for each corpus and
+        entry point.
+    """
+    results = {
+        'revision': _git_revision(),
+        'mdpo_version': importlib_metadata.version('mdpo'),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'size': size,
+        'repeat': repeat,
+        'results': {},
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for corpus in corpora:
+            filepaths = write_corpus(corpus, size, tmpdir)
+            results['results'][corpus] = {}
+            for entry_point in entry_points:
+                result = measure(
+                    ENTRY_POINTS[entry_point],
+                    (*filepaths, tmpdir),
+                    repeat,
+                )
+                results['results'][corpus][entry_point] = result
+                sys.stderr.write(
+                    f'{corpus} - {entry_point}:'
+                    f' {result["min"] * 1000:.2f} ms,'
+                    f' {result["peak_memory"] / 1024:.0f} KiB\n',
+                )
+    return results
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-s', '--size', type=int, default=500,
+        help='Number of top-level blocks of each corpus document.',
+    )
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='Number of executions measuring wall times.',
+    )
+    parser.add_argument(
+        '-c', '--corpus', dest='corpora', action='append',
+        choices=list(CORPORA),
+        help='Corpus to use. This argument can be passed multiple times.'
+             ' If not passed, all corpora are used.',
+    )
+    parser.add_argument(
+        '-e', '--entry-point', dest='entry_points', action='append',
+        choices=list(ENTRY_POINTS),
+        help='Entry point to measure. This argument can be passed multiple'
+             ' times. If not passed, all entry points are measured.',
+    )
+    parser.add_argument(
+        '-o', '--output', default=None,
+        help='JSON file where results will be written. If not passed,'
+             ' are written to STDOUT.',
+    )
+    return parser
+
+
+def main(args=None):
+    opts = build_parser().parse_args(args)
+    results = run(
+        opts.corpora or list(CORPORA),
+        opts.entry_points or list(ENTRY_POINTS),
+        opts.size,
+        opts.repeat,
+    )
+    output = json.dumps(results, indent=2)
+    if opts.output:
+        with open(opts.output, 'w', encoding='utf-8') as f:
+            f.write(f'{output}\n')
+    else:
+        sys.stdout.write(f'{output}\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,11 @@
 
 
 func_package_map = {
+    'amarkdown_pofile_to_html': 'mdpo2html',
+    'amarkdown_to_pofile': 'md2po',
+    'amarkdown_to_pofile_to_markdown': 'md2po2md',
+    'apofile_to_markdown': 'po2md',
+    'iter_messages': 'md2po',
     'markdown_pofile_to_html': 'mdpo2html',
     'markdown_to_pofile': 'md2po',
     'markdown_to_pofile_to_markdown': 'md2po2md',
@@ -0,0 +1,296 @@
+"""Translations of PO files stored in memory-mapped files.
+
+A catalog store serializes the tables of translations used by the
+implementations, by message and by context and message, into a file with a
+hashed layout. Each process attaches to the file mapping it in memory
+read-only, so the translations are shared between processes through the
+page cache instead of being parsed or copied into each one, and messages
+are decoded only when they are looked up.
+
+Catalog stores are pickled by path, so they can be passed to the workers
+of a pool of processes. They can be used by :py:class:`mdpo.po2md.Po2Md`
+and :py:class:`mdpo.mdpo2html.MdPo2HTML` passing them as ``catalog``
+argument. Stores passed as objects are owned by the caller, who must close
+them, but those passed as paths are opened and closed by the translators in
+each translation.
+
+Example:
+    .. code-block:: python
+
+       import functools
+       from concurrent.futures import ProcessPoolExecutor
+
+       from mdpo.catalog import pofiles_to_catalog_store
+       from mdpo.po2md import pofile_to_markdown
+
+       catalog = pofiles_to_catalog_store('locale/es/*.po', 'es.catalog')
+
+       with ProcessPoolExecutor() as executor:
+           outputs = executor.map(
+               functools.partial(
+                   pofile_to_markdown,
+                   pofiles=[],
+                   catalog=catalog,
+               ),
+               markdown_filepaths,
+           )
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Mapping
+
+
+#: bytes: Identifier written at the start of catalog store files.
+MAGIC = b'MDPOCAT\x01'
+
+# magic, number of slots of the hash table and number of entries
+_HEADER = struct.Struct('<8sQQ')
+# hash of the key and offset of the entry, which is 0 for empty slots
+_SLOT = struct.Struct('<IQ')
+# length of the key and length of the value
+_ENTRY = struct.Struct('<II')
+
+# first byte of the keys, defining the kind of entry
+_MSGID_KEY = b'\x00'
+_MSGCTXT_MSGID_KEY = b'\x01'
+_MSGCTXT_KEY = b'\x02'
+# separator of context and message in keys, as used by MO files
+_MSGCTXT_SEPARATOR = b'\x04'
+
+
+def _catalog_entries(translations, translations_with_msgctxt):
+    for msgid, msgstr in translations.items():
+        yield _MSGID_KEY + msgid.encode('utf-8'), msgstr.encode('utf-8')
+    for msgctxt, msgctxt_translations in translations_with_msgctxt.items():
+        msgctxt_key = msgctxt.encode('utf-8')
+        yield _MSGCTXT_KEY + msgctxt_key, b''
+        msgctxt_key = _MSGCTXT_MSGID_KEY + msgctxt_key + _MSGCTXT_SEPARATOR
+        for msgid, msgstr in msgctxt_translations.items():
+            yield msgctxt_key + msgid.encode('utf-8'), msgstr.encode('utf-8')
+
+
+def write_catalog_store(filepath, translations, translations_with_msgctxt):
+    """Write tables of translations to a catalog store file.
+
+    Args:
+        filepath (str): Path to the file to write.
+        translations (dict): Mapping of msgids to msgstrs.
+        translations_with_msgctxt (dict): Mapping of msgctxts to mappings
+            of msgids to msgstrs, as returned by
+            :py:func:`mdpo.po.pofiles_to_unique_translations_dicts`.
+
+    Returns:
+        :py:class:`mdpo.catalog.CatalogStore`: Store attached to the file.
+    """
+    entries_count = len(translations) + sum(
+        len(msgctxt_translations) + 1
+        for msgctxt_translations in translations_with_msgctxt.values()
+    )
+    # load factor of the hash table below 0.5
+    slots_count = 1 << max(3, (entries_count * 2).bit_length())
+    mask = slots_count - 1
+    table = bytearray(slots_count * _SLOT.size)
+
+    offset = _HEADER.size + len(table)
+    with open(filepath, 'wb') as f:
+        f.seek(offset)
+        for key, value in _catalog_entries(
+            translations,
+            translations_with_msgctxt,
+        ):
+            key_hash = zlib.crc32(key)
+            slot = key_hash & mask
+            while _SLOT.unpack_from(table, slot * _SLOT.size)[1]:
+                slot = (slot + 1) & mask
+            _SLOT.pack_into(table, slot * _SLOT.size, key_hash, offset)
+
+            f.write(_ENTRY.pack(len(key), len(value)))
+            f.write(key)
+            f.write(value)
+            offset += _ENTRY.size + len(key) + len(value)
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, slots_count, entries_count))
+        f.write(table)
+    return CatalogStore(filepath)
+
+
+def pofiles_to_catalog_store(
+    pofiles,
+    filepath,
+    ignore=frozenset(),
+    po_encoding=None,
+):
+    """Write the translations of a set of PO files to a catalog store file.
+
+    Args:
+        pofiles (str, list): Glob or list of globs matching a set of PO
+            files from where to extract the translations.
+        filepath (str): Path to the file to write.
+        ignore (list): Paths of PO files to ignore, as gitignore-style
+            rules. See :py:class:`mdpo.io.IgnoreRules`.
+        po_encoding (str): PO files encoding.
+
+    Returns:
+        :py:class:`mdpo.catalog.CatalogStore`: Store attached to the file.
+    """
+    from mdpo.po import (
+        paths_or_globs_to_unique_pofiles,
+        pofiles_to_unique_translations_dicts,
+    )
+
+    return write_catalog_store(
+        filepath,
+        *pofiles_to_unique_translations_dicts(
+            paths_or_globs_to_unique_pofiles(
+                pofiles,
+                ignore,
+                po_encoding=po_encoding,
+            ),
+        ),
+    )
+
+
+class CatalogStore:
+    """Catalog store file attached in memory read-only.
+
+    Args:
+        filepath (str): Path to a file written by
+            :py:func:`mdpo.catalog.write_catalog_store`.
+
+    Raises:
+        ValueError: The file is not a catalog store.
+    """
+
+    __slots__ = (
+        'filepath',
+        'translations',
+        'translations_with_msgctxt',
+        '_mmap',
+        '_mask',
+        '_entries_offset',
+    )
+
+    def __init__(self, filepath):
+        #: str: Path to the catalog store file.
+        self.filepath = filepath
+
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"'{filepath}' is not a catalog store file")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, slots_count, _ = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"'{filepath}' is not a catalog store file")
+        self._mask = slots_count - 1
+        self._entries_offset = _HEADER.size + slots_count * _SLOT.size
+
+        #: :py:class:`collections.abc.Mapping`: Mapping of msgids to
+        #: msgstrs of messages without context.
+        self.translations = _CatalogTranslations(self, _MSGID_KEY)
+
+        #: :py:class:`collections.abc.Mapping`: Mapping of msgctxts to
+        #: mappings of msgids to msgstrs.
+        self.translations_with_msgctxt = _CatalogContexts(self)
+
+    def _lookup(self, key):
+        mm = self._mmap
+        key_hash = zlib.crc32(key)
+        slot = key_hash & self._mask
+        while True:
+            slot_hash, offset = _SLOT.unpack_from(
+                mm,
+                _HEADER.size + slot * _SLOT.size,
+            )
+            if not offset:
+                return None
+            if slot_hash == key_hash:
+                key_length, value_length = _ENTRY.unpack_from(mm, offset)
+                start = offset + _ENTRY.size
+                if mm[start:start + key_length] == key:
+                    start += key_length
+                    return mm[start:start + value_length].decode('utf-8')
+            slot = (slot + 1) & self._mask
+
+    def _iter_keys(self, prefix):
+        mm, offset, end = self._mmap, self._entries_offset, len(self._mmap)
+        while offset < end:
+            key_length, value_length = _ENTRY.unpack_from(mm, offset)
+            start = offset + _ENTRY.size
+            key = mm[start:start + key_length]
+            if key.startswith(prefix):
+                yield key[len(prefix):].decode('utf-8')
+            offset = start + key_length + value_length
+
+    @property
+    def closed(self):
+        """bool: Whether the store has been detached from the file."""
+        return self._mmap.closed
+
+    def close(self):
+        """Detach the store from the file."""
+        self._mmap.close()
+
+    def __enter__(self):
+        """Use the store as a context manager, detaching it at exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Detach the store from the file."""
+        self.close()
+
+    def __reduce__(self):
+        """Pickle the store by path, attaching to the file when unpickled."""
+        return (CatalogStore, (self.filepath,))
+
+
+class _CatalogTranslations(Mapping):
+    __slots__ = ('_store', '_prefix')
+
+    def __init__(self, store, prefix):
+        self._store = store
+        self._prefix = prefix
+
+    def __getitem__(self, msgid):
+        msgstr = self._store._lookup(self._prefix + msgid.encode('utf-8'))
+        if msgstr is None:
+            raise KeyError(msgid)
+        return msgstr
+
+    def __iter__(self):
+        return self._store._iter_keys(self._prefix)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return (_CatalogTranslations, (self._store, self._prefix))
+
+
+class _CatalogContexts(Mapping):
+    __slots__ = ('_store',)
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, msgctxt):
+        msgctxt_key = msgctxt.encode('utf-8')
+        if self._store._lookup(_MSGCTXT_KEY + msgctxt_key) is None:
+            raise KeyError(msgctxt)
+        return _CatalogTranslations(
+            self._store,
+            _MSGCTXT_MSGID_KEY + msgctxt_key + _MSGCTXT_SEPARATOR,
+        )
+
+    def __iter__(self):
+        return self._store._iter_keys(_MSGCTXT_KEY)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return (_CatalogContexts, (self._store,))
@@ -1,11 +1,14 @@
 """mdpo command line interface utilities."""
 
 import argparse
+import contextlib
 import sys
 
 from importlib_metadata_argparse_version import ImportlibMetadataVersionAction
 
+from mdpo.event import DEBUG_LEVELS, DebugTracer
 from mdpo.md4c import DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS
+from mdpo.profiling import Profile
 from mdpo.text import and_join, parse_escaped_pairs
 
 
@@ -186,7 +189,7 @@ def add_extensions_argument(parser):
 
 
 def add_debug_option(parser):
-    """Add the ``-D/--debug`` option to an argument parser.
+    """Add the ``-D/--debug`` option and its tracing options to a parser.
 
     Args:
         parser (:py:class:`argparse.ArgumentParser`): Parser to extend.
@@ -196,6 +199,58 @@ def add_debug_option(parser):
         help='Print useful messages in the parsing process showing the'
              ' contents of all Markdown elements.',
     )
+    parser.add_argument(
+        '--debug-file', dest='debug_file', default=None, metavar='PATH',
+        help='Write debugging messages to a file instead of STDOUT.'
+             ' Implies --debug.',
+    )
+    parser.add_argument(
+        '--debug-format', dest='debug_format', default=None,
+        choices=('text', 'jsonl'),
+        help='Format of debugging messages: human readable text lines or'
+             ' a JSON object per line. Implies --debug. By default, text.',
+    )
+    parser.add_argument(
+        '--debug-level', dest='debug_level', default=None,
+        choices=DEBUG_LEVELS,
+        help='Debugging verbosity: only messages, commands and link'
+             ' references (msgid), also blocks (block) or also spans and'
+             ' texts (all). Implies --debug. By default, all.',
+    )
+    parser.add_argument(
+        '--debug-sample-rate', dest='debug_sample_rate', default=None,
+        type=float, metavar='RATE',
+        help='Fraction of blocks, spans and texts debugging messages'
+             ' written, between 0 and 1. Implies --debug. By default, 1.',
+    )
+
+
+def parse_debug_options(opts):
+    """Build the debugging tracer defined by command line options.
+
+    Args:
+        opts (:py:class:`argparse.Namespace`): Parsed options, including
+            those added by :py:func:`mdpo.cli.add_debug_option`.
+
+    Returns:
+        :py:class:`mdpo.event.DebugTracer`: Debugging tracer or ``False`` if
+        debugging is not enabled.
+    """
+    tracer_kwargs = {
+        kwarg: value for kwarg, value in (
+            ('filepath', opts.debug_file),
+            ('output_format', opts.debug_format),
+            ('level', opts.debug_level),
+            ('sample_rate', opts.debug_sample_rate),
+        ) if value is not None
+    }
+    if not opts.debug and not tracer_kwargs:
+        return False
+    try:
+        return DebugTracer(**tracer_kwargs)
+    except ValueError as err:
+        sys.stderr.write(f'{err.args[0]}\n')
+        sys.exit(1)
 
 
 def add_nolocation_option(parser):
@@ -397,3 +452,53 @@ def add_no_empty_msgstr_option(parser):
             'If empty msgstrs found in PO files exit with non zero code.'
         ),
     )
+
+
+def add_profile_option(parser):
+    """Add the ``--profile`` option to an argument parser.
+
+    Args:
+        parser (:py:class:`argparse.ArgumentParser`): Parser to extend.
+    """
+    parser.add_argument(
+        '--profile', dest='profile', nargs='?', const=True, default=None,
+        metavar='PATH',
+        help='Print to stderr a summary with the time spent in each phase'
+             ' of the execution. If a path is passed, a cProfile dump is'
+             ' also written to it, which can be inspected with pstats or'
+             ' tools like snakeviz. Note that the path must be passed as'
+             f' {cli_codespan("--profile=PATH")}.',
+    )
+
+
+@contextlib.contextmanager
+def profile_cli_execution(value):
+    """Profile the execution of a command line interface.
+
+    Args:
+        value (str): Value of the ``--profile`` option. If ``None`` nothing
+            is profiled, if ``True`` only per-phase timings are recorded and
+            if a path, a cProfile dump is also written to it.
+
+    Yields:
+        :py:class:`mdpo.profiling.Profile`: Profile to pass to mdpo
+        implementations, or ``None`` if profiling is disabled.
+    """
+    if value is None:
+        yield None
+        return
+
+    profile = Profile()
+    profiler = None
+    if value is not True:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(value)
+        sys.stderr.write(profile.summary())
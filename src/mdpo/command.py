@@ -1,7 +1,10 @@
 """mdpo HTML commands related utilities."""
 
+import re
+
 
 COMMAND_SEARCH_REGEX = r'<\!\-\-\s{0,}([^\s]+)\s{0,}([\w\s]+)?\-\->'
+COMMAND_SEARCH_RE = re.compile(COMMAND_SEARCH_REGEX)
 
 MDPO_COMMANDS = [
     'context',
@@ -33,14 +36,39 @@ def parse_mdpo_html_command(value):
         tuple: Namename of the command (not including the ``"mdpo"`` prefix)
         and its value.
     """
-    import re
-    command_match = re.compile(COMMAND_SEARCH_REGEX).search(value)
+    # most of HTML nodes are not comments, so discard them before
+    # executing the regex
+    if '<!--' not in value:
+        return (None, None)
+    command_match = COMMAND_SEARCH_RE.search(value)
     if command_match:
         command, comment = command_match.groups()
         return (command, comment.rstrip(' ') if comment else None)
     return (None, None)
 
 
+def resolve_mdpo_html_command(value, command_aliases):
+    """Parse a mdpo HTML command resolving its custom alias, if any.
+
+    Args:
+        value (str): Text where will a command will be searched.
+        command_aliases (dict): Aliases normalized by
+            :py:func:`mdpo.command.normalize_mdpo_command_aliases`.
+
+    Returns:
+        tuple: Resolved command, its value and the command as is written
+        in the text. If a command is not found, all values are ``None``.
+    """
+    original_command, comment = parse_mdpo_html_command(value)
+    if original_command is None:
+        return (None, None, None)
+    return (
+        command_aliases.get(original_command, original_command),
+        comment,
+        original_command,
+    )
+
+
 def normalize_mdpo_command(value):
     """Normalize a valid command and returns None if the command is invalid.
 
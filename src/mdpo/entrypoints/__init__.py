@@ -0,0 +1,6 @@
+"""mdpo command line interfaces.
+
+These modules are placed outside the implementations packages and import
+them lazily, so showing the help or the version of a command line interface
+doesn't load the parsing stack.
+"""
@@ -0,0 +1,365 @@
+#!/usr/bin/env python
+
+"""md2po command line interface.
+
+See :ref:`md2po CLI<cli:md2po>`.
+"""
+
+import argparse
+import shutil
+import sys
+
+from mdpo.cli import (
+    CLOSE_QUOTE_CHAR,
+    OPEN_QUOTE_CHAR,
+    add_check_option,
+    add_command_alias_argument,
+    add_common_cli_first_arguments,
+    add_debug_option,
+    add_encoding_arguments,
+    add_event_argument,
+    add_extensions_argument,
+    add_include_codeblocks_option,
+    add_no_empty_msgstr_option,
+    add_no_fuzzy_option,
+    add_no_obsolete_option,
+    add_nolocation_option,
+    add_profile_option,
+    add_wrapwidth_argument,
+    cli_codespan,
+    parse_command_aliases_cli_arguments,
+    parse_debug_options,
+    parse_event_argument,
+    parse_metadata_cli_arguments,
+    profile_cli_execution,
+)
+from mdpo.io import environ
+from mdpo.md4c import DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS
+from mdpo.server import forward_to_server
+
+
+DESCRIPTION = (
+    'Utility like xgettext to extract Markdown contents dumping them'
+    ' inside PO files.'
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=DESCRIPTION, add_help=False)
+    add_common_cli_first_arguments(parser)
+    parser.add_argument(
+        'files_or_content', metavar='GLOBS_FILES_OR_CONTENT',
+        nargs='*',
+        help='Globs to markdown input files, paths to files or Markdown'
+             ' content. If not provided, will be read from STDIN.',
+    )
+    input_kind_group = parser.add_mutually_exclusive_group()
+    input_kind_group.add_argument(
+        '--content', dest='input_kind', action='store_const',
+        const='content',
+        help='Treat the input as Markdown content, without checking if it is'
+             ' a glob. Useful to pass big documents through STDIN.',
+    )
+    input_kind_group.add_argument(
+        '--paths', dest='input_kind', action='store_const', const='paths',
+        help='Treat the input as globs or paths to Markdown files, without'
+             ' checking if it is content.',
+    )
+    parser.add_argument(
+        '-i', '--ignore', dest='ignore', default=[], action='append',
+        help='Path to a file to ignore. Gitignore-style patterns are'
+             " supported, like 'drafts/' or '**/*.tmp.md', and patterns"
+             " prefixed with '!' include again excluded files. This argument"
+             ' can be passed multiple times.',
+        metavar='PATH',
+    )
+    parser.add_argument(
+        '-p', '--po-filepath', '--pofilepath', dest='po_filepath',
+        default=None,
+        help='Merge new msgids in the po file indicated at this parameter (if'
+             f' {cli_codespan("--save")} argument is passed) or use the msgids'
+             ' of the file as reference for mark not found as obsoletes if'
+             f' {cli_codespan("--merge-pofiles")} parameter is not passed.',
+        metavar='OUTPUT_PO_FILEPATH',
+    )
+    parser.add_argument(
+        '-s', '--save', dest='save', action='store_true',
+        help='Save new found msgids to the po file indicated as parameter'
+             f' {cli_codespan("--po-filepath")}. Passing this option without'
+             f' defining the argument {cli_codespan("--po-filepath")} will'
+              ' raise an error.',
+    )
+    parser.add_argument(
+        '--mo-filepath', '--mofilepath', dest='mo_filepath',
+        default=None,
+        help='The resulting PO file will be compiled to a mofile and saved in'
+             ' the path specified at this parameter.',
+        metavar='OUTPUT_MO_FILEPATH',
+    )
+    parser.add_argument(
+        '--plaintext', dest='plaintext', action='store_true',
+        help='Do not include markdown markup characters in extracted msgids'
+             f' for {cli_codespan("**bold text**", cli=False)},'
+             f' {cli_codespan("*italic text*", cli=False)},'
+             f' {cli_codespan("``inline code``")} and'
+             f' {cli_codespan("[link](target)")}.',
+    )
+    add_wrapwidth_argument(parser, markup='po')
+    parser.add_argument(
+        '-m', '--merge-po-files', '--merge-pofiles',
+        dest='mark_not_found_as_obsolete',
+        action='store_false',
+        help='Messages not found which are already stored in the PO file'
+             f' passed as {cli_codespan("--po-filepath")} argument will not be'
+             ' marked as obsolete.',
+    )
+    parser.add_argument(
+        '-r', '--remove-not-found',
+        dest='preserve_not_found',
+        action='store_false',
+        help='Messages not found which are already stored in the PO file'
+             f' passed as {cli_codespan("--po-filepath")} parameter will be'
+             ' removed. Only has effect used in combination with'
+             f' {cli_codespan("--merge-pofiles")}. If you pass this option,'
+             f' {cli_codespan("--merge-po-files")} will be ignored.',
+    )
+    add_nolocation_option(parser)
+    add_extensions_argument(parser)
+    add_encoding_arguments(
+        parser,
+        po_encoding_help='Resulting PO file encoding.',
+    )
+    parser.add_argument(
+        '-a', '--xheader', dest='xheader', action='store_true',
+        help='Include in the resulting PO file the mdpo specification'
+             ' X-Header "X-Generation", whose value is "mdpo v<version>".',
+    )
+    add_include_codeblocks_option(parser)
+    parser.add_argument(
+        '--ignore-msgids', dest='ignore_msgids', default=None,
+        help='Path to a plain text file where all msgids to ignore from being'
+             ' extracted are located, separated by newlines. Lines prefixed'
+             " with 'glob:' or 're:' ignore the msgids matching a glob or a"
+             " regular expression, and the prefix 'exact:' can be used to"
+             ' ignore msgids that start with these prefixes.',
+    )
+    parser.add_argument(
+        '--max-entries-in-memory', dest='max_entries_in_memory', default=None,
+        type=int, metavar='N',
+        help='Maximum number of entries held in memory extracting. If'
+             ' defined, entries are sorted in runs spilled to temporary files'
+             ' that are merged writing the PO file, which bounds the memory'
+             ' used extracting big sets of files. Requires'
+             f' {cli_codespan("-s/--save")} and is not compatible with'
+             f' {cli_codespan("--mo-filepath")}.',
+    )
+
+    # patch for sphinx-argparse-cli compatibility (use Unicode quotation marks)
+    example_codespan = (
+        f'-d {OPEN_QUOTE_CHAR}Content-Type: text/plain;'
+        f' charset=utf-8{CLOSE_QUOTE_CHAR}'
+        f' -d {OPEN_QUOTE_CHAR}Language: es{CLOSE_QUOTE_CHAR}'
+    )
+    metadata_help_example = (
+        ' For example, to define UTF-8 encoding and Spanish language use'
+        f' {cli_codespan(example_codespan)}.'
+    )
+    parser.add_argument(
+        '-d', '--metadata', dest='metadata', default=[], action='append',
+        metavar='Key:Value',
+        help='Custom metadata key-value pairs to include in the produced'
+             ' PO file. This argument can be passed multiple times.'
+             ' If the file contains previous metadata fields, these will'
+             ' be updated preserving the values of the already defined.'
+             f'{metadata_help_example}',
+    )
+
+    add_command_alias_argument(parser)
+    add_event_argument(parser)
+    add_debug_option(parser)
+    add_check_option(parser)
+    add_no_obsolete_option(parser)
+    add_no_fuzzy_option(parser)
+    add_no_empty_msgstr_option(parser)
+    add_profile_option(parser)
+    return parser
+
+
+def parse_options(args):
+    parser = build_parser()
+    if '-h' in args or '--help' in args:
+        parser.print_help()
+        sys.exit(1)
+    opts, _ = parser.parse_known_args(args)
+
+    files_or_content = ''
+    if not sys.stdin.isatty():
+        files_or_content += sys.stdin.read().strip('\n')
+    if isinstance(opts.files_or_content, list) and opts.files_or_content:
+        if len(opts.files_or_content) == 1:
+            files_or_content += opts.files_or_content[0]
+        elif opts.input_kind == 'content':
+            files_or_content += '\n'.join(opts.files_or_content)
+        else:
+            files_or_content = opts.files_or_content
+    if not files_or_content:
+        sys.stderr.write('Files or content to extract not specified\n')
+        sys.exit(1)
+    opts.files_or_content = files_or_content
+
+    if opts.extensions is None:
+        opts.extensions = DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS
+
+    if opts.ignore_msgids is not None:
+        from mdpo.po import MsgidMatcher
+
+        with open(opts.ignore_msgids, encoding=opts.po_encoding) as f:
+            try:
+                opts.ignore_msgids = MsgidMatcher(f.read().splitlines())
+            except ValueError as exc:
+                sys.stderr.write(f'{exc}\n')
+                sys.exit(1)
+    else:
+        opts.ignore_msgids = []
+
+    opts.command_aliases = parse_command_aliases_cli_arguments(
+        opts.command_aliases,
+    )
+    opts.debug = parse_debug_options(opts)
+    opts.events = parse_event_argument(opts.events)
+    opts.metadata = parse_metadata_cli_arguments(
+        opts.metadata,
+    )
+
+    return opts
+
+
+def run(args=frozenset()):
+    # implementations are imported here to not load the parsing stack
+    # when only the help or the version are shown
+    from mdpo.md2po import Md2Po
+    from mdpo.po import (
+        check_empty_msgstrs_in_filepaths,
+        check_fuzzy_entries_in_filepaths,
+        check_obsolete_entries_in_filepaths,
+        pofile_to_string,
+    )
+
+    with environ(_MDPO_RUNNING='true'):
+        opts = parse_options(args)
+
+        init_kwargs = {
+            'ignore': opts.ignore,
+            'plaintext': opts.plaintext,
+            'mark_not_found_as_obsolete': opts.mark_not_found_as_obsolete,
+            'preserve_not_found': opts.preserve_not_found,
+            'location': opts.location,
+            'extensions': opts.extensions,
+            'xheader': opts.xheader,
+            'include_codeblocks': opts.include_codeblocks,
+            'ignore_msgids': opts.ignore_msgids,
+            'max_entries_in_memory': opts.max_entries_in_memory,
+            'command_aliases': opts.command_aliases,
+            'metadata': opts.metadata,
+            'events': opts.events,
+            'debug': opts.debug,
+            '_check_saved_files_changed': opts.check_saved_files_changed,
+        }
+
+        extract_kwargs = {
+            'po_filepath': opts.po_filepath,
+            'save': opts.save,
+            'mo_filepath': opts.mo_filepath,
+            'po_encoding': opts.po_encoding,
+            'md_encoding': opts.md_encoding,
+            'wrapwidth': opts.wrapwidth,
+        }
+
+        if opts.input_kind is None:
+            init_kwargs['files_or_content'] = opts.files_or_content
+        else:
+            init_kwargs[opts.input_kind] = opts.files_or_content
+
+        with profile_cli_execution(opts.profile) as profile:
+            md2po = Md2Po(profile=profile, **init_kwargs)
+            pofile = md2po.extract(**extract_kwargs)
+        exitcode = 0
+
+        if not opts.quiet:
+            if opts.max_entries_in_memory:
+                # the entries are not in memory, but in the saved file
+                with open(pofile.fpath, encoding=pofile.encoding) as f:
+                    shutil.copyfileobj(f, sys.stdout)
+                sys.stdout.write('\n')
+            else:
+                sys.stdout.write(f'{pofile_to_string(pofile)}\n')
+
+        # pre-commit mode
+        if opts.check_saved_files_changed and md2po._saved_files_changed:
+            exitcode = 2
+
+        if opts.no_obsolete:
+            locations = list(check_obsolete_entries_in_filepaths(
+                (opts.po_filepath,),
+            ))
+            if locations:
+                if len(locations) > 2:  # noqa PLR2004
+                    sys.stderr.write(
+                        f'Found {len(locations)} obsolete entries:\n',
+                    )
+                    for location in locations:
+                        sys.stderr.write(f'{location}\n')
+                else:
+                    for location in locations:
+                        sys.stderr.write(
+                            f'Found obsolete entry at {location}\n')
+                exitcode = 3
+
+        if opts.no_fuzzy:
+            locations = list(check_fuzzy_entries_in_filepaths(
+                (opts.po_filepath,),
+            ))
+            if locations:
+                if len(locations) > 2:  # noqa PLR2004
+                    sys.stderr.write(
+                        f'Found {len(locations)} fuzzy entries:\n',
+                    )
+                    for location in locations:
+                        sys.stderr.write(f'{location}\n')
+                else:
+                    for location in locations:
+                        sys.stderr.write(
+                            f'Found fuzzy entry at {location}\n',
+                        )
+                exitcode = 4
+
+        if opts.no_empty_msgstr:
+            locations = list(check_empty_msgstrs_in_filepaths(
+                (opts.po_filepath,),
+            ))
+            if locations:
+                if len(locations) > 2:  # noqa PLR2004
+                    sys.stderr.write(
+                        f'Found {len(locations)} empty msgstrs:\n',
+                    )
+                    for location in locations:
+                        sys.stderr.write(f'{location}\n')
+                else:
+                    for location in locations:
+                        sys.stderr.write(
+                            f'Found empty msgstr at {location}\n',
+                        )
+                exitcode = 5
+
+    return (pofile, exitcode)
+
+
+def main():  # pragma: no cover
+    exitcode = forward_to_server('md2po', sys.argv[1:])
+    if exitcode is None:
+        exitcode = run(args=sys.argv[1:])[1]
+    raise SystemExit(exitcode)
+
+
+if __name__ == '__main__':
+    main()
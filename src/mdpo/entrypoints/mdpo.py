@@ -0,0 +1,64 @@
+"""mdpo command line interface.
+
+See :ref:`mdpo CLI<cli:mdpo>`.
+"""
+
+import argparse
+import sys
+
+from mdpo.cli import add_common_cli_first_arguments
+
+
+DESCRIPTION = (
+    'mdpo utilities. Use the subcommand serve to start a server which'
+    ' executes md2po, po2md, md2po2md and mdpo2html keeping imports and PO'
+    ' files in memory. Command line interfaces forward their executions to'
+    ' the server when the environment variable MDPO_SERVER_SOCKET is defined.'
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=DESCRIPTION, add_help=False)
+    add_common_cli_first_arguments(parser)
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.required = True
+
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Start a server listening on a Unix socket.',
+    )
+    serve_parser.add_argument(
+        '--socket', dest='socket_path', default=None, metavar='PATH',
+        help='Path to the socket. If not defined, the value of the'
+             ' environment variable MDPO_SERVER_SOCKET or a user specific'
+             ' path in the temporary directory is used.',
+    )
+    return parser
+
+
+def parse_options(args):
+    parser = build_parser()
+    if '-h' in args or '--help' in args:
+        parser.print_help()
+        sys.exit(1)
+    return parser.parse_args(args)
+
+
+def run(args=frozenset()):
+    from mdpo.server import serve
+
+    opts = parse_options(args)
+    try:
+        serve(opts.socket_path)
+    except OSError as exc:
+        sys.stderr.write(f'{exc}\n')
+        return 1
+    return 0
+
+
+def main():
+    raise SystemExit(run(args=sys.argv[1:]))  # pragma: no cover
+
+
+if __name__ == '__main__':
+    main()
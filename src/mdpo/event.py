@@ -3,6 +3,7 @@
 import importlib
 import os
 import sys
+import time
 
 
 def raise_skip_event(events, event_name, *event_args):
@@ -31,27 +32,185 @@ def raise_skip_event(events, event_name, *event_args):
     return skip
 
 
+#: tuple: Levels of debugging events, from less to more verbose. ``msgid``
+#: includes messages, commands and link references, ``block`` also entering
+#: and leaving blocks and ``all`` also entering and leaving spans and texts.
+DEBUG_LEVELS = ('msgid', 'block', 'all')
+
+_DEBUG_EVENTS_LEVELS = {
+    'msgid': 0,
+    'command': 0,
+    'link_reference': 0,
+    'enter_block': 1,
+    'leave_block': 1,
+    'enter_span': 2,
+    'leave_span': 2,
+    'text': 2,
+}
+
+
+class DebugTracer:
+    """Buffered writer of debugging events.
+
+    Messages, commands and link references are always written when their
+    level is enabled, but blocks, spans and texts, which are the vast majority
+    of events, can be sampled to trace production-sized runs.
+
+    Args:
+        filepath (str): File to which the events will be written. If not
+            defined, they are written to STDOUT.
+        output_format (str): Either ``text`` for human readable lines or
+            ``jsonl`` to write a JSON object per line.
+        level (str): Verbosity level, one of :py:data:`DEBUG_LEVELS`.
+        sample_rate (float): Fraction of blocks, spans and texts events
+            written, between ``0`` and ``1``.
+        buffer_size (int): Number of events buffered before writing them.
+    """
+
+    __slots__ = (
+        'filepath',
+        'output_format',
+        'sample_rate',
+        'buffer_size',
+        '_max_level',
+        '_buffer',
+        '_sample_accumulator',
+        '_second',
+        '_second_formatted',
+    )
+
+    def __init__(
+        self,
+        filepath=None,
+        output_format='text',
+        level='all',
+        sample_rate=1.0,
+        buffer_size=1024,
+    ):
+        if output_format not in ('text', 'jsonl'):
+            raise ValueError(
+                f"Invalid debug output format '{output_format}'. It must be"
+                " 'text' or 'jsonl'.",
+            )
+        if level not in DEBUG_LEVELS:
+            raise ValueError(
+                f"Invalid debug level '{level}'. It must be one of"
+                f" {', '.join(DEBUG_LEVELS)}.",
+            )
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(
+                f"Invalid debug sample rate '{sample_rate}'. It must be a"
+                ' number between 0 and 1.',
+            )
+
+        self.filepath = filepath
+        self.output_format = output_format
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+
+        self._max_level = DEBUG_LEVELS.index(level)
+        self._buffer = []
+        self._sample_accumulator = 0
+        self._second = None
+        self._second_formatted = None
+
+        if filepath:
+            # truncate the file, events are appended when flushing
+            with open(filepath, 'w', encoding='utf-8'):
+                pass
+
+    def accepts(self, event):
+        """Check if an event must be written.
+
+        This must be called before formatting the message of an event, so
+        filtered events are not formatted.
+
+        Args:
+            event (str): Event name.
+
+        Returns:
+            bool: If the event must be written.
+        """
+        level = _DEBUG_EVENTS_LEVELS.get(event, 0)
+        if level > self._max_level:
+            return False
+        if level == 0 or self.sample_rate == 1:
+            return True
+        self._sample_accumulator += self.sample_rate
+        if self._sample_accumulator >= 1:
+            self._sample_accumulator -= 1
+            return True
+        return False
+
+    def _format_date(self, now):
+        second = int(now)
+        if second != self._second:
+            self._second = second
+            self._second_formatted = time.strftime(
+                '%Y-%m-%d %H:%M:%S',
+                time.localtime(second),
+            )
+        return f'{self._second_formatted}.{int((now - second) * 1e6):06d}'
+
+    def write(self, program, event, msg):
+        """Buffer a debugging event.
+
+        Args:
+            program (str): Implementation name.
+            event (str): Event name.
+            msg (str): Event message.
+        """
+        now = time.time()
+        if self.output_format == 'text':
+            date = self._format_date(now)
+            line = f'{program}[DEBUG]::{date}::{event}:: {msg}'
+        else:
+            import json
+
+            line = json.dumps({
+                'program': program,
+                'time': now,
+                'event': event,
+                'msg': msg,
+            })
+        self._buffer.append(line)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered events."""
+        if not self._buffer:
+            return
+        content = '\n'.join(self._buffer) + '\n'
+        self._buffer.clear()
+        if self.filepath:
+            with open(self.filepath, 'a', encoding='utf-8') as f:
+                f.write(content)
+        else:
+            sys.stdout.write(content)
+
+
 def _block_msg(block, details):
     if details:
         return f'{block.name} - {details}'
     return block.name
 
 
-def debug_events(program):
-    """Debugging events for interfaces. Displays in STDOUT all event targets.
+def debug_events(program, tracer=None):
+    """Debugging events for interfaces. Writes all event targets.
 
     Args:
         program (str): Command line interface name, to display it at the
             beginning of the output.
+        tracer (:py:class:`mdpo.event.DebugTracer`): Tracer used to write
+            the events. If not defined, all events are written to STDOUT.
 
     Returns:
         dict: Event target printing functions.
     """
-    def debug(event, msg):
-        import datetime
-
-        date = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-        sys.stdout.write(f'{program}[DEBUG]::{date}::{event}:: {msg}\n')
+    if tracer is None:
+        tracer = DebugTracer()
+    accepts, write = tracer.accepts, tracer.write
 
     def print_msgid(
             self,  # noqa: ARG001
@@ -61,6 +220,8 @@ def debug_events(program):
             tcomment,
             flags,
     ):
+        if not accepts('msgid'):
+            return
         msg = f"msgid='{msgid}'"
         if msgstr:
             msg += f" - msgstr='{msgstr}'"
@@ -70,7 +231,7 @@ def debug_events(program):
             msg += f" - tcomment='{tcomment}'"
         if flags:
             msg += f" - flags='{flags}'"
-        debug('msgid', msg)
+        write(program, 'msgid', msg)
 
     def print_command(
             self,  # noqa: ARG001
@@ -78,35 +239,44 @@ def debug_events(program):
             comment,
             original_command,
     ):
+        if not accepts('command'):
+            return
         msg = mdpo_command
         if comment:
             msg += f' - {comment}'
         if original_command and original_command != mdpo_command:
             msg += f" (original command: '{original_command}')"
-        debug('command', msg)
+        write(program, 'command', msg)
 
     def print_enter_block(self, block, details):  # noqa: ARG001
-        debug('enter_block', _block_msg(block, details))
+        if accepts('enter_block'):
+            write(program, 'enter_block', _block_msg(block, details))
 
     def print_leave_block(self, block, details):  # noqa: ARG001
-        debug('leave_block', _block_msg(block, details))
+        if accepts('leave_block'):
+            write(program, 'leave_block', _block_msg(block, details))
 
     def print_enter_span(self, span, details):  # noqa: ARG001
-        debug('enter_span', _block_msg(span, details))
+        if accepts('enter_span'):
+            write(program, 'enter_span', _block_msg(span, details))
 
     def print_leave_span(self, span, details):  # noqa: ARG001
-        debug('leave_span', _block_msg(span, details))
+        if accepts('leave_span'):
+            write(program, 'leave_span', _block_msg(span, details))
 
     def print_text(self, block, text):  # noqa: ARG001
-        debug('text', text)
+        if accepts('text'):
+            write(program, 'text', text)
 
     def print_link_reference(self, target, href, title):  # noqa: ARG001
+        if not accepts('link_reference'):
+            return
         msg = f"target='{target}'"
         if href:
             msg += f" - href='{href}'"
         if title:
             msg += f" - title='{title}'"
-        debug('link_reference', msg)
+        write(program, 'link_reference', msg)
 
     return {
         'msgid': print_msgid,
@@ -120,18 +290,30 @@ def debug_events(program):
     }
 
 
-def add_debug_events(implementation_name, events):
+def add_debug_events(implementation_name, events, tracer=None):
     """Add debugging events to an events dict.
 
     Args:
         implementation_name (str): Implementation name, shown when
             printing debugging events.
         events (dict): Events dictionary.
+        tracer (:py:class:`mdpo.event.DebugTracer`): Tracer used to write
+            the events. If not defined, all events are written to STDOUT.
+
+    Returns:
+        :py:class:`mdpo.event.DebugTracer`: Tracer used, whose buffered
+        events must be flushed when the implementation finishes.
     """
-    for event_name, function in debug_events(implementation_name).items():
+    if tracer is None:
+        tracer = DebugTracer()
+    for event_name, function in debug_events(
+        implementation_name,
+        tracer=tracer,
+    ).items():
         if event_name not in events:
             events[event_name] = []
         events[event_name].append(function)
+    return tracer
 
 
 def parse_events_kwarg(events_kwarg):
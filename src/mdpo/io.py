@@ -2,6 +2,7 @@
 
 import glob
 import os
+import re
 from contextlib import contextmanager
 
 
@@ -57,6 +58,340 @@ def filter_paths(filepaths, ignore_paths=frozenset()):
     return response
 
 
+def _translate_path_pattern(pattern):
+    """Convert a glob-like pattern into a regex matching ``/`` separated paths.
+
+    ``*`` and ``?`` do not match ``/``, a ``**`` segment matches any number
+    of directories and backslashes escape the next character.
+    """
+    segments = pattern.split('/')
+    regex = ''
+    for i, segment in enumerate(segments, 1):
+        last = i == len(segments)
+        if segment == '**':
+            regex += '.*' if last else '(?:.*/)?'
+            continue
+        j, n = 0, len(segment)
+        while j < n:
+            char = segment[j]
+            j += 1
+            if char == '*':
+                regex += '[^/]*'
+            elif char == '?':
+                regex += '[^/]'
+            elif char == '\\' and j < n:
+                regex += re.escape(segment[j])
+                j += 1
+            elif char == '[':
+                start = j + 1 if segment[j:j + 1] == '!' else j
+                if segment[start:start + 1] == ']':
+                    start += 1
+                end = segment.find(']', start)
+                if end == -1:
+                    regex += '\\['
+                    continue
+                klass = segment[j:end].replace('\\', '\\\\')
+                if klass.startswith('!'):
+                    klass = '^' + klass[1:]
+                elif klass.startswith('^'):
+                    klass = '\\' + klass
+                regex += f'[{klass}]'
+                j = end + 1
+            else:
+                regex += re.escape(char)
+        if not last:
+            regex += '/'
+    return re.compile(regex, re.DOTALL)
+
+
+class IgnoreRules:
+    """Gitignore-style rules excluding the files discovered by globs.
+
+    Each rule is a pattern with the next syntax:
+
+    - Patterns without a slash match the name of a file or directory, so
+      they exclude files with that name and any directory with that name
+      and all its content.
+    - Patterns with a slash match the full path, as defined in the globs
+      that are expanded. A trailing slash restricts the pattern to
+      directories.
+    - ``*`` and ``?`` match any characters except a slash, ``[...]`` a
+      character class and ``**`` segments any number of directories.
+    - A ``!`` prefix negates the pattern, so paths excluded by previous
+      rules are included again. Like in Git, a file can't be included again
+      if one of its directories is excluded.
+
+    Args:
+        rules (list): Rules in order of precedence, being the last that
+            matches a path the one that decides if it is excluded.
+    """
+
+    __slots__ = ('rules', '_compiled', '_has_path_rules')
+
+    def __init__(self, rules=()):
+        #: tuple: Rules as defined.
+        self.rules = tuple(rules)
+        self._compiled = []
+        self._has_path_rules = False
+
+        for rule in self.rules:
+            pattern, negate = rule, False
+            if pattern.startswith('!'):
+                pattern, negate = pattern[1:], True
+            elif pattern.startswith('\\!'):
+                pattern = pattern[1:]
+            pattern = pattern.replace(os.sep, '/')
+            dir_only = pattern.endswith('/') and pattern != '/'
+            pattern = pattern.rstrip('/') if dir_only else pattern
+            if not pattern:
+                continue
+            match_path = '/' in pattern
+            if match_path:
+                pattern = _normpath(pattern)
+                self._has_path_rules = True
+            self._compiled.append((
+                _translate_path_pattern(pattern).fullmatch,
+                negate,
+                dir_only,
+                match_path,
+            ))
+        self._compiled.reverse()
+
+    def ignored(self, path, is_dir=False, match_names=True):
+        """Check if a path is excluded by the rules.
+
+        Args:
+            path (str): Path to check.
+            is_dir (bool): If the path is a directory.
+            match_names (bool): Check rules without slashes, which match
+                names. If ``False``, only rules that match full paths are
+                checked.
+
+        Returns:
+            bool: If the path is excluded.
+        """
+        name = os.path.basename(path)
+        match_names = match_names and name not in ('', os.curdir, os.pardir)
+        normpath = _normpath(path) if self._has_path_rules else None
+        for match, negate, dir_only, match_path in self._compiled:
+            if dir_only and not is_dir:
+                continue
+            if match_path:
+                if match(normpath):
+                    return not negate
+            elif match_names and match(name):
+                return not negate
+        return False
+
+    def __bool__(self):
+        """Return if there are rules defined."""
+        return bool(self._compiled)
+
+
+def _normpath(path):
+    return os.path.normpath(path).replace(os.sep, '/')
+
+
+_MAGIC_CHARS_RE = re.compile('[*?[]')
+
+_FILES_CACHE = None
+
+
+def enable_files_cache(enable=True):
+    """Reuse the files discovered by :py:func:`iter_files` between calls.
+
+    When enabled, the directories visited expanding each glob are recorded
+    along with their modification times, and the files are only discovered
+    again if one of those directories has changed. This is useful for
+    long-running processes like the :py:mod:`mdpo.server`.
+
+    Args:
+        enable (bool): Enable or disable the cache. Disabling it frees all
+            the cached listings.
+    """
+    global _FILES_CACHE  # noqa: PLW0603
+    _FILES_CACHE = {} if enable else None
+
+
+def _version(dirpath):
+    # modification time of a directory, or ``None`` if it doesn't exist
+    try:
+        return os.stat(dirpath).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scandir(dirpath, versions):
+    dirpath = dirpath or os.curdir
+    if versions is not None:
+        versions[dirpath] = _version(dirpath)
+    try:
+        with os.scandir(dirpath) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _is_dir(entry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _walk_files(dirpath, parts, ignore, versions, entries=None):
+    part, rest = parts[0], parts[1:]
+
+    if part == '**':
+        entries = _scandir(dirpath, versions)
+        if rest:
+            yield from _walk_files(dirpath, rest, ignore, versions, entries)
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            path = os.path.join(dirpath, entry.name)
+            if _is_dir(entry):
+                if not (ignore and ignore.ignored(path, is_dir=True)):
+                    yield from _walk_files(path, parts, ignore, versions)
+            elif not rest and not (ignore and ignore.ignored(path)):
+                yield path
+        return
+
+    if not _MAGIC_CHARS_RE.search(part):
+        path = os.path.join(dirpath, part)
+        if versions is not None:
+            # the existence of the path depends on its directory
+            versions[dirpath or os.curdir] = _version(dirpath or os.curdir)
+        if rest:
+            if os.path.isdir(path) and not (
+                ignore and ignore.ignored(path, is_dir=True)
+            ):
+                yield from _walk_files(path, rest, ignore, versions)
+        elif os.path.isfile(path) and not (ignore and ignore.ignored(path)):
+            yield path
+        return
+
+    match = _translate_path_pattern(os.path.normcase(part)).fullmatch
+    include_hidden = part.startswith('.')
+    if entries is None:
+        entries = _scandir(dirpath, versions)
+    for entry in entries:
+        name = entry.name
+        if name.startswith('.') and not include_hidden:
+            continue
+        if not match(os.path.normcase(name)):
+            continue
+        path = os.path.join(dirpath, name)
+        if _is_dir(entry):
+            if rest and not (ignore and ignore.ignored(path, is_dir=True)):
+                yield from _walk_files(path, rest, ignore, versions)
+        elif not rest and not (ignore and ignore.ignored(path)):
+            yield path
+
+
+def _split_glob(pattern):
+    """Split a glob in the directory where its expansion starts and the rest.
+
+    Returns:
+        tuple: Literal directory path and list of the remaining parts.
+    """
+    seps = os.sep + (os.altsep or '')
+    drive, path = os.path.splitdrive(pattern)
+    root = drive + path[:len(path) - len(path.lstrip(seps))]
+    parts = [part for part in re.split(f'[{re.escape(seps)}]', path) if part]
+    literal_parts = len(parts) - 1
+    for i, part in enumerate(parts):
+        if _MAGIC_CHARS_RE.search(part):
+            literal_parts = i
+            break
+    return os.path.join(root, *parts[:literal_parts]), parts[literal_parts:]
+
+
+def _discover_files(pattern, ignore, versions):
+    root, parts = _split_glob(pattern)
+    if not parts:
+        return []
+    if root and ignore and (
+        ignore.ignored(root, is_dir=True) or any(
+            ignore.ignored(parent, is_dir=True, match_names=False)
+            for parent in _parent_dirs(root)
+        )
+    ):
+        return []
+    return sorted(_walk_files(root, parts, ignore, versions))
+
+
+def _parent_dirs(path):
+    parent = os.path.dirname(path)
+    while parent and parent != path:
+        yield parent
+        path, parent = parent, os.path.dirname(parent)
+
+
+def _cached_discover_files(pattern, ignore):
+    if _FILES_CACHE is None:
+        return _discover_files(pattern, ignore, None)
+
+    key = (os.getcwd(), pattern, ignore.rules)
+    try:
+        versions, filepaths = _FILES_CACHE[key]
+    except KeyError:
+        pass
+    else:
+        if all(
+            _version(dirpath) == version
+            for dirpath, version in versions.items()
+        ):
+            return filepaths
+    versions = {}
+    filepaths = _discover_files(pattern, ignore, versions)
+    _FILES_CACHE[key] = (versions, filepaths)
+    return filepaths
+
+
+def iter_files(globs, ignore=()):
+    """Discover the files matched by a set of globs.
+
+    Directories are walked with :py:func:`os.scandir`, and those excluded
+    by ``ignore`` are not entered. Globs use the syntax of
+    :py:mod:`glob`, being ``**`` segments recursive, and like it, names
+    starting with a dot are only matched by patterns that start with a dot.
+    Only files are discovered, not directories.
+
+    Args:
+        globs (str, list): Glob or globs to expand.
+        ignore (list, :py:class:`mdpo.io.IgnoreRules`): Gitignore-style
+            rules excluding files and directories. The name of the
+            directory where the expansion of a glob starts is also checked,
+            so ``['docs']`` excludes all the files matched by
+            ``docs/*.md``. See :py:class:`mdpo.io.IgnoreRules`.
+
+    Yields:
+        str: Paths of the files, sorted for each glob and without
+        duplicates.
+    """
+    if isinstance(globs, str):
+        globs = [globs]
+    if not isinstance(ignore, IgnoreRules):
+        ignore = IgnoreRules(ignore)
+
+    seen = set()
+    for pattern in globs:
+        for filepath in _cached_discover_files(pattern, ignore):
+            if filepath not in seen:
+                seen.add(filepath)
+                yield filepath
+
+
+#: int: Maximum length of a string considered as a path or a glob, longer
+#: strings are always considered content.
+MAX_PATH_LENGTH = 4096
+
+
+def _is_content(value):
+    return '\n' in value or len(value) > MAX_PATH_LENGTH
+
+
 def to_file_content_if_is_file(value, encoding='utf-8'):
     """Check if the value passed is a file path or string content.
 
@@ -70,20 +405,27 @@ def to_file_content_if_is_file(value, encoding='utf-8'):
     Returns:
         str: File content if ``value`` is an existing file or ``value`` as is.
     """
-    if os.path.isfile(value):
+    if not _is_content(value) and os.path.isfile(value):
         with open(value, encoding=encoding) as f:
             value = f.read()
     return value
 
 
-def to_files_or_content(value):
+def to_files_or_content(value, kind=None):
     """File path/glob/content disambiguator.
 
     Check if the value passed is a glob, a set of files in a list or is string
     content.
 
+    Strings with newlines or longer than :py:data:`MAX_PATH_LENGTH` are
+    considered content without accessing the file system, so only short
+    strings are expanded as globs to check if they match some file.
+
     Args:
         value (str): Value to check.
+        kind (str): Explicit kind of the value, skipping the checks. Can be
+            ``'content'`` for string content or ``'paths'`` for a glob, a
+            path or a list of them.
 
     Returns:
         tuple: Two values being the first a boolean that indicates if ``value``
@@ -91,6 +433,17 @@ def to_files_or_content(value):
         second value is the content, which could be an iterator (if a glob or
         a list of files is passed or a string).
     """
+    if kind == 'content':
+        return (False, value)
+    if kind == 'paths':
+        return (True, [value] if isinstance(value, str) else value)
+    if kind is not None:
+        raise ValueError(
+            f"Invalid kind '{kind}', must be 'content' or 'paths'",
+        )
+
+    if isinstance(value, str) and _is_content(value):
+        return (False, value)
     try:
         parsed = glob.glob(value)
     except TypeError:
@@ -132,6 +485,150 @@ def save_file_checking_file_changed(filepath, content, encoding='utf-8'):
     return changed
 
 
+class ExternalSorter:
+    """Sort more items than fit in memory, spilling sorted runs to disk.
+
+    Items are kept in memory until ``max_items`` are added, then they are
+    sorted and pickled to a temporary file. Iterating over the sorter merges
+    all the runs lazily, so only one item of each run is held in memory.
+
+    Items are compared as they are, so they must be comparable and, if they
+    are tuples, their leading values should be unique to not compare the
+    trailing ones.
+
+    Args:
+        max_items (int): Maximum number of items held in memory.
+        directory (str): Directory where the temporary files are created.
+            If not defined, the default temporary directory is used.
+    """
+
+    __slots__ = ('max_items', 'directory', '_items', '_runs', '_size')
+
+    #: int: Maximum number of runs merged at once. When reached, the runs
+    #: are merged in a single one to not exhaust file descriptors.
+    MAX_RUNS = 64
+
+    #: int: Number of items pickled at once writing the runs.
+    BATCH_SIZE = 256
+
+    def __init__(self, max_items, directory=None):
+        if max_items < 1:
+            raise ValueError('The maximum number of items must be positive')
+
+        #: int: Maximum number of items held in memory.
+        self.max_items = max_items
+
+        #: str: Directory where the temporary files are created.
+        self.directory = directory
+
+        self._items = []
+        self._runs = []
+        self._size = 0
+
+    def add(self, item):
+        """Add an item, spilling the items in memory if the limit is reached.
+
+        Args:
+            item: Item to add.
+        """
+        self._items.append(item)
+        self._size += 1
+        if len(self._items) >= self.max_items:
+            self._items.sort()
+            self._write_run(self._items)
+            self._items = []
+
+    def _write_run(self, items):
+        import pickle
+        import tempfile
+
+        if len(self._runs) >= self.MAX_RUNS:
+            runs, self._runs = self._runs, []
+            self._write_run(self._merge(runs, []))
+
+        # closed when the run is consumed or the sorter is closed
+        f = tempfile.TemporaryFile(dir=self.directory)  # noqa: SIM115
+        # pickled in batches, which is faster than one by one
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == self.BATCH_SIZE:
+                pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+                batch = []
+        if batch:
+            pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+        f.seek(0)
+        self._runs.append(f)
+
+    @staticmethod
+    def _iter_run(f):
+        import pickle
+
+        try:
+            while True:
+                yield from pickle.load(f)
+        except EOFError:
+            pass
+        finally:
+            f.close()
+
+    def _merge(self, runs, items):
+        import heapq
+
+        iterators = [self._iter_run(f) for f in runs]
+        if items:
+            iterators.append(iter(items))
+        return heapq.merge(*iterators)
+
+    def __iter__(self):
+        """Iterate over the sorted items, consuming the sorter."""
+        self._items.sort()
+        runs, items = self._runs, self._items
+        self._runs, self._items, self._size = [], [], 0
+        return self._merge(runs, items)
+
+    def __len__(self):
+        """Return the number of items added."""
+        return self._size
+
+    def close(self):
+        """Discard all the items, removing the temporary files."""
+        for f in self._runs:
+            f.close()
+        self._runs, self._items, self._size = [], [], 0
+
+
 def flatten(xss):
     """Flatten a iterable of iterables."""
     return (x for xs in xss for x in xs)
+
+
+async def run_in_executor(func, *args, executor=None, semaphore=None, **kwargs):
+    """Execute a blocking function without blocking the asyncio event loop.
+
+    Args:
+        func (function): Function to execute.
+        *args: Positional arguments passed to the function.
+        executor (:py:class:`concurrent.futures.Executor`): Executor in
+            which the function is executed. If not defined, the default
+            executor of the event loop is used.
+        semaphore (:py:class:`asyncio.Semaphore`): Semaphore acquired while
+            the function is executed, to bound the number of concurrent
+            executions.
+        **kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        Value returned by the function. If the task is cancelled while
+        waiting for the semaphore or for a free worker of the executor, the
+        function is not executed, but once started it runs until completion
+        in the executor and its result is discarded.
+    """
+    import asyncio
+    import functools
+
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    if semaphore is None:
+        return await loop.run_in_executor(executor, call)
+    async with semaphore:
+        return await loop.run_in_executor(executor, call)
@@ -1,14 +1,35 @@
 """Markdown related utilities for mdpo."""
 
+import functools
+import re
+
 
 LINK_REFERENCE_REGEX = (
     r'^\[([^\]]+)\]:\s+<?([^\s>]+)>?\s*["\'\(]?([^"\'\)]+)?'
 )
 
+# characters considered line boundaries by ``str.splitlines``
+_LINE_BOUNDARIES = r'\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029'
+
+_LINK_REFERENCE_RE = re.compile(LINK_REFERENCE_REGEX)
+_LINK_REFERENCED_LINK_RE = re.compile(r'\[([^\]]+)\]\[([^\]\s]+)\]')
+
+# lines whose first non whitespace character is ``[``, capturing the line
+# content from that character
+_LINK_REFERENCE_LINE_RE = re.compile(
+    rf'(?:^|(?<=[{_LINE_BOUNDARIES}]))'
+    rf'[^\S{_LINE_BOUNDARIES}]*(\[[^{_LINE_BOUNDARIES}]*)',
+)
+
 
 def parse_link_references(content):
     """Parses link references found in a Markdown content.
 
+    Only lines starting with a ``[`` character are candidates to define
+    a link reference, so these are located in a single scan of the content
+    before matching them. The results for the latest parsed contents are
+    cached, so md2po and po2md don't scan again the same Markdown content.
+
     Args:
         content (str): Markdown content to be parsed.
 
@@ -16,18 +37,40 @@ def parse_link_references(content):
         list: Tuples with 3 values, target, href and title for each link
         reference.
     """
-    import re
+    return list(_parse_link_references(content))
 
-    link_reference_re = re.compile(LINK_REFERENCE_REGEX)
+
+@functools.lru_cache(maxsize=8)
+def _parse_link_references(content):
+    if '[' not in content:
+        return ()
 
     response = []
-    for line in content.splitlines():
-        linestrip = line.strip()
-        if linestrip and linestrip.startswith('['):
-            match = re.search(link_reference_re, linestrip)
-            if match:
-                response.append(match.groups())
-    return response
+    for line_match in _LINK_REFERENCE_LINE_RE.finditer(content):
+        match = _LINK_REFERENCE_RE.match(line_match.group(1).rstrip())
+        if match:
+            response.append(match.groups())
+    return tuple(response)
+
+
+def find_link_reference_target(link_references, href, title=None):
+    """Find the target of the link reference that defines a link.
+
+    Args:
+        link_references (list): Link references as returned by
+            :py:func:`mdpo.md.parse_link_references`.
+        href (str): Link destination.
+        title (str): Link title. If not defined, only the destination
+            is compared.
+
+    Returns:
+        str: Target of the first matching link reference or ``None``
+        if the link is not referenced.
+    """
+    for target, ref_href, ref_title in link_references:
+        if ref_href == href and (title is None or ref_title == title):
+            return target
+    return None
 
 
 def solve_link_reference_targets(translations):
@@ -43,11 +86,6 @@ def solve_link_reference_targets(translations):
     Returns:
         dict: New created messages with solved link reference targets.
     """
-    import re
-
-    link_refereced_link_re = re.compile(r'\[([^\]]+)\]\[([^\]\s]+)\]')
-    link_reference_re = re.compile(LINK_REFERENCE_REGEX)
-
     solutions = {}
 
     # dictionary with defined link references and their targets
@@ -60,17 +98,17 @@ def solve_link_reference_targets(translations):
     # discover link reference definitions
     for msgid, msgstr in translations.items():
         if msgid.startswith('['):  # filter for performance improvement
-            msgid_match = re.search(link_reference_re, msgid.lstrip(' '))
+            msgid_match = _LINK_REFERENCE_RE.search(msgid.lstrip(' '))
             if msgid_match:
-                msgstr_match = re.search(link_reference_re, msgstr.lstrip(' '))
+                msgstr_match = _LINK_REFERENCE_RE.search(msgstr.lstrip(' '))
                 if msgstr_match:
                     link_references_text_targets.append((
                         msgid_match.groups(),
                         msgstr_match.groups(),
                     ))
-        msgid_matchs = re.findall(link_refereced_link_re, msgid)
+        msgid_matchs = _LINK_REFERENCED_LINK_RE.findall(msgid)
         if msgid_matchs:
-            msgstr_matchs = re.findall(link_refereced_link_re, msgstr)
+            msgstr_matchs = _LINK_REFERENCED_LINK_RE.findall(msgstr)
             if msgstr_matchs:
                 msgid_msgstrs_with_links.append((
                     msgid, msgstr, msgid_matchs, msgstr_matchs,
@@ -1,37 +1,88 @@
 """Markdown to PO files extractor according to mdpo specification."""
 
 import contextlib
-import glob
+import filecmp
 import os
+import shutil
+import tempfile
 
 import md4c
 import polib
 
 from mdpo.command import (
     normalize_mdpo_command_aliases,
-    parse_mdpo_html_command,
+    resolve_mdpo_html_command,
+)
+from mdpo.event import (
+    DebugTracer,
+    add_debug_events,
+    parse_events_kwarg,
+    raise_skip_event,
 )
-from mdpo.event import add_debug_events, parse_events_kwarg, raise_skip_event
 from mdpo.io import (
-    filter_paths,
-    flatten,
+    ExternalSorter,
+    iter_files,
+    run_in_executor,
     save_file_checking_file_changed,
     to_files_or_content,
 )
-from mdpo.md import parse_link_references
+from mdpo.md import find_link_reference_target, parse_link_references
 from mdpo.md4c import (
     DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS,
     READABLE_BLOCK_NAMES,
 )
 from mdpo.po import (
-    find_entry_in_entries,
+    SPILLED_FOUND_ENTRY,
+    SPILLED_POFILE_ENTRY,
+    EntryRecord,
+    MsgidMatcher,
+    index_entries,
     mark_not_found_entries_as_obsoletes,
+    merge_found_entry,
+    merge_spilled_entries,
     po_escaped_string,
+    pofile_to_string,
+    read_pofile,
     remove_not_found_entries,
+    write_pofile,
+    write_pofile_entries,
 )
+from mdpo.profiling import NULL_PROFILE
 from mdpo.text import min_not_max_chars_in_a_row, parse_wrapwidth_argument
 
 
+class ExtractedMessage:
+    """Message extracted from Markdown, as yielded by :py:func:`iter_messages`.
+
+    Args:
+        msgid (str): Message.
+        msgctxt (str): Context of the message, if defined.
+        tcomment (str): Translator comment, if defined.
+        fuzzy (bool): If the message has been marked as fuzzy.
+        occurrence (tuple): File path and place of the block in the file
+            where the message has been found, as they are written in PO
+            files. ``None`` if the location is not included or the message
+            has been extracted from string content.
+    """
+
+    __slots__ = ('msgid', 'msgctxt', 'tcomment', 'fuzzy', 'occurrence')
+
+    def __init__(self, msgid, msgctxt, tcomment, fuzzy, occurrence):
+        self.msgid = msgid
+        self.msgctxt = msgctxt
+        self.tcomment = tcomment
+        self.fuzzy = fuzzy
+        self.occurrence = occurrence
+
+    def __repr__(self):
+        """Represent the message with its values."""
+        return (
+            f'ExtractedMessage(msgid={self.msgid!r}, msgctxt={self.msgctxt!r},'
+            f' tcomment={self.tcomment!r}, fuzzy={self.fuzzy!r},'
+            f' occurrence={self.occurrence!r})'
+        )
+
+
 class Md2Po:
     """Markdown to PO files extractor.
 
@@ -62,9 +113,13 @@ class Md2Po:
         'filepaths',
         'content',
         'pofile',
+        '_pofile_index',
         'po_filepath',
         'msgstr',
         'found_entries',
+        'max_entries_in_memory',
+        '_spilled_entries',
+        '_messages',
         'disabled_entries',
         'ignore_msgids',
         'command_aliases',
@@ -75,6 +130,8 @@ class Md2Po:
         'include_codeblocks',
         'metadata',
         'events',
+        'profile',
+        '_debug_tracer',
 
         'location',
         '_current_top_level_block_number',
@@ -139,19 +196,35 @@ class Md2Po:
         '_uls_deep',
     }
 
-    def __init__(self, files_or_content, **kwargs):
-        is_glob, files_or_content = to_files_or_content(files_or_content)
+    def __init__(self, files_or_content=None, **kwargs):
+        kind = None
+        for kind_ in ('content', 'paths'):
+            if kwargs.get(kind_) is None:
+                continue
+            if files_or_content is not None:
+                raise ValueError(
+                    "Only one of 'files_or_content', 'content' or 'paths'"
+                    ' can be defined',
+                )
+            files_or_content, kind = kwargs[kind_], kind_
+        if files_or_content is None:
+            raise ValueError(
+                "One of 'files_or_content', 'content' or 'paths' must be"
+                ' defined',
+            )
+
+        is_glob, parsed = to_files_or_content(files_or_content, kind=kind)
         if is_glob:
-            self.filepaths = filter_paths(
-                flatten(glob.glob(globpath) for globpath in files_or_content),
-                ignore_paths=kwargs.get('ignore', []),
+            self.filepaths = sorted(
+                iter_files(files_or_content, ignore=kwargs.get('ignore', [])),
             )
         else:
-            self.content = files_or_content
+            self.content = parsed
 
         #: :py:class:`polib.POFile` PO file object representing
         #: the extracted content.
         self.pofile = None
+        self._pofile_index = {}
 
         #: str: PO file path to which the content will be extracted.
         self.po_filepath = None
@@ -160,11 +233,23 @@ class Md2Po:
         #: inside the previous content of the specified PO file.
         self.msgstr = kwargs.get('msgstr', '')
 
-        #: list: Extracted entries.
+        #: list: Extracted entries. Not collected if
+        #: ``max_entries_in_memory`` is defined.
         self.found_entries = []
 
-        #: list: Not extracted entries because the extractor
-        #: has been disabled while processing them.
+        #: int: Maximum number of entries held in memory extracting. If
+        #: defined, the entries of the PO file and the extracted ones are
+        #: sorted in runs spilled to temporary files, which are merged
+        #: writing the PO file, so the memory used by big sets of files is
+        #: bounded. Requires to save the PO file.
+        self.max_entries_in_memory = kwargs.get('max_entries_in_memory')
+        self._spilled_entries = None
+        self._messages = None
+
+        #: list(:py:class:`mdpo.po.EntryRecord`): Not extracted entries
+        #: because the extractor has been disabled while processing them.
+        #: Can be converted to :py:class:`polib.POEntry` objects calling
+        #: their ``to_poentry`` method.
         self.disabled_entries = []
 
         #: list(str): MD4C extensions used to parse the content.
@@ -177,8 +262,18 @@ class Md2Po:
         #: dict: Custom events excuted during the parsing while
         #: extracting content.
         self.events = parse_events_kwarg(kwargs.get('events') or {})
+        self._debug_tracer = None
         if kwargs.get('debug'):
-            add_debug_events('md2po', self.events)
+            debug = kwargs['debug']
+            self._debug_tracer = add_debug_events(
+                'md2po',
+                self.events,
+                tracer=debug if isinstance(debug, DebugTracer) else None,
+            )
+
+        #: :py:class:`mdpo.profiling.Profile`: Timings of the extraction
+        #: phases, only measured if passed as ``profile`` argument.
+        self.profile = kwargs.get('profile') or NULL_PROFILE
 
         #: str: The msgid being currently built for the next
         #: message entry. Keep in mind that, if you are executing
@@ -219,8 +314,11 @@ class Md2Po:
         #: bool: Extract code blocks
         self.include_codeblocks = kwargs.get('include_codeblocks', False)
 
-        #: The msgids to ignore for extraction
-        self.ignore_msgids = kwargs.get('ignore_msgids', [])
+        #: :py:class:`mdpo.po.MsgidMatcher`: The msgids to ignore for
+        #: extraction.
+        self.ignore_msgids = kwargs.get('ignore_msgids') or ()
+        if not isinstance(self.ignore_msgids, MsgidMatcher):
+            self.ignore_msgids = MsgidMatcher(self.ignore_msgids)
 
         self.command_aliases = normalize_mdpo_command_aliases(
             kwargs.get('command_aliases') or {},
@@ -390,25 +488,7 @@ class Md2Po:
         self._current_wikilink_target = None
         self._current_imgspan = {}
 
-    def _save_msgid(
-        self,
-        msgid,
-        msgstr='',
-        tcomment=None,
-        msgctxt=None,
-        fuzzy=False,
-    ):
-        if msgid in self.ignore_msgids:
-            return
-        entry = polib.POEntry(
-            msgid=msgid,
-            msgstr=msgstr,
-            comment=tcomment,
-            msgctxt=msgctxt,
-            flags=[] if not fuzzy else ['fuzzy'],
-        )
-
-        occurrence = None
+    def _current_occurrence(self):
         if self.location and self._current_markdown_filepath:
             # here could happen a KeyError if someone has aborted an ,
             # enter event, in which case we do not have access to the
@@ -425,31 +505,58 @@ class Md2Po:
             #       `_current_top_level_block_type` properties must be handled
             #       accordingly
 
-            occurrence = (
+            return (
                 self._current_markdown_filepath,
                 (
                     f'block {self._current_top_level_block_number}'
                     f' ({current_block_name})'
                 ),
             )
+        return None
 
-            if occurrence not in entry.occurrences:
-                entry.occurrences.append(occurrence)
-
-        _equal_entry = find_entry_in_entries(
-            entry,
-            self.pofile,
-            compare_obsolete=False,
-            compare_msgstr=False,
-            compare_occurrences=False,
+    def _save_msgid(
+        self,
+        msgid,
+        msgstr='',
+        tcomment=None,
+        msgctxt=None,
+        fuzzy=False,
+    ):
+        if msgid in self.ignore_msgids:
+            return
+        if self._messages is not None:
+            self._messages.append(
+                ExtractedMessage(
+                    msgid,
+                    msgctxt,
+                    tcomment,
+                    fuzzy,
+                    self._current_occurrence(),
+                ),
+            )
+            return
+        entry = polib.POEntry(
+            msgid=msgid,
+            msgstr=msgstr,
+            comment=tcomment,
+            msgctxt=msgctxt,
+            flags=[] if not fuzzy else ['fuzzy'],
         )
-
-        if _equal_entry and _equal_entry.msgstr:
-            entry.msgstr = _equal_entry.msgstr
-            if _equal_entry.fuzzy and not entry.fuzzy:
-                entry.flags.append('fuzzy')
-        if entry not in self.pofile:
-            self.pofile.append(entry)
+        occurrence = self._current_occurrence()
+        if occurrence is not None:
+            entry.occurrences.append(occurrence)
+
+        if self._spilled_entries is not None:
+            # merged with the entries of the PO file writing it
+            self._spilled_entries.add((
+                msgctxt or '0',
+                msgid,
+                SPILLED_FOUND_ENTRY,
+                len(self._spilled_entries),
+                entry,
+            ))
+            return
+        merge_found_entry(entry, self.pofile, self._pofile_index)
         self.found_entries.append(entry)
 
     def _save_current_msgid(
@@ -482,12 +589,12 @@ class Md2Po:
                 )
             else:
                 self.disabled_entries.append(
-                    polib.POEntry(
-                        msgid=self.current_msgid,
-                        msgstr=msgstr or self.msgstr,
-                        msgctxt=self.current_msgctxt,
-                        tcomment=self.current_tcomment,
-                        flags=['fuzzy'] if fuzzy else [],
+                    EntryRecord(
+                        self.current_msgid,
+                        msgstr or self.msgstr,
+                        self.current_msgctxt,
+                        self.current_tcomment,
+                        ('fuzzy',) if fuzzy else (),
                     ),
                 )
         self.disable_next_block = False
@@ -556,15 +663,13 @@ class Md2Po:
             self._save_current_msgid()
 
     def _process_command(self, text):
-        original_command, comment = parse_mdpo_html_command(text)
-        if original_command is None:
+        command, comment, original_command = resolve_mdpo_html_command(
+            text,
+            self.command_aliases,
+        )
+        if command is None:
             return
 
-        try:
-            command = self.command_aliases[original_command]
-        except KeyError:  # not custom command
-            command = original_command
-
         # process solved command
         self.command(command, comment, original_command)
 
@@ -680,6 +785,13 @@ class Md2Po:
                 self._inside_olblock = False
             self._save_current_msgid()
 
+    def _link_reference_target(self, href, title):
+        # link references are parsed only once per content, the first time
+        # that a link or an image is found
+        if self.link_references is None:
+            self.link_references = parse_link_references(self.content)
+        return find_link_reference_target(self.link_references, href, title)
+
     def enter_span(self, span, details):
         # raise 'enter_span' event
         if raise_skip_event(self.events, 'enter_span', self, span, details):
@@ -710,28 +822,11 @@ class Md2Po:
         if span is md4c.SpanType.A:
             # here resides the logic of discover if the current link
             # is referenced
-            if self.link_references is None:
-                self.link_references = parse_link_references(self.content)
-
             self._inside_aspan = True
-
-            current_aspan_href = details['href'][0][1]
-            self._current_aspan_ref_target = None
-
-            if details['title']:
-                current_aspan_title = details['title'][0][1]
-                for target, href, title in self.link_references:
-                    if (
-                        href == current_aspan_href
-                        and title == current_aspan_title
-                    ):
-                        self._current_aspan_ref_target = target
-                        break
-            else:
-                for target, href, _ in self.link_references:
-                    if href == current_aspan_href:
-                        self._current_aspan_ref_target = target
-                        break
+            self._current_aspan_ref_target = self._link_reference_target(
+                details['href'][0][1],
+                details['title'][0][1] if details['title'] else None,
+            )
 
         elif span is md4c.SpanType.CODE:
             self._inside_codespan = True
@@ -742,9 +837,6 @@ class Md2Po:
             # save the index char of the opening backtick
             self._codespan_start_index = len(self.current_msgid) - 1
         elif span is md4c.SpanType.IMG:
-            if self.link_references is None:
-                self.link_references = parse_link_references(self.content)
-
             self._current_imgspan['src'] = details['src'][0][1]
             self._current_imgspan['title'] = '' if not details['title'] \
                 else details['title'][0][1]
@@ -820,19 +912,14 @@ class Md2Po:
                 )
             self._codespan_backticks = None
         elif span is md4c.SpanType.IMG:
-            referenced_target, imgspan_title = (None, None)
             imgspan_src = details['src'][0][1]
-            if details['title']:
-                imgspan_title = details['title'][0][1]
-                for target, href, title in self.link_references:
-                    if href == imgspan_src and title == imgspan_title:
-                        referenced_target = target
-                        break
-            else:
-                for target, href, _ in self.link_references:
-                    if href == imgspan_src:
-                        referenced_target = target
-                        break
+            imgspan_title = (
+                details['title'][0][1] if details['title'] else None
+            )
+            referenced_target = self._link_reference_target(
+                imgspan_src,
+                imgspan_title,
+            )
 
             alt_text = self._current_imgspan['text']
             img_markup = f'![{alt_text}]'
@@ -949,6 +1036,149 @@ class Md2Po:
                     fuzzy=True,
                 )
 
+    def _iter_parsed_contents(self, md_encoding):
+        # parses the content or each file, yielding after each one
+        parser = md4c.GenericParser(
+            0,
+            **dict.fromkeys(self.extensions, True),
+        )
+        callbacks = [
+            self.profile.wrap('event callbacks', callback, counter=counter)
+            for callback, counter in (
+                (self.enter_block, 'blocks'),
+                (self.leave_block, None),
+                (
+                    (
+                        self.enter_span if self.plaintext
+                        else self.not_plaintext_enter_span
+                    ),
+                    'spans',
+                ),
+                (
+                    (
+                        self.leave_span if self.plaintext
+                        else self.not_plaintext_leave_span
+                    ),
+                    None,
+                ),
+                (self.text, 'texts'),
+            )
+        ]
+
+        def _parse(content):
+            with self.profile.phase('md4c parsing'):
+                parser.parse(content, *callbacks)
+            with self.profile.phase('event callbacks'):
+                self._dump_link_references()
+
+        if hasattr(self, 'content'):
+            _parse(self.content)
+            yield
+        else:
+            for filepath in self.filepaths:
+                with self.profile.phase('Markdown reading'), open(
+                    filepath, encoding=md_encoding,
+                ) as f:
+                    self.content = f.read()
+                if self.profile.enabled:
+                    self.profile.count('bytes read', os.path.getsize(filepath))
+                self._current_markdown_filepath = filepath
+                _parse(self.content)
+
+                # reset state
+                self.disable_next_block = False
+                self.disable = False
+                self.enable_next_block = False
+                self.include_next_codeblock = False
+                self.disable_next_codeblock = False
+                self.link_references = None
+                self._current_top_level_block_number = 0
+                self._current_top_level_block_type = None
+                yield
+
+    def _spill_pofile_entries(self):
+        self._spilled_entries = ExternalSorter(self.max_entries_in_memory)
+        for i, entry in enumerate(self.pofile):
+            self._spilled_entries.add((
+                entry.msgctxt or '0',
+                entry.msgid,
+                SPILLED_POFILE_ENTRY,
+                i,
+                entry,
+            ))
+        # only the header and the metadata are kept
+        del self.pofile[:]
+        self._pofile_index = {}
+
+    def _write_spilled_entries(self, po_filepath, pofile_entries_count):
+        spilled_entries, self._spilled_entries = self._spilled_entries, None
+        self.profile.count(
+            'msgids extracted',
+            len(spilled_entries) - pofile_entries_count,
+        )
+        if self.metadata:
+            self.pofile.metadata.update(self.metadata)
+
+        entries = merge_spilled_entries(
+            spilled_entries,
+            self.max_entries_in_memory,
+            mark_not_found_as_obsolete=self.mark_not_found_as_obsolete,
+            preserve_not_found=self.preserve_not_found,
+        )
+        try:
+            # merged while serialized and written, so all are measured
+            # together
+            with self.profile.phase('writing'):
+                if self._saved_files_changed is False:
+                    with tempfile.TemporaryDirectory() as tmp_dirpath:
+                        tmp_filepath = os.path.join(tmp_dirpath, 'po')
+                        write_pofile_entries(
+                            self.pofile,
+                            entries,
+                            tmp_filepath,
+                        )
+                        self._saved_files_changed = not (
+                            os.path.isfile(po_filepath) and filecmp.cmp(
+                                tmp_filepath,
+                                po_filepath,
+                                shallow=False,
+                            )
+                        )
+                        if self._saved_files_changed:
+                            shutil.copyfile(tmp_filepath, po_filepath)
+                else:
+                    write_pofile_entries(self.pofile, entries, po_filepath)
+        finally:
+            spilled_entries.close()
+        self.pofile.fpath = po_filepath
+        if self.profile.enabled:
+            self.profile.count('bytes written', os.path.getsize(po_filepath))
+
+    def iter_messages(self, md_encoding='utf-8'):
+        """Extract the messages without building a PO file.
+
+        The messages are yielded after parsing each file, so only the
+        messages of one file are held in memory. The messages disabled by
+        mdpo commands are not collected in :py:attr:`disabled_entries` and
+        :py:attr:`pofile` is not defined while extracting.
+
+        Args:
+            md_encoding (str): Markdown files encoding.
+
+        Yields:
+            :py:class:`mdpo.md2po.ExtractedMessage`: Extracted messages.
+        """
+        self._messages = []
+        try:
+            for _ in self._iter_parsed_contents(md_encoding):
+                messages, self._messages = self._messages, []
+                self.disabled_entries.clear()
+                yield from messages
+        finally:
+            self._messages = None
+            if self._debug_tracer is not None:
+                self._debug_tracer.flush()
+
     def extract(
         self,
         po_filepath=None,
@@ -976,87 +1206,128 @@ class Md2Po:
             if not os.path.exists(po_filepath):
                 self.po_filepath = ''
 
-        pofile_kwargs = (
-            {'autodetect_encoding': False, 'encoding': po_encoding}
-            if po_encoding else {}
-        )
-        self.pofile = polib.pofile(
-            self.po_filepath,
-            wrapwidth=parse_wrapwidth_argument(wrapwidth),
-            **pofile_kwargs,
-        )
-
-        parser = md4c.GenericParser(
-            0,
-            **dict.fromkeys(self.extensions, True),
-        )
-
-        def _parse(content):
-            parser.parse(
-                content,
-                self.enter_block,
-                self.leave_block,
-                (
-                    self.enter_span if self.plaintext
-                    else self.not_plaintext_enter_span
-                ),
-                (
-                    self.leave_span if self.plaintext
-                    else self.not_plaintext_leave_span
-                ),
-                self.text,
+        if self.max_entries_in_memory and (
+            not (save and po_filepath) or mo_filepath
+        ):
+            if os.environ.get('_MDPO_RUNNING') == 'true':
+                max_entries_arg = '--max-entries-in-memory'
+                save_arg, mo_filepath_arg = '-s/--save', '--mo-filepath'
+            else:
+                max_entries_arg = 'max_entries_in_memory'
+                save_arg, mo_filepath_arg = 'save', 'mo_filepath'
+            raise ValueError(
+                f"The argument '{max_entries_arg}' requires to save the"
+                f" PO file with '{save_arg}' and is not compatible with"
+                f" '{mo_filepath_arg}'.",
             )
-            self._dump_link_references()
 
-        if hasattr(self, 'content'):
-            _parse(self.content)
+        with self.profile.phase('PO loading'):
+            self.pofile = read_pofile(
+                self.po_filepath,
+                encoding=po_encoding,
+                wrapwidth=parse_wrapwidth_argument(wrapwidth),
+            )
+        if self.profile.enabled and self.po_filepath:
+            self.profile.count('bytes read', os.path.getsize(self.po_filepath))
+        pofile_entries_count = len(self.pofile)
+        if self.max_entries_in_memory:
+            self._spill_pofile_entries()
         else:
-            for filepath in self.filepaths:
-                with open(filepath, encoding=md_encoding) as f:
-                    self.content = f.read()
-                self._current_markdown_filepath = filepath
-                _parse(self.content)
+            self._pofile_index = index_entries(self.pofile)
 
-                # reset state
-                self.disable_next_block = False
-                self.disable = False
-                self.enable_next_block = False
-                self.include_next_codeblock = False
-                self.disable_next_codeblock = False
-                self.link_references = None
-                self._current_top_level_block_number = 0
-                self._current_top_level_block_type = None
+        try:
+            for _ in self._iter_parsed_contents(md_encoding):
+                pass
 
-        if not self.preserve_not_found:
-            remove_not_found_entries(
-                self.pofile,
-                self.found_entries,
-            )
-        elif self.mark_not_found_as_obsolete:
-            mark_not_found_entries_as_obsoletes(
-                self.pofile,
-                self.found_entries,
-            )
+            if self._spilled_entries is not None:
+                self._write_spilled_entries(po_filepath, pofile_entries_count)
+                return self.pofile
 
-        if self.metadata:
-            self.pofile.metadata.update(self.metadata)
+            self.profile.count('msgids extracted', len(self.found_entries))
+
+            if not self.preserve_not_found:
+                with self.profile.phase('merging'):
+                    remove_not_found_entries(
+                        self.pofile,
+                        self.found_entries,
+                    )
+            elif self.mark_not_found_as_obsolete:
+                with self.profile.phase('obsolete marking'):
+                    mark_not_found_entries_as_obsoletes(
+                        self.pofile,
+                        self.found_entries,
+                    )
+
+            if self.metadata:
+                self.pofile.metadata.update(self.metadata)
+
+            if save and po_filepath:
+                if self._saved_files_changed is False:
+                    with self.profile.phase('serialization'):
+                        content = pofile_to_string(self.pofile)
+                    with self.profile.phase('writing'):
+                        self._saved_files_changed = (
+                            save_file_checking_file_changed(
+                                po_filepath,
+                                content,
+                                encoding=self.pofile.encoding,
+                            )
+                        )
+                else:
+                    # serialized while written, so both are measured together
+                    with self.profile.phase('writing'):
+                        write_pofile(self.pofile, po_filepath)
+                if self.profile.enabled:
+                    self.profile.count(
+                        'bytes written',
+                        os.path.getsize(po_filepath),
+                    )
+            if mo_filepath:
+                with self.profile.phase('writing'):
+                    self.pofile.save_as_mofile(mo_filepath)
+            return self.pofile
+        finally:
+            if self._debug_tracer is not None:
+                self._debug_tracer.flush()
 
-        if save and po_filepath:
-            if self._saved_files_changed is False:
-                self._saved_files_changed = save_file_checking_file_changed(
-                    po_filepath,
-                    str(self.pofile),
-                    encoding=self.pofile.encoding,
-                )
-            else:
-                self.pofile.save(fpath=po_filepath)
-        if mo_filepath:
-            self.pofile.save_as_mofile(mo_filepath)
-        return self.pofile
+
+def iter_messages(files_or_content=None, md_encoding='utf-8', **kwargs):
+    """Extract the messages from Markdown content or files as a generator.
+
+    Unlike :py:func:`markdown_to_pofile`, no PO file is built nor merged,
+    so it is useful for tools that only need the messages, like word
+    counters, and pipelines that process them as they are found.
+
+    Args:
+        files_or_content (str, list): Glob path to Markdown files, a list of
+            files or a string with Markdown content.
+        md_encoding (str): Markdown files encoding.
+        **kwargs: Extra arguments passed to :py:class:`mdpo.md2po.Md2Po`
+            constructor, like those of :py:func:`markdown_to_pofile` that
+            control the extraction (``ignore``, ``plaintext``, ``location``,
+            ``extensions``, ``include_codeblocks``, ``ignore_msgids``,
+            ``command_aliases``, ``events``, ``content``, ``paths``...).
+
+    Examples:
+        >>> content = 'Some text with `inline code`'
+        >>> [message.msgid for message in iter_messages(content)]
+        ['Some text with `inline code`']
+        >>> messages = iter_messages(content, plaintext=True)
+        >>> [message.msgid for message in messages]
+        ['Some text with inline code']
+
+    Yields:
+        :py:class:`mdpo.md2po.ExtractedMessage`: Extracted messages, in the
+        order in which they are found. Repeated messages are yielded each
+        time that they are found.
+    """
+    yield from Md2Po(files_or_content, **kwargs).iter_messages(
+        md_encoding=md_encoding,
+    )
 
 
 def markdown_to_pofile(
-    files_or_content,
+    files_or_content=None,
     ignore=frozenset(),
     msgstr='',
     po_filepath=None,
@@ -1077,17 +1348,23 @@ def markdown_to_pofile(
     metadata=None,
     events=None,
     debug=False,
+    content=None,
+    paths=None,
+    max_entries_in_memory=None,
     **kwargs,
 ):
     """Extract all the msgids from Markdown content or files.
 
     Args:
         files_or_content (str, list): Glob path to Markdown files, a list of
-            files or a string with Markdown content.
+            files or a string with Markdown content. Strings with newlines
+            are always considered content, otherwise they are expanded as
+            globs and considered content if they don't match any file.
         ignore (list): Paths of files to ignore. Useful when a glob does not
             fit your requirements indicating the files to extract content.
             Also, filename or a dirname can be defined without indicate the
-            full path.
+            full path. Gitignore-style patterns are supported, see
+            :py:class:`mdpo.io.IgnoreRules`.
         msgstr (str): Default message string for extracted msgids.
         po_filepath (str): File that will be used as :class:`polib.POFile`
             instance where to dump the new msgids and that will be used
@@ -1132,6 +1409,9 @@ def markdown_to_pofile(
             of code. Equivalent to append ``<!-- mdpo-include-codeblock -->``
             command before each code block.
         ignore_msgids (list): List of msgids ot ignore from being extracted.
+            Rules prefixed with ``glob:`` or ``re:`` ignore the msgids that
+            match a glob or a regular expression. See
+            :py:class:`mdpo.po.MsgidMatcher` for details.
         command_aliases (dict): Mapping of aliases to use custom mdpo command
             names in comments. The ``mdpo-`` prefix in command names resolution
             is optional. For example, if you want to use ``<!-- mdpo-on -->``
@@ -1178,7 +1458,21 @@ def markdown_to_pofile(
                    if msgid == 'foo':
                        self.disable_next_block = True
         debug (bool): Add events displaying all parsed elements in the
-            extraction process.
+            extraction process. A :py:class:`mdpo.event.DebugTracer` can
+            be passed to filter, sample or write the events to a file.
+        content (str): Markdown content to extract. Use it instead of
+            ``files_or_content`` to avoid checking if it is a glob.
+        paths (str, list): Glob, path or list of them to the Markdown files
+            to extract. Use it instead of ``files_or_content`` to avoid
+            checking if it is content.
+        max_entries_in_memory (int): Maximum number of entries held in
+            memory. If defined, the entries of the PO file and the extracted
+            ones are sorted in runs spilled to temporary files, which are
+            merged writing the PO file, so the memory used extracting big
+            sets of files is bounded. The output is the same, but requires
+            ``save`` and ``po_filepath``, is not compatible with
+            ``mo_filepath`` and the returned PO file only contains the
+            header and the metadata.
         **kwargs: Extra arguments passed to
             :py:class:`mdpo.md2po.Md2Po` constructor.
 
@@ -1213,6 +1507,9 @@ def markdown_to_pofile(
         metadata=metadata,
         events=events,
         debug=debug,
+        content=content,
+        paths=paths,
+        max_entries_in_memory=max_entries_in_memory,
         **kwargs,
     ).extract(
         po_filepath=po_filepath,
@@ -1222,3 +1519,23 @@ def markdown_to_pofile(
         md_encoding=md_encoding,
         wrapwidth=wrapwidth,
     )
+
+
+async def amarkdown_to_pofile(
+    *args,
+    executor=None,
+    semaphore=None,
+    **kwargs,
+):
+    """Asynchronous version of :py:func:`markdown_to_pofile`.
+
+    Takes the same arguments, plus ``executor`` and ``semaphore`` as
+    described in :py:func:`mdpo.io.run_in_executor`.
+    """
+    return await run_in_executor(
+        markdown_to_pofile,
+        *args,
+        executor=executor,
+        semaphore=semaphore,
+        **kwargs,
+    )
@@ -3,6 +3,7 @@
 import glob
 import os
 
+from mdpo.io import iter_files, run_in_executor
 from mdpo.md2po import Md2Po
 from mdpo.md4c import DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS
 from mdpo.po import (
@@ -13,6 +14,46 @@ from mdpo.po import (
 from mdpo.po2md import Po2Md
 
 
+def _output_filepaths(filepath, lang, output_paths_schema):
+    """Build the paths of the PO and Markdown outputs of a file and language.
+
+    Directories of the PO file are created if they don't exist.
+    """
+    md_ext = os.path.splitext(filepath)[-1]
+
+    file_basename = os.path.splitext(os.path.basename(filepath))[0]
+
+    format_kwargs = {'lang': lang}
+    if '{basename}' in output_paths_schema:
+        format_kwargs['basename'] = file_basename
+    po_filepath = output_paths_schema.format(**format_kwargs)
+
+    po_basename = os.path.basename(po_filepath)
+    po_dirpath = (
+        os.path.dirname(po_filepath)
+        if (po_basename.count('.') or file_basename == po_basename)
+        else po_filepath
+    )
+
+    os.makedirs(os.path.abspath(po_dirpath), exist_ok=True)
+    if os.path.isdir(po_filepath):
+        po_filepath = os.path.join(
+            po_filepath.rstrip(os.sep),
+            f'{os.path.basename(filepath)}.po',
+        )
+    if not po_filepath.endswith('.po'):
+        po_filepath += '.po'
+
+    format_kwargs['ext'] = md_ext.lstrip('.')
+    md_filepath = output_paths_schema.format(**format_kwargs)
+    if os.path.isdir(md_filepath):
+        md_filepath = os.path.join(
+            md_filepath.rstrip(os.sep),
+            os.path.basename(filepath),
+        )
+    return (po_filepath, md_filepath)
+
+
 def markdown_to_pofile_to_markdown(
     langs,
     input_paths_glob,
@@ -32,12 +73,15 @@ def markdown_to_pofile_to_markdown(
     no_obsolete=False,
     no_fuzzy=False,
     no_empty_msgstr=False,
+    profile=None,
 ):
     """Translate a set of Markdown files using PO files.
 
     Args:
         langs (list): List of languages used to build the output directories.
         input_paths_glob (str): Glob covering Markdown files to translate.
+            Globs are expanded by :py:func:`mdpo.io.iter_files`, so ``**``
+            segments are recursive.
         output_paths_schema (str): Path schema for outputs, built using
             placeholders. There is a mandatory placeholder for languages:
             ``{lang}``; and one optional for output basename: ``{basename}``.
@@ -67,7 +111,9 @@ def markdown_to_pofile_to_markdown(
         location (bool): Store references of top-level blocks in which are
             found the messages in PO file ``#: reference`` comments.
         debug (bool): Add events displaying all parsed elements in the
-            extraction process.
+            extraction and translation processes. A
+            :py:class:`mdpo.event.DebugTracer` can be passed to filter, sample
+            or write the events to a file.
         po_wrapwidth (int): Maximum width for PO files.
         md_wrapwidth (int): Maximum width for produced Markdown contents, when
             possible.
@@ -81,6 +127,9 @@ def markdown_to_pofile_to_markdown(
         no_obsolete (bool): If ``True``, check for obsolete entries in PO files.
         no_fuzzy (bool): If ``True``, check for fuzzy entries in PO files.
         no_empty_msgstr (bool): If ``True``, check for empty ``msgstr`` entries.
+        profile (:py:class:`mdpo.profiling.Profile`): Profile in which the
+            time spent in each phase of the extractions and translations
+            will be accumulated.
     """
     if '{lang}' not in output_paths_schema:
         raise ValueError(
@@ -89,7 +138,7 @@ def markdown_to_pofile_to_markdown(
         )
 
     try:
-        input_paths_glob_ = glob.glob(input_paths_glob)
+        input_paths_glob_ = list(iter_files(input_paths_glob))
     except Exception as err:
         if (
             err.__module__ in ['re', 'sre_constants']
@@ -113,39 +162,14 @@ def markdown_to_pofile_to_markdown(
     empties = []
 
     for filepath in input_paths_glob_:
+        po_filepaths, md_filepaths = {}, {}
         for lang in langs:
-            md_ext = os.path.splitext(filepath)[-1]
-
-            file_basename = os.path.splitext(os.path.basename(filepath))[0]
-
-            format_kwargs = {'lang': lang}
-            if '{basename}' in output_paths_schema:
-                format_kwargs['basename'] = file_basename
-            po_filepath = output_paths_schema.format(**format_kwargs)
-
-            po_basename = os.path.basename(po_filepath)
-            po_dirpath = (
-                os.path.dirname(po_filepath)
-                if (po_basename.count('.') or file_basename == po_basename)
-                else po_filepath
+            po_filepath, md_filepath = _output_filepaths(
+                filepath,
+                lang,
+                output_paths_schema,
             )
-
-            os.makedirs(os.path.abspath(po_dirpath), exist_ok=True)
-            if os.path.isdir(po_filepath):
-                po_filepath = os.path.join(
-                    po_filepath.rstrip(os.sep),
-                    f'{os.path.basename(filepath)}.po',
-                )
-            if not po_filepath.endswith('.po'):
-                po_filepath += '.po'
-
-            format_kwargs['ext'] = md_ext.lstrip('.')
-            md_filepath = output_paths_schema.format(**format_kwargs)
-            if os.path.isdir(md_filepath):
-                md_filepath = os.path.join(
-                    md_filepath.rstrip(os.sep),
-                    os.path.basename(filepath),
-                )
+            po_filepaths[lang], md_filepaths[lang] = po_filepath, md_filepath
 
             # md2po
             md2po = Md2Po(
@@ -157,6 +181,7 @@ def markdown_to_pofile_to_markdown(
                 wrapwidth=po_wrapwidth,
                 include_codeblocks=include_codeblocks,
                 _check_saved_files_changed=_check_saved_files_changed,
+                profile=profile,
                 **(md2po_kwargs or {}),
             )
             md2po.extract(
@@ -168,24 +193,26 @@ def markdown_to_pofile_to_markdown(
             if _check_saved_files_changed and _saved_files_changed is False:
                 _saved_files_changed = md2po._saved_files_changed
 
-            # po2md
-            po2md = Po2Md(
-                [po_filepath],
-                command_aliases=command_aliases,
-                debug=debug,
-                po_encoding=po_encoding,
-                wrapwidth=md_wrapwidth,
-                _check_saved_files_changed=_check_saved_files_changed,
-                **(po2md_kwargs or {}),
-            )
-            po2md.translate(
-                filepath,
-                save=md_filepath,
-                md_encoding=md_encoding,
-            )
-            if _check_saved_files_changed and _saved_files_changed is False:
-                _saved_files_changed = po2md._saved_files_changed
+        # po2md, parsing the file once for all languages
+        po2md = Po2Md(
+            {lang: [po_filepath] for lang, po_filepath in po_filepaths.items()},
+            command_aliases=command_aliases,
+            debug=debug,
+            po_encoding=po_encoding,
+            wrapwidth=md_wrapwidth,
+            _check_saved_files_changed=_check_saved_files_changed,
+            profile=profile,
+            **(po2md_kwargs or {}),
+        )
+        po2md.translate(
+            filepath,
+            save=md_filepaths,
+            md_encoding=md_encoding,
+        )
+        if _check_saved_files_changed and _saved_files_changed is False:
+            _saved_files_changed = po2md._saved_files_changed
 
+        for po_filepath in po_filepaths.values():
             if no_obsolete:
                 obsoletes.extend(check_obsolete_entries_in_filepaths(
                     [po_filepath],
@@ -202,3 +229,162 @@ def markdown_to_pofile_to_markdown(
                 )
 
     return (_saved_files_changed, obsoletes, fuzzies, empties)
+
+
+def _file_version(filepath):
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def watch_markdown_to_pofile_to_markdown(
+    langs,
+    input_paths_glob,
+    output_paths_schema,
+    interval=0.5,
+    debounce=0.2,
+    on_rebuild=None,
+    on_error=None,
+    on_ready=None,
+    stop=None,
+    **kwargs,
+):
+    """Rebuild translations when Markdown files or their PO files change.
+
+    The Markdown files matched by the glob and their PO files are polled
+    for changes, rebuilding only the outputs of the files and languages
+    affected, which are the same that a full run with
+    :py:func:`markdown_to_pofile_to_markdown` would produce. Markdown files
+    added to the glob are built for all languages when detected. This
+    function doesn't do an initial full run, so execute
+    :py:func:`markdown_to_pofile_to_markdown` before to start from updated
+    outputs.
+
+    Args:
+        langs (list): List of languages used to build the output directories.
+        input_paths_glob (str): Glob covering Markdown files to translate.
+        output_paths_schema (str): Path schema for outputs, built using
+            placeholders, as in :py:func:`markdown_to_pofile_to_markdown`.
+        interval (float): Seconds between checks for changes.
+        debounce (float): Seconds without new changes waited before
+            rebuilding, so multiple saves of an editor trigger only one
+            rebuild.
+        on_rebuild (function): Function called after each rebuild with
+            a list of the rebuilt ``(filepath, lang)`` tuples.
+        on_error (function): Function called with the file path, the
+            language and the exception when the rebuild of a file fails,
+            for example because its PO file is invalid. The file is rebuilt
+            again when it or its PO file change. If not defined, errors are
+            written to the standard error.
+        on_ready (function): Function called without arguments when the
+            files have been scanned for the first time, so changes made
+            after that are detected.
+        stop (:py:class:`threading.Event`): Event that stops watching when
+            set. If not defined, watches until interrupted.
+        **kwargs: Extra arguments passed to
+            :py:func:`markdown_to_pofile_to_markdown`.
+    """
+    import sys
+    import threading
+
+    stop = stop or threading.Event()
+    output_filepaths = {}
+
+    def take_snapshot():
+        snapshot = {}
+        for filepath in iter_files(input_paths_glob):
+            snapshot[(filepath, None)] = _file_version(filepath)
+            for lang in langs:
+                try:
+                    po_filepath, _ = output_filepaths[(filepath, lang)]
+                except KeyError:
+                    output_filepaths[(filepath, lang)] = _output_filepaths(
+                        filepath,
+                        lang,
+                        output_paths_schema,
+                    )
+                    po_filepath, _ = output_filepaths[(filepath, lang)]
+                snapshot[(filepath, lang)] = _file_version(po_filepath)
+        return snapshot
+
+    snapshot = take_snapshot()
+    if on_ready is not None:
+        on_ready()
+    while not stop.wait(interval):
+        new_snapshot = take_snapshot()
+        if new_snapshot == snapshot:
+            continue
+
+        # debounce until the files are not being modified
+        while not stop.wait(debounce):
+            latest_snapshot = take_snapshot()
+            if latest_snapshot == new_snapshot:
+                break
+            new_snapshot = latest_snapshot
+        else:
+            break
+
+        affected = []
+        for (filepath, lang), version in new_snapshot.items():
+            if version is None or snapshot.get((filepath, lang)) == version:
+                continue
+            if lang is None:
+                # Markdown file changed, all of its languages are affected
+                affected.extend((filepath, lang_) for lang_ in langs)
+            else:
+                affected.append((filepath, lang))
+        affected = list(dict.fromkeys(affected))
+
+        rebuilt = []
+        for filepath, lang in affected:
+            try:
+                markdown_to_pofile_to_markdown(
+                    [lang],
+                    glob.escape(filepath),
+                    output_paths_schema,
+                    **kwargs,
+                )
+            except Exception as exc:  # noqa: BLE001
+                if on_error is None:
+                    sys.stderr.write(
+                        f'Error rebuilding {filepath} ({lang}): {exc}\n',
+                    )
+                else:
+                    on_error(filepath, lang, exc)
+            else:
+                rebuilt.append((filepath, lang))
+
+        # ignore the changes in the files written by the rebuild, but not
+        # the changes saved in other files while rebuilding
+        snapshot = new_snapshot
+        written_snapshot = take_snapshot()
+        for filepath, lang in rebuilt:
+            po_filepath, md_filepath = output_filepaths[(filepath, lang)]
+            for key in ((filepath, lang), (md_filepath, None)):
+                if key in written_snapshot:
+                    snapshot[key] = written_snapshot[key]
+
+        if on_rebuild is not None and rebuilt:
+            on_rebuild(rebuilt)
+
+
+async def amarkdown_to_pofile_to_markdown(
+    *args,
+    executor=None,
+    semaphore=None,
+    **kwargs,
+):
+    """Asynchronous version of :py:func:`markdown_to_pofile_to_markdown`.
+
+    Takes the same arguments, plus ``executor`` and ``semaphore`` as
+    described in :py:func:`mdpo.io.run_in_executor`.
+    """
+    return await run_in_executor(
+        markdown_to_pofile_to_markdown,
+        *args,
+        executor=executor,
+        semaphore=semaphore,
+        **kwargs,
+    )
@@ -1,6 +1,6 @@
 """HTML-produced-from-Markdown files translator using PO files as reference."""
 
-import contextlib
+import collections
 import html
 import re
 import warnings
@@ -8,18 +8,24 @@ from collections import OrderedDict
 from html.parser import HTMLParser
 
 import md4c
-import polib
 
+from mdpo.catalog import CatalogStore
 from mdpo.command import (
     normalize_mdpo_command_aliases,
-    parse_mdpo_html_command,
+    resolve_mdpo_html_command,
+)
+from mdpo.io import (
+    run_in_executor,
+    save_file_checking_file_changed,
+    to_file_content_if_is_file,
 )
-from mdpo.io import save_file_checking_file_changed, to_file_content_if_is_file
 from mdpo.md import solve_link_reference_targets
 from mdpo.po import (
+    EntryRecord,
     paths_or_globs_to_unique_pofiles,
     pofiles_to_unique_translations_dicts,
 )
+from mdpo.profiling import NULL_PROFILE
 
 
 PROCESS_REPLACER_TAGS = [
@@ -61,13 +67,22 @@ class MdPo2HTML(HTMLParser):
         ignore_grouper_tags=frozenset(['div', 'hr']),
         po_encoding=None,
         command_aliases=None,
+        profile=None,
+        catalog=None,
         _check_saved_files_changed=None,
     ):
-        self.pofiles = paths_or_globs_to_unique_pofiles(
-            pofiles,
-            ignore,
-            po_encoding=po_encoding,
-        )
+        self.profile = profile or NULL_PROFILE
+        self.catalog = catalog
+        # stores passed as paths are closed at the end of each translation
+        self._catalog_owned = isinstance(catalog, str)
+        if self._catalog_owned:
+            self.catalog = CatalogStore(catalog)
+        with self.profile.phase('PO loading'):
+            self.pofiles = paths_or_globs_to_unique_pofiles(
+                pofiles,
+                ignore,
+                po_encoding=po_encoding,
+            )
         self.output = ''
         self.replacer = []
         self._raw_replacement = ''
@@ -253,11 +268,7 @@ class MdPo2HTML(HTMLParser):
             replacement = _current_replacement
 
             self.disabled_entries.append(
-                polib.POEntry(
-                    msgid=replacement,
-                    msgstr='',
-                    msgctxt=self.current_msgctxt,
-                ),
+                EntryRecord(replacement, '', self.current_msgctxt),
             )
         else:
             if self.current_msgctxt:
@@ -386,17 +397,15 @@ class MdPo2HTML(HTMLParser):
             self.replacer.append(('comment', data, None))
         else:
             data_as_comment = f'<!--{data}-->'
-            command, comment = parse_mdpo_html_command(
+            command, comment, _ = resolve_mdpo_html_command(
                 data_as_comment,
+                self.command_aliases,
             )
             if command is None:
                 self.output += data_as_comment
             else:
                 self._remove_lastline_from_output_if_empty()
 
-                with contextlib.suppress(KeyError):  # not custom command
-                    command = self.command_aliases[command]
-
                 if command in (
                     'mdpo-disable-next-block',
                     'mdpo-disable-next-line',
@@ -424,27 +433,49 @@ class MdPo2HTML(HTMLParser):
                     self.output += data_as_comment
 
     def translate(self, filepath_or_content, save=None, html_encoding='utf-8'):
-        content = to_file_content_if_is_file(
-            filepath_or_content,
-            encoding=html_encoding,
-        )
+        with self.profile.phase('HTML reading'):
+            content = to_file_content_if_is_file(
+                filepath_or_content,
+                encoding=html_encoding,
+            )
 
-        self.translations, self.translations_with_msgctxt = (
-            pofiles_to_unique_translations_dicts(self.pofiles)
-        )
+        with self.profile.phase('merging'):
+            if self.catalog is not None:
+                if self._catalog_owned and self.catalog.closed:
+                    self.catalog = CatalogStore(self.catalog.filepath)
+                # link reference targets are added to the translations
+                self.translations = collections.ChainMap(
+                    {},
+                    self.catalog.translations,
+                )
+                self.translations_with_msgctxt = (
+                    self.catalog.translations_with_msgctxt
+                )
+            else:
+                self.translations, self.translations_with_msgctxt = (
+                    pofiles_to_unique_translations_dicts(self.pofiles)
+                )
 
-        self.feed(content)
+        try:
+            with self.profile.phase('HTML parsing'):
+                self.feed(content)
+        finally:
+            if self._catalog_owned:
+                self.catalog.close()
 
         if save:
-            if self._saved_files_changed is False:
-                self._saved_files_changed = save_file_checking_file_changed(
-                    save,
-                    self.output,
-                    encoding=html_encoding,
-                )
-            else:
-                with open(save, 'w', encoding=html_encoding) as f:
-                    f.write(self.output)
+            with self.profile.phase('writing'):
+                if self._saved_files_changed is False:
+                    self._saved_files_changed = (
+                        save_file_checking_file_changed(
+                            save,
+                            self.output,
+                            encoding=html_encoding,
+                        )
+                    )
+                else:
+                    with open(save, 'w', encoding=html_encoding) as f:
+                        f.write(self.output)
 
         self.reset()
 
@@ -509,3 +540,23 @@ def markdown_pofile_to_html(
         save=save,
         html_encoding=html_encoding,
     )
+
+
+async def amarkdown_pofile_to_html(
+    *args,
+    executor=None,
+    semaphore=None,
+    **kwargs,
+):
+    """Asynchronous version of :py:func:`markdown_pofile_to_html`.
+
+    Takes the same arguments, plus ``executor`` and ``semaphore`` as
+    described in :py:func:`mdpo.io.run_in_executor`.
+    """
+    return await run_in_executor(
+        markdown_pofile_to_html,
+        *args,
+        executor=executor,
+        semaphore=semaphore,
+        **kwargs,
+    )
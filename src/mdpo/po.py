@@ -1,10 +1,15 @@
 """PO files related stuff."""
 
-import glob
+import codecs
+import fnmatch
+import functools
+import os
+import re
+import textwrap
 
 import polib
 
-from mdpo.io import filter_paths
+from mdpo.io import iter_files
 from mdpo.polib import poentry__cmp__
 
 
@@ -23,6 +28,136 @@ def po_escaped_string(chars):
     return f'\\{chars[0]}'
 
 
+class EntryRecord:
+    """Lightweight record of a message found processing Markdown content.
+
+    Used for the bookkeeping of disabled and translated messages, which are
+    rarely read by callers, to avoid building a :py:class:`polib.POEntry`
+    for each one. Exposes the same attributes as :py:class:`polib.POEntry`
+    for the fields that it stores.
+
+    Args:
+        msgid (str): Message identifier.
+        msgstr (str): Message translation.
+        msgctxt (str): Message context.
+        tcomment (str): Comment for translators.
+        flags (tuple): Message flags, like ``'fuzzy'``.
+    """
+
+    __slots__ = ('msgid', 'msgstr', 'msgctxt', 'tcomment', 'flags')
+
+    def __init__(self, msgid, msgstr='', msgctxt=None, tcomment=None,
+                 flags=()):
+        self.msgid = msgid
+        self.msgstr = msgstr
+        self.msgctxt = msgctxt
+        self.tcomment = tcomment
+        self.flags = flags
+
+    @property
+    def fuzzy(self):
+        """bool: Indicates if the message is marked as fuzzy."""
+        return 'fuzzy' in self.flags
+
+    def to_poentry(self):
+        """Build a PO entry with the content of the record.
+
+        Returns:
+            :py:class:`polib.POEntry`: New entry.
+        """
+        return polib.POEntry(
+            msgid=self.msgid,
+            msgstr=self.msgstr,
+            msgctxt=self.msgctxt,
+            tcomment=self.tcomment,
+            flags=list(self.flags),
+        )
+
+    def __repr__(self):
+        """Represent the record with its message, translation and context."""
+        return (
+            f'EntryRecord(msgid={self.msgid!r}, msgstr={self.msgstr!r},'
+            f' msgctxt={self.msgctxt!r})'
+        )
+
+
+class MsgidMatcher:
+    """Compiled rules matching msgids.
+
+    Each rule is a string that can be prefixed to define how it matches
+    msgids:
+
+    * ``glob:<pattern>``: Msgids matching the pattern, using the syntax of
+      :py:mod:`fnmatch`.
+    * ``re:<regex>``: Msgids fully matching the regular expression.
+    * ``exact:<msgid>``: The msgid, which is useful to define msgids that
+      start with a prefix.
+    * Rules without prefix match the exact msgid.
+
+    Exact rules are stored in a set and pattern rules are combined into a
+    single regular expression, so checking if a msgid matches does not
+    depend on the number of rules. Pattern rules with groups or inline
+    global flags, which would change their meaning if combined, are matched
+    one by one.
+
+    Args:
+        rules (list): Rules to compile.
+
+    Raises:
+        ValueError: A pattern rule is not a valid regular expression.
+    """
+
+    __slots__ = ('exact', 'pattern', 'patterns')
+
+    def __init__(self, rules=()):
+        exact, combinable, patterns = set(), [], []
+        for rule in rules:
+            if rule.startswith('glob:'):
+                regex = fnmatch.translate(rule[5:])
+            elif rule.startswith('re:'):
+                regex = rule[3:]
+            else:
+                exact.add(rule[6:] if rule.startswith('exact:') else rule)
+                continue
+
+            # compiled alone to validate it, so errors refer to the rule
+            try:
+                pattern = re.compile(regex)
+            except re.error as exc:
+                raise ValueError(
+                    f"Invalid msgid pattern rule '{rule}': {exc}",
+                ) from None
+            if pattern.groups or pattern.flags != re.UNICODE:
+                patterns.append(pattern)
+            else:
+                combinable.append(pattern.pattern)
+
+        #: set: Exact msgids matched.
+        self.exact = exact
+        #: :py:class:`re.Pattern`: Combined pattern rules without groups nor
+        #: inline global flags, or ``None`` if there are none.
+        self.pattern = None
+        if combinable:
+            self.pattern = re.compile(
+                '|'.join(f'(?:{pattern})' for pattern in combinable),
+            )
+        #: tuple: Pattern rules matched one by one.
+        self.patterns = tuple(patterns)
+
+    def __contains__(self, msgid):
+        """Check if a msgid is matched by any rule."""
+        return msgid in self.exact or (
+            self.pattern is not None
+            and self.pattern.fullmatch(msgid) is not None
+        ) or any(
+            pattern.fullmatch(msgid) is not None for pattern in self.patterns
+        )
+
+    def __bool__(self):
+        """Check if there is any rule."""
+        return bool(self.exact or self.patterns) or self.pattern is not None
+
+
 def find_entry_in_entries(entry, entries, **kwargs):
     """Return an equal entry in a set of :py:class:`polib.POEntry` entries.
 
@@ -48,6 +183,74 @@ def find_entry_in_entries(entry, entries, **kwargs):
     return response
 
 
+def index_entries(entries):
+    """Index entries by their context and message.
+
+    Entries can only be equal, according to
+    :py:func:`mdpo.polib.poentry__cmp__`, if they share their context and
+    message, so an index allows to search for equal entries comparing only
+    the ones that share them, instead of all the entries.
+
+    Args:
+        entries (list): Entries to index.
+
+    Returns:
+        dict: Lists of entries, in their original order, by their
+        ``(msgctxt, msgid)`` keys. Missing contexts are normalized like
+        :py:func:`mdpo.polib.poentry__cmp__` does.
+    """
+    index = {}
+    for entry in entries:
+        key = (entry.msgctxt or '0', entry.msgid)
+        try:
+            index[key].append(entry)
+        except KeyError:
+            index[key] = [entry]
+    return index
+
+
+def find_entry_in_index(entry, index, **kwargs):
+    """Return an equal entry in an index of entries.
+
+    Same as :py:func:`find_entry_in_entries`, but only compares the
+    entries that share the context and the message of the searched one.
+
+    Args:
+        entry (:py:class:`polib.POEntry`): Entry to search for.
+        index (dict): Entries to search against, as returned by
+            :py:func:`index_entries`.
+        **kwargs: Keyword arguments passed to :py:class:`polib.POEntry`
+            ``__cmp__`` method.
+
+    Returns:
+        :py:class:`polib.POEntry`: Equal entry found in the index, otherwise
+        ``None``.
+    """
+    return find_entry_in_entries(
+        entry,
+        index.get((entry.msgctxt or '0', entry.msgid), ()),
+        **kwargs,
+    )
+
+
+#: Status of an entry of a PO file compared with the entries found
+#: extracting messages, as returned by :py:func:`_found_status`.
+_FOUND, _FOUND_IF_NOT_OBSOLETE, _NOT_FOUND = range(3)
+
+
+def _found_status(entry, found_index):
+    if find_entry_in_index(entry, found_index, compare_occurrences=False):
+        return _FOUND
+    if find_entry_in_index(
+        entry,
+        found_index,
+        compare_obsolete=False,
+        compare_occurrences=False,
+    ):
+        return _FOUND_IF_NOT_OBSOLETE
+    return _NOT_FOUND
+
+
 def mark_not_found_entries_as_obsoletes(
     pofile,
     entries,
@@ -62,26 +265,16 @@ def mark_not_found_entries_as_obsoletes(
             will be marked as obsoletes.
         entries (list): Entries to search against.
     """
-    obsolete = False
+    obsolete, entries = False, index_entries(entries)
     for entry in pofile:
-        if not find_entry_in_entries(
-            entry,
-            entries,
-            compare_occurrences=False,
-        ):
-            _equal_not_obsolete_found = find_entry_in_entries(
-                entry,
-                entries,
-                compare_obsolete=False,
-                compare_occurrences=False,
-            )
-            if _equal_not_obsolete_found:
-                pofile.remove(entry)
-            else:
-                entry.obsolete = True
-                obsolete = True
-        else:
+        status = _found_status(entry, entries)
+        if status == _FOUND:
             entry.obsolete = False
+        elif status == _FOUND_IF_NOT_OBSOLETE:
+            pofile.remove(entry)
+        else:
+            entry.obsolete = True
+            obsolete = True
     return obsolete
 
 
@@ -93,25 +286,154 @@ def remove_not_found_entries(pofile, entries):
             entries will be removed.
         entries (list): Entries to search against.
     """
-    entries_to_remove = []
-    for entry in pofile:
-        if not find_entry_in_entries(
-            entry,
-            entries,
-            compare_occurrences=False,
-        ):
-            _equal_not_obsolete_found = find_entry_in_entries(
-                entry,
-                entries,
-                compare_obsolete=False,
-                compare_occurrences=False,
-            )
-            if not _equal_not_obsolete_found:
-                entries_to_remove.append(entry)
+    entries = index_entries(entries)
+    entries_to_remove = [
+        entry for entry in pofile
+        if _found_status(entry, entries) == _NOT_FOUND
+    ]
     for entry in entries_to_remove:
         pofile.remove(entry)
 
 
+def merge_found_entry(entry, pofile, index):
+    """Merge an entry found extracting messages into a PO file.
+
+    The translation of an equal entry of the PO file, even if it is
+    obsolete, is reused by the found entry, which is appended to the PO file
+    if it does not contain a not obsolete entry with the same context and
+    message.
+
+    Args:
+        entry (:py:class:`polib.POEntry`): Found entry.
+        pofile (list): Entries of the PO file.
+        index (dict): Index of the entries of the PO file, as returned by
+            :py:func:`index_entries`, which is updated if the entry is
+            appended.
+
+    Returns:
+        bool: If the entry has been appended to the PO file.
+    """
+    # only the entries with the same context and message are compared
+    key = (entry.msgctxt or '0', entry.msgid)
+    same_key_entries = index.get(key, ())
+    _equal_entry = find_entry_in_entries(
+        entry,
+        same_key_entries,
+        compare_obsolete=False,
+        compare_msgstr=False,
+        compare_occurrences=False,
+    )
+
+    if _equal_entry and _equal_entry.msgstr:
+        entry.msgstr = _equal_entry.msgstr
+        if _equal_entry.fuzzy and not entry.fuzzy:
+            entry.flags.append('fuzzy')
+    # same as `entry not in pofile`, which searches for a not obsolete
+    # entry with the same message and context in all the file
+    if any(
+        not _entry.obsolete and _entry.msgctxt == entry.msgctxt
+        for _entry in same_key_entries
+    ):
+        return False
+    pofile.append(entry)
+    if same_key_entries:
+        same_key_entries.append(entry)
+    else:
+        index[key] = [entry]
+    return True
+
+
+#: int: Source of the spilled entries of a PO file.
+SPILLED_POFILE_ENTRY = 0
+
+#: int: Source of the spilled entries found extracting messages.
+SPILLED_FOUND_ENTRY = 1
+
+
+def merge_spilled_entries(
+    records,
+    max_entries,
+    mark_not_found_as_obsolete=True,
+    preserve_not_found=True,
+    directory=None,
+):
+    """Merge the entries of a PO file with the found ones, not held in memory.
+
+    Produces the same entries as merging the found entries with
+    :py:func:`merge_found_entry` and then calling
+    :py:func:`mark_not_found_entries_as_obsoletes` or
+    :py:func:`remove_not_found_entries`, but processing the entries of each
+    context and message at once.
+
+    Args:
+        records (iterable): Tuples ``(msgctxt, msgid, source, number,
+            entry)`` sorted, where ``msgctxt`` is the context of the entry
+            or ``'0'`` if it has not context, ``source`` is
+            :py:data:`SPILLED_POFILE_ENTRY` or :py:data:`SPILLED_FOUND_ENTRY`
+            and ``number`` is the position of the entry in the PO file or
+            in the extraction.
+        max_entries (int): Maximum number of entries held in memory sorting
+            the merged entries by their position.
+        mark_not_found_as_obsolete (bool): Mark the entries of the PO file
+            that have not been found as obsoletes.
+        preserve_not_found (bool): Preserve the entries of the PO file that
+            have not been found. If ``False``, they are removed.
+        directory (str): Directory for the temporary files.
+
+    Yields:
+        :py:class:`polib.POEntry`: Entries of the merged PO file, in order.
+    """
+    import itertools
+
+    from mdpo.io import ExternalSorter
+
+    check_found = not preserve_not_found or mark_not_found_as_obsolete
+    positions = ExternalSorter(max_entries, directory=directory)
+    try:
+        for _, group in itertools.groupby(records, key=lambda r: r[:2]):
+            pofile, found, position = [], [], {}
+            for _, _, source, number, entry in group:
+                position[id(entry)] = (source, number)
+                if source == SPILLED_POFILE_ENTRY:
+                    pofile.append(entry)
+                else:
+                    found.append(entry)
+
+            index = index_entries(pofile)
+            for entry in found:
+                merge_found_entry(entry, pofile, index)
+
+            found_index = index_entries(found) if check_found else None
+            for entry in pofile:
+                positions.add((
+                    *position[id(entry)],
+                    _found_status(entry, found_index) if check_found
+                    else _FOUND,
+                    entry,
+                ))
+
+        # like `mark_not_found_entries_as_obsoletes`, which removes entries
+        # while iterating, so the entry next to a removed one is skipped
+        skip_next = False
+        for _, _, status, entry in positions:
+            if not preserve_not_found:
+                if status != _NOT_FOUND:
+                    yield entry
+                continue
+            if not mark_not_found_as_obsolete:
+                yield entry
+            elif skip_next:
+                skip_next = False
+                yield entry
+            elif status == _FOUND_IF_NOT_OBSOLETE:
+                skip_next = True
+            else:
+                entry.obsolete = status == _NOT_FOUND
+                yield entry
+    finally:
+        positions.close()
+
+
 def pofiles_to_unique_translations_dicts(pofiles):
     """Extract unique translations from a set of PO files.
 
@@ -139,35 +461,575 @@ def pofiles_to_unique_translations_dicts(pofiles):
     return (translations, translations_with_msgctxt)
 
 
+_PO_ESCAPE_RE = re.compile(r'\\(\\|n|t|r|v|b|f|")')
+_PO_ESCAPES = {
+    '\\': '\\', 'n': '\n', 't': '\t', 'r': '\r',
+    'v': '\v', 'b': '\b', 'f': '\f', '"': '"',
+}
+_PO_CHARSET_RE = re.compile(rb'"?Content-Type:.+? charset=([\w_\-:\.]+)')
+
+# states of the fast reader in which each kind of line is allowed, as
+# defined by the transitions of the polib parser
+_TC_STATES = frozenset(('gc', 'oc', 'fl', 'tc', 'mi', 'ms'))
+_CT_STATES = frozenset(('st', 'he', 'gc', 'oc', 'fl', 'tc', 'ms'))
+_MI_STATES = frozenset(('st', 'he', 'gc', 'oc', 'fl', 'ct', 'tc', 'ms'))
+
+
+class _UnsupportedPOSyntax(Exception):  # noqa: N818
+    """Syntax not handled by the fast reader, which falls back to polib."""
+
+
+def _quoted_value(value):
+    inner = value[1:-1]
+    # same as searching for unescaped quotes like polib, but faster
+    if '"' in inner and (
+        inner[0] == '"' or inner.count('"') != inner.count('\\"')
+    ):
+        raise _UnsupportedPOSyntax
+    if '\\' not in inner:
+        return inner
+    return _PO_ESCAPE_RE.sub(lambda match: _PO_ESCAPES[match[1]], inner)
+
+
+def _detect_encoding(content):
+    match = _PO_CHARSET_RE.search(content)
+    while match:
+        encoding = match[1].strip().decode('utf-8')
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            # only the first charset of each line is considered
+            newline = content.find(b'\n', match.end())
+            if newline == -1:
+                break
+            match = _PO_CHARSET_RE.search(content, newline + 1)
+        else:
+            return encoding
+    return polib.default_encoding
+
+
+def _read_pofile_fast(po_filepath, encoding=None, wrapwidth=78):
+    """Parse the subset of the PO syntax written by mdpo.
+
+    Produces the same :py:class:`polib.POFile` as :py:func:`polib.pofile`,
+    but reading the file at once and dispatching each line by its first
+    characters instead of running the polib state machine. Plural forms,
+    previous messages and any syntax error raise
+    :py:exc:`_UnsupportedPOSyntax`.
+    """
+    with open(po_filepath, 'rb') as f:
+        content = f.read()
+    if encoding is None:
+        encoding = _detect_encoding(content)
+    try:
+        text = content.decode(encoding)
+    except LookupError:
+        encoding = polib.default_encoding
+        text = content.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if text.startswith('\ufeff'):
+        text = text[1:]
+
+    pofile = polib.POFile(pofile=po_filepath, encoding=encoding)
+    POEntry, entries = polib.POEntry, []
+    header = ''
+    state, last_is_comment = 'st', True
+
+    linenum, msgctxt, msgid, msgstr, obsolete = 0, None, '', '', False
+    comment, tcomment, occurrences, flags = '', '', [], []
+
+    for lineno, line in enumerate(text.split('\n'), 1):
+        line = line.strip()  # noqa: PLW2901
+        if not line:
+            continue
+        if line[0] != '"':  # continuation lines are the most common
+            tokens = line.split(None, 1)
+            keyword = tokens[0]
+            if keyword == '#~|':
+                last_is_comment = True
+                continue
+            if keyword == '#~' and len(tokens) > 1:
+                line = line[3:].strip()  # noqa: PLW2901
+                tokens = line.split(None, 1)
+                keyword = tokens[0]
+                entry_obsolete = 1
+                if keyword[0] == '#':
+                    raise _UnsupportedPOSyntax
+            else:
+                entry_obsolete = 0
+        last_is_comment = line[0] == '#'
+
+        if line[0] == '"':
+            value = _quoted_value(line)
+            if state == 'mi':
+                msgid += value
+            elif state == 'ms':
+                msgstr += value
+            elif state == 'ct':
+                msgctxt += value
+            else:
+                raise _UnsupportedPOSyntax
+            continue
+
+        if keyword in ('msgid', 'msgstr', 'msgctxt') and len(tokens) > 1:
+            value = _quoted_value(line[len(keyword):].lstrip())
+            if keyword == 'msgstr':
+                if state not in ('mi', 'tc'):
+                    raise _UnsupportedPOSyntax
+                msgstr = value
+                state = 'ms'
+                continue
+            if state not in (_MI_STATES if keyword == 'msgid' else _CT_STATES):
+                raise _UnsupportedPOSyntax
+        elif not last_is_comment:
+            raise _UnsupportedPOSyntax  # plurals or syntax errors
+        elif keyword in ('#:', '#,', '#.'):
+            if len(tokens) == 1:
+                continue
+        elif keyword == '#' or keyword.startswith('##'):
+            if state in ('st', 'he'):
+                if header:
+                    header += '\n'
+                header += line[2:]
+                state = 'he'
+                continue
+            if state not in _TC_STATES:
+                raise _UnsupportedPOSyntax
+        else:
+            raise _UnsupportedPOSyntax  # previous messages or syntax errors
+
+        if state == 'ms':
+            entries.append(
+                POEntry(
+                    msgid=msgid,
+                    msgstr=msgstr,
+                    msgctxt=msgctxt,
+                    obsolete=obsolete,
+                    comment=comment,
+                    tcomment=tcomment,
+                    occurrences=occurrences,
+                    flags=flags,
+                    linenum=linenum,
+                ),
+            )
+            linenum, msgctxt, msgid, msgstr, obsolete = (
+                lineno, None, '', '', False,
+            )
+            comment, tcomment, occurrences, flags = '', '', [], []
+
+        if keyword == 'msgid':
+            msgid, obsolete, state = value, entry_obsolete, 'mi'
+        elif keyword == 'msgctxt':
+            msgctxt, state = value, 'ct'
+        elif keyword == '#:':
+            for occurrence in line[3:].split():
+                filename, colon, number = occurrence.rpartition(':')
+                if not colon or not number.isdigit():
+                    filename, number = occurrence, ''
+                occurrences.append((filename, number))
+            state = 'oc'
+        elif keyword == '#,':
+            flags += [flag.strip() for flag in line[3:].split(',')]
+            state = 'fl'
+        elif keyword == '#.':
+            if comment:
+                comment += '\n'
+            comment += line[3:]
+            state = 'gc'
+        else:
+            if tcomment:
+                tcomment += '\n'
+            value = line.lstrip('#')
+            tcomment += value[1:] if value.startswith(' ') else value
+            state = 'tc'
+
+    if not last_is_comment:
+        entries.append(
+            POEntry(
+                msgid=msgid,
+                msgstr=msgstr,
+                msgctxt=msgctxt,
+                obsolete=obsolete,
+                comment=comment,
+                tcomment=tcomment,
+                occurrences=occurrences,
+                flags=flags,
+                linenum=linenum,
+            ),
+        )
+
+    pofile.header = header
+    pofile.wrapwidth = wrapwidth
+    pofile.extend(entries)
+
+    # metadata extraction, as done by polib
+    metadataentry = pofile.find('')
+    if metadataentry:
+        pofile.remove(metadataentry)
+        pofile.metadata_is_fuzzy = metadataentry.flags
+        key = None
+        for msg in metadataentry.msgstr.splitlines():
+            try:
+                key, val = msg.split(':', 1)
+                pofile.metadata[key] = val.strip()
+            except (ValueError, KeyError):
+                if key is not None:
+                    pofile.metadata[key] += '\n' + msg.strip()
+    return pofile
+
+
+def _read_pofile_polib(po_filepath, encoding=None, wrapwidth=78):
+    return polib.pofile(po_filepath, encoding=encoding, wrapwidth=wrapwidth)
+
+
+#: dict: Available PO file readers by name. ``'mdpo'`` is a fast reader for
+#: the PO syntax written by mdpo, which falls back to ``'polib'`` for other
+#: files.
+POFILE_READERS = {
+    'mdpo': _read_pofile_fast,
+    'polib': _read_pofile_polib,
+}
+
+_POFILE_READER = 'mdpo'
+
+
+def set_pofile_reader(reader):
+    """Define the reader used by default loading PO files.
+
+    Args:
+        reader (str, function): Name of one of the :py:data:`POFILE_READERS`
+            or a function that accepts the arguments of
+            :py:func:`read_pofile` and returns a :py:class:`polib.POFile`.
+    """
+    global _POFILE_READER  # noqa: PLW0603
+    if isinstance(reader, str) and reader not in POFILE_READERS:
+        raise ValueError(
+            f"Unknown PO file reader '{reader}'. Available readers are"
+            f" {', '.join(repr(name) for name in POFILE_READERS)}.",
+        )
+    _POFILE_READER = reader
+
+
+def read_pofile(po_filepath, encoding=None, wrapwidth=78, reader=None):
+    """Load a PO file.
+
+    Files written by mdpo are parsed by a fast reader, which produces the
+    same entries as :py:func:`polib.pofile`. Files with syntax not supported
+    by it, like plural forms or previous messages, are loaded by polib.
+
+    Args:
+        po_filepath (str): Path to the PO file. If the file does not exist,
+            the value is parsed by polib as the content of the PO file.
+        encoding (str): Encoding of the file. If not defined, it is detected
+            from the ``Content-Type`` header of the file.
+        wrapwidth (int): Wrap width of the PO file.
+        reader (str, function): Reader to use. If not defined, the one
+            defined by :py:func:`set_pofile_reader` is used.
+
+    Returns:
+        :py:class:`polib.POFile`: PO file.
+    """
+    reader = reader or _POFILE_READER
+    if not isinstance(reader, str):
+        return reader(po_filepath, encoding=encoding, wrapwidth=wrapwidth)
+    if reader == 'mdpo' and os.path.isfile(po_filepath):
+        try:
+            return _read_pofile_fast(
+                po_filepath,
+                encoding=encoding,
+                wrapwidth=wrapwidth,
+            )
+        except _UnsupportedPOSyntax:
+            pass
+    return _read_pofile_polib(
+        po_filepath,
+        encoding=encoding,
+        wrapwidth=wrapwidth,
+    )
+
+
+_PO_SPECIAL_CHARS = ('\\', '\n', '\r', '\t', '\v', '\b', '\f', '"')
+
+
+@functools.lru_cache(maxsize=262144)
+def _wrapped_field(field, flength, wrapwidth):
+    # quoted lines of a message field, wrapped like polib does
+    lines = field.splitlines(keepends=True)
+    if len(lines) > 1:
+        lines = ['', *lines]
+    else:
+        specialchars_count = 0
+        for char in _PO_SPECIAL_CHARS:
+            specialchars_count += field.count(char)
+        if wrapwidth > 0 and (
+            len(field) > wrapwidth - flength + specialchars_count
+        ):
+            lines = ['', *(
+                polib.unescape(item) for item in textwrap.wrap(
+                    polib.escape(field),
+                    wrapwidth - 2,
+                    drop_whitespace=False,
+                    break_long_words=False,
+                )
+            )]
+        else:
+            lines = [field]
+    return tuple(f'"{polib.escape(line)}"' for line in lines)
+
+
+def _field_lines(lines, fieldname, delflag, plural_index, field, wrapwidth):
+    wrapped = _wrapped_field(
+        field,
+        len(fieldname) + 3 + len(plural_index),
+        wrapwidth,
+    )
+    if fieldname.startswith('previous_'):
+        fieldname = fieldname[9:]
+    lines.append(f'{delflag}{fieldname}{plural_index} {wrapped[0]}')
+    for line in wrapped[1:]:
+        lines.append(f'{delflag}{line}')
+
+
+def _entry_to_string(entry, wrapwidth):
+    lines = []
+    obsolete = entry.obsolete
+
+    for value, prefix in (
+        ((entry.tcomment, '# '),) if obsolete else (
+            (entry.tcomment, '# '),
+            (entry.comment, '#. '),
+        )
+    ):
+        if value:
+            for comment in value.split('\n'):
+                if wrapwidth > 0 and len(comment) + len(prefix) > wrapwidth:
+                    lines.extend(
+                        textwrap.wrap(
+                            comment,
+                            wrapwidth,
+                            initial_indent=prefix,
+                            subsequent_indent=prefix,
+                            break_long_words=False,
+                        ),
+                    )
+                else:
+                    lines.append(f'{prefix}{comment}')
+
+    if not obsolete and entry.occurrences:
+        filestr = ' '.join(
+            f'{fpath}:{lineno}' if lineno else fpath
+            for fpath, lineno in entry.occurrences
+        )
+        if wrapwidth > 0 and len(filestr) + 3 > wrapwidth:
+            # hyphens are replaced to not split filenames, as polib does
+            lines.extend(
+                line.replace('*', '-') for line in textwrap.wrap(
+                    filestr.replace('-', '*'),
+                    wrapwidth,
+                    initial_indent='#: ',
+                    subsequent_indent='#: ',
+                    break_long_words=False,
+                )
+            )
+        else:
+            lines.append(f'#: {filestr}')
+
+    if entry.flags:
+        lines.append(f'#, {", ".join(entry.flags)}')
+
+    prefix = '#~| ' if obsolete else '#| '
+    for fieldname in (
+        'previous_msgctxt',
+        'previous_msgid',
+        'previous_msgid_plural',
+    ):
+        value = getattr(entry, fieldname)
+        if value is not None:
+            _field_lines(lines, fieldname, prefix, '', value, wrapwidth)
+
+    delflag = '#~ ' if obsolete else ''
+    if entry.msgctxt is not None:
+        _field_lines(lines, 'msgctxt', delflag, '', entry.msgctxt, wrapwidth)
+    _field_lines(lines, 'msgid', delflag, '', entry.msgid, wrapwidth)
+    if entry.msgid_plural:
+        _field_lines(
+            lines,
+            'msgid_plural',
+            delflag,
+            '',
+            entry.msgid_plural,
+            wrapwidth,
+        )
+    if entry.msgstr_plural:
+        for index in sorted(entry.msgstr_plural):
+            _field_lines(
+                lines,
+                'msgstr',
+                delflag,
+                f'[{index}]',
+                entry.msgstr_plural[index],
+                wrapwidth,
+            )
+    else:
+        _field_lines(lines, 'msgstr', delflag, '', entry.msgstr, wrapwidth)
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def _pofile_head(pofile):
+    # header comments and metadata entry
+    header = ''
+    for line in pofile.header.split('\n'):
+        if not line:
+            header += '#\n'
+        elif line[:1] in (',', ':'):
+            header += f'#{line}\n'
+        else:
+            header += f'# {line}\n'
+    return header + _entry_to_string(
+        pofile.metadata_as_entry(),
+        pofile.wrapwidth,
+    )
+
+
+def _iter_pofile_chunks(pofile):
+    wrapwidth = pofile.wrapwidth
+    yield _pofile_head(pofile)
+
+    for entry in pofile:
+        if not entry.obsolete:
+            yield '\n' + _entry_to_string(entry, wrapwidth)
+    for entry in pofile:
+        if entry.obsolete:
+            yield '\n' + _entry_to_string(entry, wrapwidth)
+
+
+def pofile_to_string(pofile):
+    """Serialize a PO file.
+
+    Produces the same output as ``str(pofile)``, but the wrapped lines of
+    the messages are cached by content and width, so unchanged messages
+    are not wrapped again each time that a catalog is serialized. The first
+    serialization of a catalog is not faster than ``str(pofile)``.
+
+    Args:
+        pofile (:py:class:`polib.POFile`): PO file to serialize.
+
+    Returns:
+        str: Content of the PO file.
+    """
+    return ''.join(_iter_pofile_chunks(pofile))
+
+
+def write_pofile(pofile, filepath, encoding=None):
+    """Write a PO file to disk, streaming its entries.
+
+    The content written is the same as the one returned by
+    :py:func:`pofile_to_string`, but it is not built in memory at once.
+
+    Args:
+        pofile (:py:class:`polib.POFile`): PO file to write.
+        filepath (str): Path to the file.
+        encoding (str): Encoding used writing the file. If not defined,
+            the encoding of the PO file is used.
+    """
+    with open(filepath, 'w', encoding=encoding or pofile.encoding) as f:
+        for chunk in _iter_pofile_chunks(pofile):
+            f.write(chunk)
+    if pofile.fpath is None:
+        pofile.fpath = filepath
+
+
+def write_pofile_entries(pofile, entries, filepath, encoding=None):
+    """Write a PO file to disk taking its entries from an iterable.
+
+    Allows to write catalogs whose entries are not held in memory. The
+    content written is the same as the one written by
+    :py:func:`write_pofile` for the PO file with ``entries`` as its entries.
+    Obsolete entries, which are written at the end, are serialized to a
+    temporary file until all the entries have been consumed.
+
+    Args:
+        pofile (:py:class:`polib.POFile`): PO file from which the header and
+            the metadata are written.
+        entries (iterable): Entries of the PO file, in order.
+        filepath (str): Path to the file.
+        encoding (str): Encoding used writing the file. If not defined,
+            the encoding of the PO file is used.
+    """
+    import shutil
+    import tempfile
+
+    wrapwidth = pofile.wrapwidth
+    encoding = encoding or pofile.encoding
+    with open(filepath, 'w', encoding=encoding) as f, \
+            tempfile.TemporaryFile('w+', encoding=encoding) as obsoletes:
+        f.write(_pofile_head(pofile))
+        for entry in entries:
+            chunk = '\n' + _entry_to_string(entry, wrapwidth)
+            (obsoletes if entry.obsolete else f).write(chunk)
+        obsoletes.seek(0)
+        shutil.copyfileobj(obsoletes, f)
+    if pofile.fpath is None:
+        pofile.fpath = filepath
+
+
+_POFILES_CACHE = None
+
+
+def enable_pofiles_cache(enable=True):
+    """Reuse PO files loaded by :py:func:`paths_or_globs_to_unique_pofiles`.
+
+    When enabled, PO files are only parsed again if they have been modified
+    since the last time they were loaded, which is useful for long-running
+    processes like the :py:mod:`mdpo.server`. The PO files returned are
+    shared between calls, so they must not be modified.
+
+    Args:
+        enable (bool): Enable or disable the cache. Disabling it frees all
+            the cached PO files.
+    """
+    global _POFILES_CACHE  # noqa: PLW0603
+    _POFILES_CACHE = {} if enable else None
+
+
+def _load_pofile(po_filepath, po_encoding):
+    if _POFILES_CACHE is None:
+        return read_pofile(po_filepath, encoding=po_encoding)
+
+    stat = os.stat(po_filepath)
+    key = (os.path.abspath(po_filepath), po_encoding)
+    version = (stat.st_mtime_ns, stat.st_size)
+    try:
+        cached_version, pofile = _POFILES_CACHE[key]
+    except KeyError:
+        pass
+    else:
+        if cached_version == version:
+            return pofile
+    pofile = read_pofile(po_filepath, encoding=po_encoding)
+    _POFILES_CACHE[key] = (version, pofile)
+    return pofile
+
+
 def paths_or_globs_to_unique_pofiles(pofiles_globs, ignore, po_encoding=None):
     """Convert any path, paths or glob to :py:class:`polib.POFile` objects.
 
     Args:
         pofiles_globs (str, list): Can be a path, a glob, multiples paths
             or multiples globs.
-        ignore (list): Paths to ignore.
+        ignore (list): Paths to ignore, as gitignore-style rules. See
+            :py:class:`mdpo.io.IgnoreRules`.
         po_encoding (str): Encoding used reading the PO files.
 
     Returns:
         set: Unique set of :py:class:`polib.POFile` objects.
     """
-    if isinstance(pofiles_globs, str):
-        pofiles_globs = [pofiles_globs]
-
-    _po_filepaths, pofiles = ([], [])
-
-    for pofiles_glob in pofiles_globs:
-        for po_filepath in filter_paths(
-            glob.glob(pofiles_glob),
-            ignore_paths=ignore,
-        ):
-            if po_filepath not in _po_filepaths:
-                pofiles.append(
-                    polib.pofile(po_filepath, encoding=po_encoding),
-                )
-                _po_filepaths.append(po_filepath)
-
-    return pofiles
+    return [
+        _load_pofile(po_filepath, po_encoding)
+        for po_filepath in iter_files(pofiles_globs, ignore=ignore)
+    ]
 
 
 def check_obsolete_entries_in_filepaths(filenames):
@@ -1,24 +1,44 @@
 """Markdown files translator using PO files as reference."""
 
 import contextlib
+import functools
+import itertools
+import os
+import re
 
 import md4c
 import md_ulb_pwrap
 import polib
 
+from mdpo.catalog import CatalogStore
 from mdpo.command import (
     normalize_mdpo_command_aliases,
-    parse_mdpo_html_command,
+    resolve_mdpo_html_command,
+)
+from mdpo.event import (
+    DebugTracer,
+    add_debug_events,
+    parse_events_kwarg,
+    raise_skip_event,
+)
+from mdpo.io import (
+    run_in_executor,
+    save_file_checking_file_changed,
+    to_file_content_if_is_file,
+)
+from mdpo.md import (
+    LINK_REFERENCE_REGEX,
+    find_link_reference_target,
+    parse_link_references,
 )
-from mdpo.event import add_debug_events, parse_events_kwarg, raise_skip_event
-from mdpo.io import save_file_checking_file_changed, to_file_content_if_is_file
-from mdpo.md import parse_link_references
 from mdpo.md4c import DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS
 from mdpo.po import (
+    EntryRecord,
     paths_or_globs_to_unique_pofiles,
     po_escaped_string,
     pofiles_to_unique_translations_dicts,
 )
+from mdpo.profiling import NULL_PROFILE, Profile
 from mdpo.text import (
     INFINITE_WRAPWIDTH,
     min_not_max_chars_in_a_row,
@@ -26,6 +46,263 @@ from mdpo.text import (
 )
 
 
+#: int: Default maximum number of wrapped paragraphs cached.
+DEFAULT_WRAP_CACHE_SIZE = 4096
+
+_cached_ulb_wrap_paragraph = functools.lru_cache(
+    maxsize=DEFAULT_WRAP_CACHE_SIZE,
+)(md_ulb_pwrap.ulb_wrap_paragraph)
+
+
+def set_wrap_cache_size(maxsize=DEFAULT_WRAP_CACHE_SIZE):
+    """Configure the cache of wrapped paragraphs shared by translations.
+
+    Paragraphs are wrapped using the Unicode Line Break algorithm, and
+    the same paragraphs are usually repeated between documents, so
+    the results are cached by text, width and first line width. Calling
+    this function resets the cache.
+
+    Args:
+        maxsize (int): Maximum number of paragraphs cached. If ``0``,
+            paragraphs are not cached. If ``None``, the cache is unbounded.
+    """
+    global _cached_ulb_wrap_paragraph  # noqa: PLW0603
+    _cached_ulb_wrap_paragraph = functools.lru_cache(
+        maxsize=maxsize,
+    )(md_ulb_pwrap.ulb_wrap_paragraph)
+
+
+def wrap_cache_info():
+    """Return statistics of the cache of wrapped paragraphs.
+
+    Returns:
+        namedtuple: Hits, misses, maximum size and current size of the
+        cache, as returned by ``functools.lru_cache`` ``cache_info()``.
+    """
+    return _cached_ulb_wrap_paragraph.cache_info()
+
+
+def _wrap_paragraph(text, width, first_line_width):
+    # text that fits in the first line is not changed by the algorithm
+    if len(text) <= min(width, first_line_width):
+        return text
+    return _cached_ulb_wrap_paragraph(text, width, first_line_width)
+
+
+#: int: Default minimum number of lines of the chunks translated in parallel.
+DEFAULT_PARALLEL_CHUNK_LINES = 256
+
+# chunks created by worker, to balance the work when the translation time
+# of the chunks is not the same
+_PARALLEL_CHUNKS_PER_WORKER = 4
+
+_FENCE_RE = re.compile(r' {0,3}(`{3,}|~{3,})')
+_LIST_ITEM_START_RE = re.compile(r'(?:[-+*]|\d{1,9}[.)])(?:[ \t\r]|$)')
+_LINK_REFERENCE_DEFINITION_RE = re.compile(LINK_REFERENCE_REGEX)
+
+# HTML blocks that can contain blank lines: start and end conditions
+_MULTILINE_HTML_BLOCKS = (
+    (re.compile(r'<(script|pre|style|textarea)(?:[\s>]|$)'), None),
+    (re.compile(r'<!--'), '-->'),
+    (re.compile(r'<\?'), '?>'),
+    (re.compile(r'<!\[cdata\['), ']]>'),
+    (re.compile(r'<![a-z]'), '>'),
+)
+
+
+def _is_link_reference_definition(line, extensions):
+    # only lines that md4c parses as link reference definitions are
+    # propagated to other chunks, as they don't produce parsing events
+    if not _LINK_REFERENCE_DEFINITION_RE.match(line.lstrip(' ')):
+        return False
+    blocks = []
+    md4c.GenericParser(0, **dict.fromkeys(extensions, True)).parse(
+        line,
+        lambda block, _details: blocks.append(block),
+        lambda *_args: None,
+        lambda *_args: None,
+        lambda *_args: None,
+        lambda *_args: None,
+    )
+    return blocks == [md4c.BlockType.DOC]
+
+
+def split_in_chunks(
+    content,
+    chunk_lines,
+    command_aliases=None,
+    disable=False,
+    extensions=DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS,
+):
+    """Split Markdown content in chunks of top level blocks.
+
+    Chunks are only split before an unindented line following a blank
+    line, which is not a list item, a blockquote or a table row, so they
+    start with a new top level block. Fenced code blocks, HTML blocks and
+    blocks that contain HTML, like mdpo commands, are never the last block
+    of a chunk. The state of the ``<!-- mdpo-disable -->`` and
+    ``<!-- mdpo-enable -->`` commands at the start of each chunk is
+    tracked.
+
+    Args:
+        content (str): Markdown content to split.
+        chunk_lines (int): Minimum number of lines of each chunk.
+        command_aliases (dict): Aliases normalized by
+            :py:func:`mdpo.command.normalize_mdpo_command_aliases`.
+        disable (bool): Indicates if the translation is disabled at the
+            start of the content.
+        extensions (list): MD4C extensions used to parse the content.
+
+    Returns:
+        tuple: List of chunks, as tuples with the start and end offsets
+        of each one in the content and if the translation is disabled at
+        its start, and list of link reference definitions, as tuples
+        with their offset and their line.
+    """
+    command_aliases = command_aliases or {}
+    chunks, definitions = [], []
+    chunk_start, chunk_disable, chunk_start_line = 0, disable, 0
+    fence, html_block_end = None, None
+    blank, html_inside_block, definition_allowed = False, False, True
+    offset = 0
+    for i, line in enumerate(content.split('\n')):
+        line_offset, offset = offset, offset + len(line) + 1
+        if fence is not None:
+            match = _FENCE_RE.match(line)
+            if (
+                match and match.group(1)[0] == fence[0]
+                and len(match.group(1)) >= fence[1]
+                and not line[match.end():].strip(' \t\r')
+            ):
+                fence = None
+            continue
+        if html_block_end is not None:
+            if html_block_end in line.lower():
+                html_block_end = None
+            continue
+        if not line.strip(' \t\r'):
+            blank, definition_allowed = True, True
+            continue
+
+        if blank:
+            if (
+                i - chunk_start_line >= chunk_lines
+                and not html_inside_block
+                and line[0] not in ' \t>|'
+                and not _LIST_ITEM_START_RE.match(line)
+            ):
+                chunks.append((chunk_start, line_offset, chunk_disable))
+                chunk_start, chunk_disable = line_offset, disable
+                chunk_start_line = i
+            blank, html_inside_block = False, False
+
+        indent = len(line) - len(line.lstrip(' '))
+        if line.startswith('\t') or indent > 3:  # noqa: PLR2004
+            definition_allowed = False
+            continue
+        match = _FENCE_RE.match(line)
+        if match:
+            fence = (match.group(1)[0], len(match.group(1)))
+            definition_allowed = False
+            continue
+
+        stripped = line[indent:]
+        if stripped.startswith('<'):
+            html_inside_block = True
+            lowered = stripped.lower()
+            for start_re, end_condition in _MULTILINE_HTML_BLOCKS:
+                match = start_re.match(lowered)
+                if match:
+                    end = end_condition or f'</{match.group(1)}>'
+                    if end not in lowered[match.end():]:
+                        html_block_end = end
+                    break
+            command = resolve_mdpo_html_command(
+                stripped.rstrip(' \t\r'),
+                command_aliases,
+            )[0]
+            if command == 'mdpo-disable':
+                disable = True
+            elif command == 'mdpo-enable':
+                disable = False
+            definition_allowed = False
+        elif definition_allowed and stripped.startswith('['):
+            if _is_link_reference_definition(line, extensions):
+                definitions.append((line_offset, f'{line}\n'))
+            else:
+                definition_allowed = False
+        else:
+            definition_allowed = stripped.startswith('#')
+    chunks.append((chunk_start, len(content), chunk_disable))
+    return chunks, definitions
+
+
+# state of the processes that translate chunks in parallel,
+# see :py:meth:`Po2Md._translate_chunks_in_parallel`
+_chunk_worker_state = None
+
+
+def _init_chunk_worker(*state):
+    global _chunk_worker_state  # noqa: PLW0603
+    _chunk_worker_state = state
+
+
+def _translate_chunk(chunk):
+    (
+        options,
+        translations,
+        translations_with_msgctxt,
+        content,
+        definitions,
+        profile_enabled,
+    ) = _chunk_worker_state
+    start, end, disable = chunk
+
+    profile = Profile() if profile_enabled else None
+    translator = Po2Md([], profile=profile, **options)
+    translator.translations = translations
+    translator.translations_with_msgctxt = translations_with_msgctxt
+    translator.content = content
+    translator.disable = disable
+
+    # link reference definitions of other chunks are included, so md4c
+    # resolves the referenced links of the chunk as in the whole content
+    previous_definitions = ''.join(
+        line for offset, line in definitions if offset < start
+    )
+    next_definitions = ''.join(
+        line for offset, line in definitions if offset >= end
+    )
+    translator._parse(
+        ''.join((
+            f'{previous_definitions}\n' if previous_definitions else '',
+            content[start:end],
+            f'\n{next_definitions}' if next_definitions else '',
+        )),
+    )
+
+    # the state must be the same as the initial state of the next chunk
+    finished = not any((
+        translator.current_line,
+        translator.current_msgid,
+        translator.current_msgctxt,
+        translator.current_tcomment,
+        translator.disable_next_block,
+        translator.enable_next_block,
+        translator._current_list_type,
+        translator._inside_quoteblock,
+        translator._inside_htmlblock[0],
+    ))
+    return (
+        translator.outputlines,
+        translator.translated_entries,
+        translator.disabled_entries,
+        translator.disable if finished else None,
+        translator.link_references is not None,
+        profile.counters if profile_enabled else None,
+    )
+
+
 class Po2Md:
     """PO files to Markdown translator implementation.
 
@@ -61,12 +338,24 @@ class Po2Md:
         'content',
         'extensions',
         'events',
+        'profile',
+        '_debug_tracer',
         'disabled_entries',
         'translated_entries',
+        'collect_translated_entries',
         'translations',
         'translations_with_msgctxt',
         'command_aliases',
         'wrapwidth',
+        'workers',
+        'parallel_chunk_lines',
+        '_options',
+        'languages',
+        'catalog',
+        '_catalog_owned',
+        '_languages_translations',
+        '_languages_placeholder',
+        '_languages_placeholder_re',
 
         'bold_start_string',
         'bold_end_string',
@@ -103,6 +392,7 @@ class Po2Md:
         '_inside_htmlblock',
         '_inside_codeblock',
         '_inside_indented_codeblock',
+        '_codeblock_texts',
         '_inside_pblock',
         '_inside_liblock',
         '_inside_liblock_first_p',
@@ -128,12 +418,40 @@ class Po2Md:
     }
 
     def __init__(self, pofiles, ignore=frozenset(), po_encoding=None, **kwargs):
-        #: list(str): Paths to PO files to translate.
-        self.pofiles = paths_or_globs_to_unique_pofiles(
-            pofiles,
-            ignore,
-            po_encoding=po_encoding,
-        )
+        #: :py:class:`mdpo.profiling.Profile`: Timings and counters of the
+        #: translation, only measured if passed as ``profile`` argument.
+        self.profile = kwargs.get('profile') or NULL_PROFILE
+
+        #: tuple(str): Languages of the outputs if a mapping of languages
+        #: to PO files has been passed as ``pofiles`` argument, or ``None``.
+        #: In that case, the content is parsed only once to translate it
+        #: to all languages and the translation tables, the translated
+        #: entries and the output are mappings by language.
+        self.languages = tuple(pofiles) if isinstance(pofiles, dict) else None
+
+        #: list(:py:class:`polib.POFile`): PO files used to translate.
+        with self.profile.phase('PO loading'):
+            if self.languages is None:
+                self.pofiles = paths_or_globs_to_unique_pofiles(
+                    pofiles,
+                    ignore,
+                    po_encoding=po_encoding,
+                )
+            else:
+                self.pofiles = {
+                    lang: paths_or_globs_to_unique_pofiles(
+                        lang_pofiles,
+                        ignore,
+                        po_encoding=po_encoding,
+                    )
+                    for lang, lang_pofiles in pofiles.items()
+                }
+        if self.profile.enabled:
+            for pofile in (
+                self.pofiles if self.languages is None
+                else itertools.chain(*self.pofiles.values())
+            ):
+                self.profile.count('bytes read', os.path.getsize(pofile.fpath))
 
         #: list(str): MD4C extensions used to parse the content.
         #: See all available in :doc:`/dev/reference/mdpo.md4c`.
@@ -145,8 +463,14 @@ class Po2Md:
         #: dict: Custom events excuted during the parsing while
         #: translating content.
         self.events = parse_events_kwarg(kwargs.get('events') or {})
+        self._debug_tracer = None
         if kwargs.get('debug'):
-            add_debug_events('po2md', self.events)
+            debug = kwargs['debug']
+            self._debug_tracer = add_debug_events(
+                'po2md',
+                self.events,
+                tracer=debug if isinstance(debug, DebugTracer) else None,
+            )
 
         #: str: The msgid being currently built for the next msgstr
         #: translation. Keep in mind that, if you are executing an event
@@ -182,10 +506,37 @@ class Po2Md:
         #: when the translator is disabled
         self.enable_next_block = False
 
-        #: list(:py:class:`polib.POEntry`): Disabled PO entries
+        #: list(:py:class:`mdpo.po.EntryRecord`): Disabled PO entries.
+        #: Can be converted to :py:class:`polib.POEntry` objects calling
+        #: their ``to_poentry`` method.
         self.disabled_entries = []
-        #: list(:py:class:`polib.POEntry`): Translated PO entries
-        self.translated_entries = []
+        #: list(:py:class:`mdpo.po.EntryRecord`): Translated PO entries.
+        self.translated_entries = (
+            [] if self.languages is None
+            else {lang: [] for lang in self.languages}
+        )
+        #: bool: Collect translated entries in :py:attr:`translated_entries`.
+        #: Disable it if you don't need them to save memory and time.
+        self.collect_translated_entries = kwargs.get(
+            'collect_translated_entries',
+            True,
+        )
+
+        #: :py:class:`mdpo.catalog.CatalogStore`: Store of translations used
+        #: instead of the PO files, if passed as ``catalog`` argument as a
+        #: store or as a path to a store file. Stores are shared without
+        #: copies by the processes that translate the content in parallel.
+        #: Stores passed as paths are closed at the end of each translation,
+        #: the others must be closed by the caller.
+        self.catalog = kwargs.get('catalog')
+        self._catalog_owned = isinstance(self.catalog, str)
+        if self._catalog_owned:
+            self.catalog = CatalogStore(self.catalog)
+        if self.catalog is not None and self.languages is not None:
+            raise ValueError(
+                'A catalog store can not be used translating to multiple'
+                ' languages',
+            )
 
         self.translations = None
         self.translations_with_msgctxt = None
@@ -201,6 +552,36 @@ class Po2Md:
             ) if 'wrapwidth' in kwargs else 80
         )
 
+        #: int: Number of processes used to translate the content in
+        #: parallel. If greater than ``1``, the content is split in chunks
+        #: of top level blocks which are translated by a pool of processes,
+        #: see :py:func:`mdpo.po2md.split_in_chunks`. The output is the
+        #: same as translating the content sequentially, which is done
+        #: anyway if events are defined, if the content is too short to be
+        #: split or if the state of the translator at the end of a chunk
+        #: is not the initial state of the next one.
+        self.workers = kwargs.get('workers') or 1
+
+        #: int: Minimum number of lines of the chunks translated in
+        #: parallel.
+        self.parallel_chunk_lines = kwargs.get(
+            'parallel_chunk_lines',
+            DEFAULT_PARALLEL_CHUNK_LINES,
+        )
+
+        # options passed to the translators of the chunks
+        self._options = {
+            key: value for key, value in kwargs.items()
+            if key not in {
+                'events',
+                'debug',
+                'profile',
+                'workers',
+                'catalog',
+                '_check_saved_files_changed',
+            }
+        }
+
         self._saved_files_changed = (
             False if kwargs.get('_check_saved_files_changed') else None
         )
@@ -279,6 +660,9 @@ class Po2Md:
         ]
         self._inside_codeblock = False
         self._inside_indented_codeblock = False
+        # code block texts are joined when leaving the block, instead of
+        # growing the current msgid for each line
+        self._codeblock_texts = []
         self._inside_hblock = False
         self._inside_pblock = False
         self._inside_liblock = False
@@ -320,6 +704,12 @@ class Po2Md:
 
         self._current_wikilink_target = None
 
+        # translations of the messages by language, referenced in the
+        # output lines by placeholders, see ``_add_languages_translations``
+        self._languages_translations = []
+        self._languages_placeholder = None
+        self._languages_placeholder_re = None
+
     def command(self, mdpo_command, comment, original_command):
         # raise 'command' event
         if raise_skip_event(
@@ -353,17 +743,15 @@ class Po2Md:
                 self.current_tcomment = comment
 
     def _process_command(self, text):
-        original_command, comment = parse_mdpo_html_command(text)
-        if original_command is None:
+        command, comment, original_command = resolve_mdpo_html_command(
+            text,
+            self.command_aliases,
+        )
+        if command is None:
             return False
 
         self._inside_htmlblock[1] = True
 
-        try:
-            command = self.command_aliases[original_command]
-        except KeyError:  # not custom command
-            command = original_command
-
         # process solved command
         self.command(command, comment, original_command)
 
@@ -375,25 +763,84 @@ class Po2Md:
             text = polib.escape(text)
         return text
 
-    def _translate_msgid(self, msgid, msgctxt, tcomment):
+    def _translate_msgid(self, msgid, msgctxt, tcomment, lang=None):
+        if lang is None:
+            translations = self.translations
+            translations_with_msgctxt = self.translations_with_msgctxt
+            translated_entries = self.translated_entries
+        else:
+            translations = self.translations[lang]
+            translations_with_msgctxt = self.translations_with_msgctxt[lang]
+            translated_entries = self.translated_entries[lang]
         try:
             if msgctxt:
-                msgstr = self.translations_with_msgctxt[msgctxt][msgid]
+                msgstr = translations_with_msgctxt[msgctxt][msgid]
             else:
-                msgstr = self.translations[msgid]
+                msgstr = translations[msgid]
         except KeyError:
+            self.profile.count('msgids untranslated')
             return msgid
         else:
-            self.translated_entries.append(
-                polib.POEntry(
-                    msgid=msgid,
-                    msgctxt=msgctxt,
-                    msgstr=msgstr,
-                    tcomment=tcomment,
-                ),
+            self.profile.count(
+                'msgids translated' if msgstr else 'msgids untranslated',
             )
+            if self.collect_translated_entries:
+                translated_entries.append(
+                    EntryRecord(msgid, msgstr, msgctxt, tcomment),
+                )
             return msgstr or msgid
 
+    def _add_languages_translations(self, translations, strip=True):
+        # translations of a message which are not the same for all
+        # languages are replaced by a placeholder, so the output lines
+        # are built once and rendered for each language at the end
+        if len(set(translations)) == 1:
+            return translations[0]
+
+        # newlines at the end of all translations are kept out of the
+        # placeholder, as they are stripped by some blocks
+        newlines = min(
+            len(translation) - len(translation.rstrip('\n'))
+            for translation in translations
+        )
+        if newlines:
+            translations = tuple(
+                translation[:-newlines] for translation in translations
+            )
+        self._languages_translations.append((translations, strip))
+        placeholder = self._languages_placeholder
+        index = len(self._languages_translations) - 1
+        return f'{placeholder}{index}{placeholder}' + '\n' * newlines
+
+    def _rstrip_current_line_newlines(self):
+        self.current_line = self.current_line.rstrip('\n')
+        if (
+            self.languages is not None
+            and self.current_line.endswith(self._languages_placeholder)
+        ):
+            # newlines at the end of the translations of the placeholder
+            index = int(
+                self.current_line.rsplit(self._languages_placeholder, 2)[1],
+            )
+            translations, strip = self._languages_translations[index]
+            self._languages_translations[index] = (
+                tuple(translation.rstrip('\n') for translation in translations),
+                strip,
+            )
+
+    def _render_outputline(self, line, lang_index):
+        parts = self._languages_placeholder_re.split(line)
+        if len(parts) == 1:
+            return line
+        for i in range(1, len(parts), 2):
+            translations, strip = self._languages_translations[int(parts[i])]
+            parts[i] = translations[lang_index]
+        line = ''.join(parts)
+        if strip and not parts[-1]:
+            # as done saving the line, see ``_save_current_line``
+            line = line.rstrip(' \v\x0b\f\x0c')  # noqa: B005
+        return line
+
     def _save_current_msgid(self):
         # raise 'msgid' event
         if raise_skip_event(
@@ -410,27 +857,61 @@ class Po2Md:
 
         if (not self.disable and not self.disable_next_block) or \
                 self.enable_next_block:
-            translation = self._translate_msgid(
-                self.current_msgid,
-                self.current_msgctxt,
-                self.current_tcomment,
-            )
+            if self.languages is None:
+                translation = self._layout_translation(
+                    self._translate_msgid(
+                        self.current_msgid,
+                        self.current_msgctxt,
+                        self.current_tcomment,
+                    ),
+                )
+            else:
+                translations = []
+                for lang in self.languages:
+                    translation = self._layout_translation(
+                        self._translate_msgid(
+                            self.current_msgid,
+                            self.current_msgctxt,
+                            self.current_tcomment,
+                            lang=lang,
+                        ),
+                    )
+                    translations.append(
+                        translation if translation.rstrip('\n') else '',
+                    )
+                translation = self._add_languages_translations(
+                    tuple(translations),
+                )
         else:
             translation = self.current_msgid
             self.disabled_entries.append(
-                polib.POEntry(
-                    msgid=translation,
-                    msgstr='',
-                    msgctxt=self.current_msgctxt,
-                    tcomment=self.current_tcomment,
+                EntryRecord(
+                    translation,
+                    '',
+                    self.current_msgctxt,
+                    self.current_tcomment,
                 ),
             )
+            translation = self._layout_translation(translation)
+
+        if translation.rstrip('\n'):
+            self.current_line += translation
+
+        self.current_msgid = ''
+        self.current_msgctxt = None
+        self.current_tcomment = None
+
+        self.disable_next_block = False
+        self.enable_next_block = False
+
+        self._codespan_inside_current_msgid = False
+        self._aimg_title_inside_current_msgid = False
 
+    def _layout_translation(self, translation):
         if self._inside_indented_codeblock:
-            new_translation = ''
-            for line in translation.splitlines():
-                new_translation += f'    {line}\n'
-            translation = new_translation
+            translation = ''.join([
+                f'    {line}\n' for line in translation.splitlines()
+            ])
         else:
             first_line_width_diff = 0
             if self._inside_liblock or self._inside_quoteblock:
@@ -446,7 +927,7 @@ class Po2Md:
             #
             # Only execute it for text outside tables
             if not self._inside_codeblock and not self._current_thead_aligns:
-                translation = md_ulb_pwrap.ulb_wrap_paragraph(
+                translation = _wrap_paragraph(
                     translation,
                     self.wrapwidth,
                     self.wrapwidth + first_line_width_diff,
@@ -458,19 +939,7 @@ class Po2Md:
                     self._inside_quoteblock,
                 ]):
                     translation += '\n'
-
-        if translation.rstrip('\n'):
-            self.current_line += translation
-
-        self.current_msgid = ''
-        self.current_msgctxt = None
-        self.current_tcomment = None
-
-        self.disable_next_block = False
-        self.enable_next_block = False
-
-        self._codespan_inside_current_msgid = False
-        self._aimg_title_inside_current_msgid = False
+        return translation
 
     def _save_current_line(self):
         # strip all spaces according to unicodedata database ignoring newlines,
@@ -619,13 +1088,17 @@ class Po2Md:
                 self._save_current_line()
 
         elif block is md4c.BlockType.CODE:
-            self._save_current_msgid()
-            self._inside_codeblock = False
-
             indent = ''
             if self._inside_liblock:
                 indent += '   ' * len(self._current_list_type)
-            self.current_line = self.current_line.rstrip('\n')
+            if self._codeblock_texts:
+                self.current_line += indent
+                self.current_msgid += ''.join(self._codeblock_texts)
+                self._codeblock_texts = []
+            self._save_current_msgid()
+            self._inside_codeblock = False
+
+            self._rstrip_current_line_newlines()
             self._save_current_line()
             if not self._inside_indented_codeblock:
                 fence_chars = details['fence_char'] * 3
@@ -709,6 +1182,13 @@ class Po2Md:
                 self.current_line = self.current_line.rstrip('\n')
             self._inside_htmlblock[0] = False
 
+    def _link_reference_target(self, href, title):
+        # link references are parsed only once per content, the first time
+        # that a link or an image is found
+        if self.link_references is None:
+            self.link_references = parse_link_references(self.content)
+        return find_link_reference_target(self.link_references, href, title)
+
     def enter_span(self, span, details):
         # raise 'enter_span' event
         if raise_skip_event(
@@ -728,35 +1208,16 @@ class Po2Md:
 
         if span is md4c.SpanType.A:
             self._inside_aspan = True
-
-            if self.link_references is None:
-                self.link_references = parse_link_references(self.content)
-
             self._current_aspan_href = details['href'][0][1]
-            self._current_aspan_ref_target = None
-
-            if details['title']:
-                current_aspan_title = details['title'][0][1]
-                for target, href, title in self.link_references:
-                    if (
-                        href == self._current_aspan_href
-                        and title == current_aspan_title
-                    ):
-                        self._current_aspan_ref_target = target
-                        break
-            else:
-                for target, href, _ in self.link_references:
-                    if href == self._current_aspan_href:
-                        self._current_aspan_ref_target = target
-                        break
+            self._current_aspan_ref_target = self._link_reference_target(
+                self._current_aspan_href,
+                details['title'][0][1] if details['title'] else None,
+            )
         elif span is md4c.SpanType.CODE:
             self._inside_codespan = True
             self._codespan_start_index = len(self.current_msgid) - 1
             self._codespan_inside_current_msgid = True
         elif span is md4c.SpanType.IMG:
-            if self.link_references is None:
-                self.link_references = parse_link_references(self.content)
-
             self._current_imgspan['title'] = '' if not details['title'] \
                 else details['title'][0][1]
             self._current_imgspan['src'] = details['src'][0][1]
@@ -827,19 +1288,15 @@ class Po2Md:
             )
             self._codespan_backticks = None
         elif span is md4c.SpanType.IMG:
-            referenced_target, imgspan_title = (None, None)
             imgspan_src = details['src'][0][1]
-            if details['title']:
-                imgspan_title = polib.escape(details['title'][0][1])
-                for target, href, title in self.link_references:
-                    if href == imgspan_src and title == imgspan_title:
-                        referenced_target = target
-                        break
-            else:
-                for target, href, _ in self.link_references:
-                    if href == imgspan_src:
-                        referenced_target = target
-                        break
+            imgspan_title = (
+                polib.escape(details['title'][0][1]) if details['title']
+                else None
+            )
+            referenced_target = self._link_reference_target(
+                imgspan_src,
+                imgspan_title,
+            )
 
             alt_text = self._current_imgspan['text']
             img_markup = f'![{alt_text}]'
@@ -925,11 +1382,8 @@ class Po2Md:
                     return
                 self.current_msgid += text
             else:
-                if self._inside_liblock:
-                    indent = '   ' * len(self._current_list_type)
-                    if self.current_line[:len(indent) + 1] != indent:
-                        self.current_line += indent
-                self.current_msgid += text
+                # joined and indented inside list items when the block ends
+                self._codeblock_texts.append(text)
         elif not self._process_command(text):
             self.current_line += text
 
@@ -957,58 +1411,222 @@ class Po2Md:
 
                 msgid = f'[{target}]:{href_title}'
                 self.outputlines.append(
-                    self._translate_msgid(msgid, None, None),
+                    self._translate_msgid(msgid, None, None)
+                    if self.languages is None
+                    else self._add_languages_translations(
+                        tuple(
+                            self._translate_msgid(msgid, None, None, lang=lang)
+                            for lang in self.languages
+                        ),
+                        strip=False,
+                    ),
                 )
                 added_references.append(href_title)
             self.outputlines.append('')
 
-    def translate(
-        self,
-        filepath_or_content,
-        save=None,
-        md_encoding='utf-8',
-    ):
-        self.content = to_file_content_if_is_file(
-            filepath_or_content,
-            encoding=md_encoding,
-        )
-
-        self.translations, self.translations_with_msgctxt = (
-            pofiles_to_unique_translations_dicts(self.pofiles)
-        )
-
+    def _parse(self, content):
         parser = md4c.GenericParser(
             0,
             **dict.fromkeys(self.extensions, True),
         )
         parser.parse(
-            self.content,
-            self.enter_block,
-            self.leave_block,
-            self.enter_span,
-            self.leave_span,
-            self.text,
+            content,
+            *(
+                self.profile.wrap(
+                    'event callbacks', callback, counter=counter,
+                )
+                for callback, counter in (
+                    (self.enter_block, 'blocks'),
+                    (self.leave_block, None),
+                    (self.enter_span, 'spans'),
+                    (self.leave_span, None),
+                    (self.text, 'texts'),
+                )
+            ),
         )
-        self._append_link_references()  # add link references to the end
 
-        self.disable_next_block = False
-        self.disable = False
-        self.enable_next_block = False
-        self.link_references = None
+    def _translate_chunks_in_parallel(self):
+        # events can depend on the state of the translator along the whole
+        # content, so are not supported translating in parallel
+        if (
+            self.workers < 2  # noqa: PLR2004
+            or self.events
+            or self.languages is not None
+        ):
+            return False
+
+        chunks, definitions = split_in_chunks(
+            self.content,
+            max(
+                self.parallel_chunk_lines,
+                self.content.count('\n') // (
+                    self.workers * _PARALLEL_CHUNKS_PER_WORKER
+                ),
+            ),
+            command_aliases=self.command_aliases,
+            disable=self.disable,
+            extensions=self.extensions,
+        )
+        if len(chunks) < 2:  # noqa: PLR2004
+            return False
 
-        self.output = '\n'.join(self.outputlines)
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(chunks)),
+            initializer=_init_chunk_worker,
+            initargs=(
+                self._options,
+                self.translations,
+                self.translations_with_msgctxt,
+                self.content,
+                definitions,
+                self.profile.enabled,
+            ),
+        ) as executor:
+            results = list(executor.map(_translate_chunk, chunks))
+
+        for (*_, disable, _, _), (_, _, next_disable) in zip(
+            results,
+            chunks[1:],
+        ):
+            if disable is None or disable != next_disable:
+                return False
+
+        for (
+            outputlines,
+            translated_entries,
+            disabled_entries,
+            _,
+            link_references_parsed,
+            counters,
+        ) in results:
+            self.outputlines.extend(outputlines)
+            self.translated_entries.extend(translated_entries)
+            self.disabled_entries.extend(disabled_entries)
+            if link_references_parsed and self.link_references is None:
+                self.link_references = parse_link_references(self.content)
+            if counters:
+                for name, value in counters.items():
+                    self.profile.count(name, value)
+        self.profile.count('parallel chunks', len(chunks))
+        return True
 
-        if save:
-            if self._saved_files_changed is False:
-                self._saved_files_changed = save_file_checking_file_changed(
-                    save,
-                    self.output,
-                    encoding=md_encoding,
+    def translate(
+        self,
+        filepath_or_content,
+        save=None,
+        md_encoding='utf-8',
+    ):
+        with self.profile.phase('Markdown reading'):
+            self.content = to_file_content_if_is_file(
+                filepath_or_content,
+                encoding=md_encoding,
+            )
+        if self.profile.enabled:
+            if self.content is not filepath_or_content:
+                self.profile.count(
+                    'bytes read',
+                    os.path.getsize(filepath_or_content),
+                )
+            wrap_cache_hits = wrap_cache_info().hits
+
+        with self.profile.phase('merging'):
+            if self.catalog is not None:
+                if self._catalog_owned and self.catalog.closed:
+                    self.catalog = CatalogStore(self.catalog.filepath)
+                self.translations = self.catalog.translations
+                self.translations_with_msgctxt = (
+                    self.catalog.translations_with_msgctxt
+                )
+            elif self.languages is None:
+                self.translations, self.translations_with_msgctxt = (
+                    pofiles_to_unique_translations_dicts(self.pofiles)
                 )
             else:
-                with open(save, 'w', encoding=md_encoding) as f:
-                    f.write(self.output)
-        return self.output
+                self.translations, self.translations_with_msgctxt = {}, {}
+                for lang, pofiles in self.pofiles.items():
+                    (
+                        self.translations[lang],
+                        self.translations_with_msgctxt[lang],
+                    ) = pofiles_to_unique_translations_dicts(pofiles)
+
+                if self._languages_placeholder is None:
+                    # character not found in the content to delimit
+                    # the placeholders of the translations
+                    self._languages_placeholder = next(
+                        char for char in itertools.chain(
+                            '\x00',
+                            map(chr, range(0xE000, 0xF900)),
+                        ) if char not in self.content
+                    )
+                    self._languages_placeholder_re = re.compile(
+                        f'{self._languages_placeholder}(\\d+)'
+                        f'{self._languages_placeholder}',
+                    )
+
+        try:
+            with self.profile.phase('md4c parsing'):
+                if not self._translate_chunks_in_parallel():
+                    self._parse(self.content)
+            with self.profile.phase('event callbacks'):
+                self._append_link_references()  # add link references to the end
+
+            self.disable_next_block = False
+            self.disable = False
+            self.enable_next_block = False
+            self.link_references = None
+
+            with self.profile.phase('serialization'):
+                if self.languages is None:
+                    self.output = '\n'.join(self.outputlines)
+                else:
+                    self.output = {
+                        lang: '\n'.join([
+                            self._render_outputline(line, lang_index)
+                            for line in self.outputlines
+                        ])
+                        for lang_index, lang in enumerate(self.languages)
+                    }
+
+            if save:
+                with self.profile.phase('writing'):
+                    for filepath, output in (
+                        ((save, self.output),) if self.languages is None
+                        else ((save[lang], self.output[lang]) for lang in save)
+                    ):
+                        if self._saved_files_changed is False:
+                            self._saved_files_changed = (
+                                save_file_checking_file_changed(
+                                    filepath,
+                                    output,
+                                    encoding=md_encoding,
+                                )
+                            )
+                        else:
+                            with open(filepath, 'w', encoding=md_encoding) as f:
+                                f.write(output)
+
+            if self.profile.enabled:
+                self.profile.count(
+                    'wrap cache hits',
+                    wrap_cache_info().hits - wrap_cache_hits,
+                )
+                if save:
+                    for output in (
+                        (self.output,) if self.languages is None
+                        else (self.output[lang] for lang in save)
+                    ):
+                        self.profile.count(
+                            'bytes written',
+                            len(output.encode(md_encoding)),
+                        )
+            return self.output
+        finally:
+            if self._catalog_owned:
+                self.catalog.close()
+            if self._debug_tracer is not None:
+                self._debug_tracer.flush()
 
 
 def pofile_to_markdown(
@@ -1032,15 +1650,18 @@ def pofile_to_markdown(
 
     Args:
         filepath_or_content (str): Markdown filepath or content to translate.
-        pofiles (str, list): Glob or list of globs matching a set of PO files
-            from where to extract messages to make the replacements translating
-            strings.
+        pofiles (str, list, dict): Glob or list of globs matching a set of PO
+            files from where to extract messages to make the replacements
+            translating strings. A mapping of languages to globs can be passed
+            to translate the content to multiple languages parsing it once.
         ignore (list): Paths of PO files to ignore. Useful when a glob does not
             fit your requirements indicating the files to extract content.
             Also, filename or a dirname can be defined without indicate the
-            full path.
-        save (str): Saves the output content in file whose path is specified
-            at this parameter.
+            full path. Gitignore-style patterns are supported, see
+            :py:class:`mdpo.io.IgnoreRules`.
+        save (str, dict): Saves the output content in file whose path is
+            specified at this parameter. If ``pofiles`` is a mapping of
+            languages, must be a mapping of languages to file paths.
         md_encoding (str): Markdown content encoding.
         po_encoding (str): PO files encoding. If you need different encodings
             for each file, you must define it in the "Content-Type" field of
@@ -1080,12 +1701,14 @@ def pofile_to_markdown(
             You can also define the location of these functions by strings
             with the syntax ``path/to/file.py::function_name``.
         debug (bool): Add events displaying all parsed elements in the
-            translation process.
+            translation process. A :py:class:`mdpo.event.DebugTracer` can
+            be passed to filter, sample or write the events to a file.
         **kwargs: Extra arguments passed to
             :py:class:`mdpo.po2md.Po2Md` constructor.
 
     Returns:
-        str: Markdown output file with translated content.
+        str: Markdown output file with translated content. If ``pofiles`` is
+        a mapping of languages, a mapping of languages to outputs.
     """
     return Po2Md(
         pofiles,
@@ -1101,3 +1724,23 @@ def pofile_to_markdown(
         save=save,
         md_encoding=md_encoding,
     )
+
+
+async def apofile_to_markdown(
+    *args,
+    executor=None,
+    semaphore=None,
+    **kwargs,
+):
+    """Asynchronous version of :py:func:`pofile_to_markdown`.
+
+    Takes the same arguments, plus ``executor`` and ``semaphore`` as
+    described in :py:func:`mdpo.io.run_in_executor`.
+    """
+    return await run_in_executor(
+        pofile_to_markdown,
+        *args,
+        executor=executor,
+        semaphore=semaphore,
+        **kwargs,
+    )
@@ -28,7 +28,10 @@ def poentry__cmp__(
     """
     if compare_obsolete and self.obsolete != other.obsolete:
         return -1 if self.obsolete else 1
-    if compare_occurrences:
+    if compare_occurrences and self.occurrences != other.occurrences:
+        # equal lists are equal sorted, so they are only sorted if differ,
+        # which is expensive for entries with a lot of occurrences
+        #
         # `.copy` is an equivalent for full slice [:], but is faster
         # `.copy` doesn't exists for lists in Python2 so for this reason,
         # this change has not been introduced in polib
@@ -0,0 +1,180 @@
+"""Per-phase timings and counters of mdpo implementations."""
+
+import time
+
+
+class _Phase:
+    __slots__ = ('_profile', '_name')
+
+    def __init__(self, profile, name):
+        self._profile = profile
+        self._name = name
+
+    def __enter__(self):
+        self._profile._enter(self._name)
+
+    def __exit__(self, *exc_info):
+        self._profile._exit()
+
+
+class Profile:
+    """Wall times spent by an implementation in each phase and counters.
+
+    Phases can be nested, in which case the time spent in the inner phase
+    is not accounted to the outer one. For example, the time spent in
+    event callbacks is not included in the md4c parsing time.
+
+    Counters store the number of parsed blocks, spans and texts, the number
+    of msgids extracted or translated, the bytes read and written, etc.
+    The same profile can be passed to multiple implementations to
+    accumulate their measurements.
+
+    Example:
+        .. code-block:: python
+
+           profile = Profile()
+           Md2Po('README.md', profile=profile).extract()
+           print(profile.summary())
+           print(profile.as_dict()['counters']['blocks'])
+    """
+
+    __slots__ = ('timings', 'counters', '_stack', '_last')
+
+    #: bool: Indicates to implementations that they must take measurements.
+    enabled = True
+
+    def __init__(self):
+        #: dict: Seconds spent in each phase, in order of first execution.
+        self.timings = {}
+
+        #: dict: Counters values, in order of first increment.
+        self.counters = {}
+
+        self._stack = []
+        self._last = None
+
+    def _enter(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            self._add(self._stack[-1], now - self._last)
+        self._stack.append(name)
+        self._last = now
+
+    def _exit(self):
+        now = time.perf_counter()
+        self._add(self._stack.pop(), now - self._last)
+        self._last = now
+
+    def _add(self, name, seconds):
+        self.timings[name] = self.timings.get(name, 0) + seconds
+
+    def count(self, name, value=1):
+        """Increment a counter.
+
+        Args:
+            name (str): Name of the counter.
+            value (int): Value to add to the counter.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def phase(self, name):
+        """Context manager that accounts the time spent inside to a phase.
+
+        Args:
+            name (str): Name of the phase.
+        """
+        return _Phase(self, name)
+
+    def wrap(self, name, func, counter=None):
+        """Wrap a function accounting the time spent calling it to a phase.
+
+        Args:
+            name (str): Name of the phase.
+            func (function): Function to wrap.
+            counter (str): If defined, counter incremented each time that
+                the function is called.
+
+        Returns:
+            function: Wrapped function.
+        """
+        phase = _Phase(self, name)
+
+        if counter is None:
+            def wrapper(*args):
+                with phase:
+                    return func(*args)
+        else:
+            counters = self.counters
+            counters.setdefault(counter, 0)
+
+            def wrapper(*args):
+                counters[counter] += 1
+                with phase:
+                    return func(*args)
+        return wrapper
+
+    def as_dict(self):
+        """Return the measurements as a dictionary, suitable to export them.
+
+        Returns:
+            dict: Dictionary with ``timings`` and ``counters`` keys.
+        """
+        return {
+            'timings': dict(self.timings),
+            'counters': dict(self.counters),
+        }
+
+    def summary(self):
+        """Build a table with the timings of all phases.
+
+        Returns:
+            str: Table with seconds and percentage of the total time spent
+            in each phase, followed by the values of the counters.
+        """
+        total = sum(self.timings.values())
+        name_width = max([len(name) for name in self.timings] + [5])
+        lines = [f'{"phase":<{name_width}}  {"seconds":>9}  {"%":>6}']
+        for name, seconds in [*self.timings.items(), ('total', total)]:
+            percent = seconds * 100 / total if total else 0
+            lines.append(
+                f'{name:<{name_width}}  {seconds:>9.4f}  {percent:>6.2f}',
+            )
+        if self.counters:
+            name_width = max(len(name) for name in self.counters)
+            lines.append('')
+            lines.extend(
+                f'{name:<{name_width}}  {value:>9}'
+                for name, value in self.counters.items()
+            )
+        return '\n'.join(lines) + '\n'
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class _NullProfile:
+    """Profile that doesn't measure anything, used when profiling is off."""
+
+    __slots__ = ()
+
+    enabled = False
+    _phase = _NullPhase()
+
+    def count(self, name, value=1):
+        pass
+
+    def phase(self, name):  # noqa: ARG002
+        return self._phase
+
+    def wrap(self, name, func, counter=None):  # noqa: ARG002
+        return func
+
+
+NULL_PROFILE = _NullProfile()
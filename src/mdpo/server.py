@@ -0,0 +1,239 @@
+"""Long-running mdpo server to amortize startup and PO files loading.
+
+The server listens on a Unix socket and executes the command line interfaces
+in the same process, so imports, caches and PO files are kept in memory
+between executions. Start it with ``mdpo serve`` and define the environment
+variable ``MDPO_SERVER_SOCKET`` with the path to its socket to make the
+command line interfaces forward their executions to it.
+
+Requests and responses are JSON objects sent through the socket. A request
+defines the ``program`` to execute, its ``args``, the working directory
+``cwd`` and, optionally, the ``stdin`` content. The response contains the
+``exitcode`` and the ``stdout`` and ``stderr`` outputs of the execution.
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import sys
+
+
+#: tuple: Command line interfaces that can be executed by the server.
+PROGRAMS = ('md2po', 'po2md', 'md2po2md', 'mdpo2html')
+
+#: str: Environment variable that defines the socket of a running server.
+SOCKET_ENV_VAR = 'MDPO_SERVER_SOCKET'
+
+
+def _check_unix_sockets_support():
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        raise OSError('Unix sockets are not supported in this platform')
+
+
+def default_socket_path():
+    """Return the path of the socket used by default by the server.
+
+    Returns:
+        str: Value of the environment variable ``MDPO_SERVER_SOCKET`` if
+        defined, or a user specific path in the temporary directory.
+
+    Raises:
+        OSError: Unix sockets are not supported in this platform.
+    """
+    import tempfile
+
+    _check_unix_sockets_support()
+    return os.environ.get(SOCKET_ENV_VAR) or os.path.join(
+        tempfile.gettempdir(),
+        f'mdpo-{os.getuid()}.sock',
+    )
+
+
+class _Stdin(io.StringIO):
+    """STDIN of a request, which is a TTY if no content has been sent."""
+
+    def __init__(self, content):
+        super().__init__(content or '')
+        self._isatty = content is None
+
+    def isatty(self):
+        return self._isatty
+
+
+def execute_request(request):
+    """Execute a command line interface as defined by a request.
+
+    Args:
+        request (dict): Request with ``program``, ``args``, ``cwd`` and
+            optionally ``stdin`` keys.
+
+    Returns:
+        dict: Response with ``exitcode``, ``stdout`` and ``stderr`` keys.
+    """
+    program = request.get('program')
+    if program not in PROGRAMS:
+        return {
+            'exitcode': 1,
+            'stdout': '',
+            'stderr': f"Unknown program '{program}'\n",
+        }
+    cli = importlib.import_module(f'mdpo.entrypoints.{program}')
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    original_stdin, original_cwd = sys.stdin, os.getcwd()
+    sys.stdin = _Stdin(request.get('stdin'))
+    try:
+        os.chdir(request.get('cwd') or original_cwd)
+        with contextlib.redirect_stdout(stdout), \
+                contextlib.redirect_stderr(stderr):
+            try:
+                result = cli.run(request.get('args', []))
+            except SystemExit as exc:
+                exitcode = exc.code if isinstance(exc.code, int) else (
+                    0 if exc.code is None else 1
+                )
+            except Exception:  # noqa: BLE001
+                import traceback
+
+                traceback.print_exc(file=sys.stderr)
+                exitcode = 1
+            else:
+                exitcode = result if isinstance(result, int) else result[1]
+    finally:
+        sys.stdin = original_stdin
+        os.chdir(original_cwd)
+    return {
+        'exitcode': exitcode,
+        'stdout': stdout.getvalue(),
+        'stderr': stderr.getvalue(),
+    }
+
+
+def create_server(socket_path):
+    """Create a server listening on a Unix socket.
+
+    Requests are executed one by one, because command line interfaces
+    redirect the standard streams and change the working directory. PO files
+    are cached while they are not modified, as the files discovered by globs
+    while their directories are not modified.
+
+    Args:
+        socket_path (str): Path to the socket.
+
+    Returns:
+        :py:class:`socketserver.UnixStreamServer`: Server, not started yet.
+        Its socket is only accessible by the current user.
+
+    Raises:
+        OSError: Unix sockets are not supported in this platform or a server
+            is already listening on the socket.
+    """
+    import json
+    import socketserver
+
+    from mdpo.io import enable_files_cache
+    from mdpo.po import enable_pofiles_cache
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            response = execute_request(json.loads(self.rfile.read()))
+            self.wfile.write(json.dumps(response).encode('utf-8'))
+
+    _check_unix_sockets_support()
+    if os.path.exists(socket_path):
+        if send_request(socket_path, {'program': None}) is not None:
+            raise OSError(f"A server is already listening on '{socket_path}'")
+        os.remove(socket_path)  # stale socket of a stopped server
+
+    server = socketserver.UnixStreamServer(socket_path, RequestHandler)
+    # requests execute commands as the user running the server
+    os.chmod(socket_path, 0o600)
+
+    enable_pofiles_cache()
+    enable_files_cache()
+    return server
+
+
+def serve(socket_path=None):
+    """Start a server and serve requests until interrupted.
+
+    Args:
+        socket_path (str): Path to the socket. If not defined,
+            :py:func:`default_socket_path` is used.
+    """
+    socket_path = socket_path or default_socket_path()
+    server = create_server(socket_path)
+    sys.stderr.write(f'mdpo server listening on {socket_path}\n')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(socket_path)
+
+
+def send_request(socket_path, request):
+    """Send a request to a server.
+
+    Args:
+        socket_path (str): Path to the socket of the server.
+        request (dict): Request to send.
+
+    Returns:
+        dict: Response of the server or ``None`` if it is not available.
+    """
+    import json
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode('utf-8'))
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except (OSError, AttributeError):  # AttributeError: AF_UNIX unsupported
+        return None
+    return json.loads(b''.join(chunks)) if chunks else None
+
+
+def forward_to_server(program, args):
+    """Execute a command line interface in a server, if available.
+
+    The server is only used if the environment variable
+    ``MDPO_SERVER_SOCKET`` is defined.
+
+    Args:
+        program (str): Command line interface name.
+        args (list): Command line arguments.
+
+    Returns:
+        int: Exit code of the execution or ``None`` if no server is
+        available, in which case the command line interface must be
+        executed in the current process.
+    """
+    socket_path = os.environ.get(SOCKET_ENV_VAR)
+    if not socket_path:
+        return None
+
+    stdin = None if sys.stdin.isatty() else sys.stdin.read()
+    response = send_request(
+        socket_path,
+        {'program': program, 'args': args, 'cwd': os.getcwd(), 'stdin': stdin},
+    )
+    if response is None:
+        if stdin is not None:
+            # already consumed, so is restored for the local execution
+            sys.stdin = _Stdin(stdin)
+        return None
+    sys.stdout.write(response['stdout'])
+    sys.stderr.write(response['stderr'])
+    return response['exitcode']
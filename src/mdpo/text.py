@@ -1,6 +1,8 @@
 """Text utilities for mdpo."""
 
+import functools
 import os
+import re
 import sys
 
 
@@ -36,30 +38,24 @@ def min_not_max_chars_in_a_row(char, text, default=1):
     Returns:
         int: Minimum number possible of characters not found in a row.
     """
-    in_a_rows, _current_in_a_row, _in_the_row = ([], 0, False)
-    for ch in text:
-        if ch == char:
-            _current_in_a_row += 1
-            _in_the_row = True
-        elif _in_the_row:
-            _in_the_row = False
-            if _current_in_a_row not in in_a_rows:
-                in_a_rows.append(_current_in_a_row)
-            _current_in_a_row = 0
-    if _in_the_row and _current_in_a_row not in in_a_rows:
-        in_a_rows.append(_current_in_a_row)
-
-    if in_a_rows:
-        response = None
-        for n in range(1, max(in_a_rows) + 2):
-            if n not in in_a_rows:
-                response = n
-                break
-    else:
-        response = default
+    # the character can't be found in a row if it is not in the text
+    if len(char) != 1 or char not in text:
+        return default
+
+    in_a_rows = {
+        len(match) for match in _chars_in_a_row_regex(char).findall(text)
+    }
+    response = 1
+    while response in in_a_rows:
+        response += 1
     return response
 
 
+@functools.lru_cache(maxsize=None)
+def _chars_in_a_row_regex(char):
+    return re.compile(f'{re.escape(char)}+')
+
+
 def parse_escaped_pair(value, separator=':'):
     r"""Escapes a pair key-value separated by a character.
 
@@ -75,9 +71,7 @@ def parse_escaped_pair(value, separator=':'):
     Returns:
         tuple: Parsed key-value pair.
     """
-    import re
-    splits = re.split(
-        re.compile(fr'([^\\]{separator})'),
+    splits = _escaped_separator_regex(separator).split(
         value.lstrip('\\'),
         maxsplit=1,
     )
@@ -89,6 +83,11 @@ def parse_escaped_pair(value, separator=':'):
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _escaped_separator_regex(separator):
+    return re.compile(fr'([^\\]{separator})')
+
+
 def parse_escaped_pairs(pairs, separator=':'):
     r"""Escapes multiples pairs key-value separated by a character.
 
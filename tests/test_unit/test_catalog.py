@@ -0,0 +1,150 @@
+import glob
+import os
+import pickle
+
+import pytest
+
+from mdpo.catalog import (
+    CatalogStore,
+    pofiles_to_catalog_store,
+    write_catalog_store,
+)
+from mdpo.mdpo2html import MdPo2HTML, markdown_pofile_to_html
+from mdpo.po2md import Po2Md, pofile_to_markdown
+
+
+EXAMPLES_DIR = os.path.join(
+    os.path.abspath(os.path.dirname(__file__)),
+    'test_po2md',
+    'translate-examples',
+)
+
+TRANSLATIONS = {
+    'Foo': 'Foo es',
+    'Ñandú': 'Ñandú es',
+    'Untranslated': '',
+    **{f'Message {i}': f'Mensaje {i}' for i in range(100)},
+}
+
+TRANSLATIONS_WITH_MSGCTXT = {
+    'context': {'Foo': 'Foo context es'},
+    'contexto': {'Bar': 'Bar contexto es'},
+}
+
+
+def test_catalog_store(tmp_file_path):
+    filepath = tmp_file_path('.catalog')
+    with write_catalog_store(
+        filepath,
+        TRANSLATIONS,
+        TRANSLATIONS_WITH_MSGCTXT,
+    ) as catalog:
+        assert catalog.translations['Foo'] == 'Foo es'
+        assert catalog.translations['Ñandú'] == 'Ñandú es'
+        assert catalog.translations['Untranslated'] == ''
+        assert catalog.translations.get('Bar') is None
+        with pytest.raises(KeyError):
+            catalog.translations['Bar']
+        assert dict(catalog.translations) == TRANSLATIONS
+
+        assert catalog.translations_with_msgctxt['context']['Foo'] == (
+            'Foo context es'
+        )
+        with pytest.raises(KeyError):
+            catalog.translations_with_msgctxt['context']['Bar']
+        with pytest.raises(KeyError):
+            catalog.translations_with_msgctxt['other']
+        assert {
+            msgctxt: dict(translations) for msgctxt, translations
+            in catalog.translations_with_msgctxt.items()
+        } == TRANSLATIONS_WITH_MSGCTXT
+
+        # pickled by path
+        unpickled = pickle.loads(pickle.dumps(catalog.translations))
+        assert len(pickle.dumps(catalog)) < 100 + len(filepath)
+        assert unpickled['Message 42'] == 'Mensaje 42'
+    os.remove(filepath)
+
+
+@pytest.mark.parametrize(
+    'content',
+    ('Not a catalog store file', 'MDPO', ''),
+    ids=('invalid', 'shorter-than-header', 'empty'),
+)
+def test_catalog_store_invalid_file(content, tmp_file):
+    with tmp_file(content, '.catalog') as filepath, \
+            pytest.raises(ValueError, match='is not a catalog store file'):
+        CatalogStore(filepath)
+
+
+def test_catalog_store_translate(tmp_file_path):
+    filepath = tmp_file_path('.catalog')
+    for md_filepath in sorted(glob.glob(os.path.join(EXAMPLES_DIR, '*.md'))):
+        if md_filepath.endswith('.expect.md'):
+            continue
+        po_filepath = os.path.splitext(md_filepath)[0] + '.po'
+
+        with pofiles_to_catalog_store(po_filepath, filepath):
+            for kwargs in ({}, {'workers': 2, 'parallel_chunk_lines': 1}):
+                assert pofile_to_markdown(
+                    md_filepath,
+                    [],
+                    catalog=filepath,
+                    **kwargs,
+                ) == pofile_to_markdown(md_filepath, po_filepath)
+    os.remove(filepath)
+
+
+def test_catalog_store_mdpo2html(tmp_file, tmp_file_path):
+    pofile_content = '''#
+msgid ""
+msgstr ""
+
+msgid "Some text with a [link][ref]"
+msgstr "Algo de texto con un [enlace][ref]"
+
+msgid "[ref]: https://example.com"
+msgstr "[ref]: https://example.es"
+'''
+    html_content = (
+        '<p>Some text with a <a href="https://example.com">link</a></p>\n'
+    )
+    filepath = tmp_file_path('.catalog')
+    with tmp_file(pofile_content, '.po') as po_filepath, \
+            pofiles_to_catalog_store(po_filepath, filepath) as catalog:
+        output = markdown_pofile_to_html(html_content, [], catalog=catalog)
+        assert output == markdown_pofile_to_html(html_content, po_filepath)
+    assert 'https://example.es' in output
+    os.remove(filepath)
+
+
+@pytest.mark.parametrize(
+    ('translator_class', 'content', 'expected_output'),
+    (
+        (Po2Md, 'Foo\n', 'Foo es\n'),
+        (MdPo2HTML, '<p>Foo</p>', '<p>Foo es</p>'),
+    ),
+    ids=('po2md', 'mdpo2html'),
+)
+def test_catalog_store_ownership(
+    translator_class,
+    content,
+    expected_output,
+    tmp_file_path,
+):
+    filepath = tmp_file_path('.catalog')
+    with write_catalog_store(filepath, TRANSLATIONS, {}) as catalog:
+        # stores opened from paths are closed after each translation
+        translator = translator_class([], catalog=filepath)
+        assert translator.translate(content) == expected_output
+        assert translator.catalog.closed
+        # and reopened by the next ones
+        assert translator.translate(content).endswith(expected_output)
+        assert translator.catalog.closed
+
+        # stores passed as objects are owned by the caller
+        translator = translator_class([], catalog=catalog)
+        assert translator.translate(content) == expected_output
+        assert not catalog.closed
+    assert catalog.closed
+    os.remove(filepath)
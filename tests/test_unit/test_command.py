@@ -7,6 +7,7 @@ from mdpo.command import (
     normalize_mdpo_command,
     normalize_mdpo_command_aliases,
     parse_mdpo_html_command,
+    resolve_mdpo_html_command,
 )
 
 
@@ -40,6 +41,28 @@ def test_parse_mdpo_html_command(value, expected_command, expected_comment):
     assert comment == expected_comment
 
 
+@pytest.mark.parametrize(
+    ('value', 'expected_result'), (
+        ('Not a comment', (None, None, None)),
+        ('<!-- -->', (None, None, None)),
+        (
+            '<!-- mdpo-enable -->',
+            ('mdpo-enable', None, 'mdpo-enable'),
+        ),
+        ('<!-- on -->', ('mdpo-enable', None, 'on')),
+        (
+            '<p>Text</p><!-- ctx Some context -->',
+            ('mdpo-context', 'Some context', 'ctx'),
+        ),
+    ),
+)
+def test_resolve_mdpo_html_command(value, expected_result):
+    command_aliases = {'on': 'mdpo-enable', 'ctx': 'mdpo-context'}
+    assert resolve_mdpo_html_command(
+        value, command_aliases,
+    ) == expected_result
+
+
 @pytest.mark.parametrize(
     ('value', 'expected_command'), (
         ('include-codeblock', 'mdpo-include-codeblock'),
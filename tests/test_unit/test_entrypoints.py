@@ -0,0 +1,59 @@
+"""Tests for the startup of mdpo command line interfaces."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+PARSING_STACK_MODULES = {
+    'html.parser',
+    'md4c',
+    'md_ulb_pwrap',
+    'mdpo.md2po',
+    'mdpo.md2po2md',
+    'mdpo.mdpo2html',
+    'mdpo.po',
+    'mdpo.po2md',
+    'polib',
+}
+
+
+def _importtime(*modules):
+    """Return the cumulative import time in microseconds of each module."""
+    proc = subprocess.run(
+        [
+            sys.executable, '-X', 'importtime',
+            '-c', f'import {", ".join(modules)}',
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative_times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        cumulative_times[name.strip()] = int(cumulative)
+    return cumulative_times
+
+
+@pytest.mark.parametrize(
+    'cli', ('md2po', 'po2md', 'md2po2md', 'mdpo2html', 'mdpo'),
+)
+def test_startup_does_not_import_parsing_stack(cli):
+    cli_times = _importtime(f'mdpo.entrypoints.{cli}')
+    assert not PARSING_STACK_MODULES & set(cli_times)
+
+    if cli == 'mdpo':
+        return
+
+    # startup budget: the command line interface must be imported in less
+    # time than the parsing stack
+    parsing_stack_times = _importtime('mdpo.md2po2md', 'mdpo.mdpo2html')
+    assert cli_times[f'mdpo.entrypoints.{cli}'] < sum(
+        parsing_stack_times[module] for module in (
+            'mdpo.md2po2md', 'mdpo.mdpo2html',
+        )
+    )
@@ -1,10 +1,13 @@
 import contextlib
 import io
+import json
+import os
 
 import pytest
 
-from mdpo.event import parse_events_kwarg
+from mdpo.event import DebugTracer, parse_events_kwarg
 from mdpo.md2po import markdown_to_pofile
+from mdpo.po2md import pofile_to_markdown
 
 
 def test_debug_event():
@@ -88,6 +91,101 @@ md2po[DEBUG]::<date>::msgid:: msgid='[link]: https://foo.bar "Title"' - msgstr='
     assert expected_output_part_3 in comparable_debug_output
 
 
+@pytest.mark.parametrize(
+    ('level', 'expected_events'),
+    (
+        pytest.param(
+            'msgid', ['msgid', 'msgid'], id='msgid',
+        ),
+        pytest.param(
+            'block',
+            [
+                'enter_block', 'enter_block', 'leave_block', 'msgid',
+                'leave_block', 'msgid',
+            ],
+            id='block',
+        ),
+        pytest.param(
+            'all',
+            [
+                'enter_block', 'enter_block', 'text', 'enter_span', 'text',
+                'leave_span', 'leave_block', 'msgid', 'leave_block', 'msgid',
+            ],
+            id='all',
+        ),
+    ),
+)
+def test_debug_tracer_level(level, expected_events, tmp_dir):
+    with tmp_dir({}) as dirpath:
+        filepath = os.path.join(dirpath, 'debug.jsonl')
+        tracer = DebugTracer(
+            filepath=filepath,
+            output_format='jsonl',
+            level=level,
+        )
+        markdown_to_pofile('Some *text*', debug=tracer)
+
+        with open(filepath, encoding='utf-8') as f:
+            events = [json.loads(line) for line in f]
+
+    assert [event['event'] for event in events] == expected_events
+    assert {event['program'] for event in events} == {'md2po'}
+    msgid_events = [event for event in events if event['event'] == 'msgid']
+    assert msgid_events[0]['msg'] == "msgid='Some *text*'"
+
+
+def test_debug_tracer_sample_rate():
+    stdout = io.StringIO()
+    tracer = DebugTracer(sample_rate=0.25, buffer_size=3)
+    with contextlib.redirect_stdout(stdout):
+        markdown_to_pofile(
+            '\n\n'.join(f'Paragraph {i}' for i in range(20)),
+            debug=tracer,
+        )
+
+    events = [line.split('::')[2] for line in stdout.getvalue().splitlines()]
+    # 21 msgids, not sampled, and a quarter of 62 blocks and texts
+    assert events.count('msgid') == 21
+    assert len(events) - 21 == 15
+
+
+
+@pytest.mark.parametrize(
+    'func',
+    (markdown_to_pofile, lambda *args, **kwargs: pofile_to_markdown(
+        *args, [], **kwargs,
+    )),
+    ids=('md2po', 'po2md'),
+)
+def test_debug_tracer_flushed_on_error(func, tmp_dir):
+    def text_event(_self, _block, text):
+        if text == 'Bar':
+            raise RuntimeError('Bar found')
+
+    with tmp_dir({}) as dirpath:
+        filepath = os.path.join(dirpath, 'debug.jsonl')
+        tracer = DebugTracer(filepath=filepath, output_format='jsonl')
+        with pytest.raises(RuntimeError, match='Bar found'):
+            func('Foo\n\nBar\n', debug=tracer, events={'text': text_event})
+
+        with open(filepath, encoding='utf-8') as f:
+            events = [json.loads(line) for line in f]
+
+    assert 'Foo' in [event['msg'] for event in events]
+
+@pytest.mark.parametrize(
+    ('kwargs', 'expected_msg'),
+    (
+        ({'output_format': 'xml'}, "Invalid debug output format 'xml'"),
+        ({'level': 'span'}, "Invalid debug level 'span'"),
+        ({'sample_rate': 2}, "Invalid debug sample rate '2'"),
+    ),
+)
+def test_debug_tracer_invalid_arguments(kwargs, expected_msg):
+    with pytest.raises(ValueError, match=expected_msg):
+        DebugTracer(**kwargs)
+
+
 def test_parse_events_kwarg_func():
     def foo():
         return False
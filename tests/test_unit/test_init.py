@@ -9,6 +9,9 @@ def test_pep562():
     assert mdpo.markdown_to_pofile is importlib.import_module(
         'mdpo.md2po',
     ).markdown_to_pofile
+    assert mdpo.apofile_to_markdown is importlib.import_module(
+        'mdpo.po2md',
+    ).apofile_to_markdown
 
     expected_msg = "cannot import name 'foobarbaz' from 'mdpo'"
     with pytest.raises(ImportError, match=expected_msg):
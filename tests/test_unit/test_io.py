@@ -1,13 +1,22 @@
 """I/O mdpo utitlites tests."""
 
+import asyncio
+import concurrent.futures
 import glob
 import html
 import os
+import time
 
 import pytest
 
 from mdpo.io import (
+    MAX_PATH_LENGTH,
+    ExternalSorter,
+    IgnoreRules,
+    enable_files_cache,
     filter_paths,
+    iter_files,
+    run_in_executor,
     save_file_checking_file_changed,
     to_file_content_if_is_file,
     to_files_or_content,
@@ -82,6 +91,117 @@ class TestFilterPaths:
         ]
 
 
+class TestIterFiles:
+    def empty_file_path(self, directory, filename):
+        return os.path.join(
+            'tests', 'test_unit', EMPTY_FILES_DIRNAME, directory, filename,
+        )
+
+    @pytest.mark.parametrize(
+        'ignore',
+        (
+            [],
+            ['foo04.md', 'bar02.md'],
+            ['foo'],
+            [os.path.join('tests', 'test_unit', EMPTY_FILES_DIRNAME, 'foo')],
+            [os.path.join(
+                'tests', 'test_unit', EMPTY_FILES_DIRNAME, 'bar', 'bar02.md',
+            )],
+        ),
+    )
+    def test_same_as_filter_paths(self, ignore):
+        assert list(iter_files(EMPTY_FILES_GLOBSTR, ignore=ignore)) == (
+            filter_paths(EMPTY_FILES_GLOB, ignore_paths=ignore)
+        )
+
+    @pytest.mark.parametrize(
+        ('ignore', 'expected_files'),
+        (
+            pytest.param(
+                ['*.md', '!foo0[12].md'],
+                [('foo', 'foo01.md'), ('foo', 'foo02.md')],
+                id='negation',
+            ),
+            pytest.param(
+                ['foo/', '!foo01.md'],
+                [('bar', 'bar01.md'), ('bar', 'bar02.md'), ('bar', 'bar03.md')],
+                id='excluded-directory-pruned',
+            ),
+            pytest.param(
+                ['tests/**/bar0?.md'],
+                [
+                    ('foo', 'foo01.md'),
+                    ('foo', 'foo02.md'),
+                    ('foo', 'foo03.md'),
+                    ('foo', 'foo04.md'),
+                ],
+                id='recursive-path',
+            ),
+            pytest.param(
+                [EMPTY_FILES_DIRNAME],
+                [],
+                id='glob-root',
+            ),
+        ),
+    )
+    def test_ignore_rules(self, ignore, expected_files):
+        assert list(iter_files(EMPTY_FILES_GLOBSTR, ignore=ignore)) == [
+            self.empty_file_path(*path) for path in expected_files
+        ]
+
+    def test_recursive_and_unique(self, tmp_path):
+        for path in ('a.md', 'b/b.md', 'b/c/c.md', '.d/d.md', 'b/e.txt'):
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_text('')
+
+        globs = [
+            os.path.join(tmp_path, 'b', 'c', 'c.md'),
+            os.path.join(tmp_path, '**', '*.md'),
+        ]
+        assert list(iter_files(globs, ignore=IgnoreRules())) == [
+            os.path.join(tmp_path, 'b', 'c', 'c.md'),
+            os.path.join(tmp_path, 'a.md'),
+            os.path.join(tmp_path, 'b', 'b.md'),
+        ]
+
+    def test_files_cache(self, tmp_path):
+        (tmp_path / 'a.md').write_text('')
+        globstr = os.path.join(tmp_path, '*.md')
+
+        enable_files_cache()
+        try:
+            assert list(iter_files(globstr)) == [str(tmp_path / 'a.md')]
+
+            stat = os.stat(tmp_path)
+            (tmp_path / 'b.md').write_text('')
+
+            # directory not modified, listing reused
+            os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert list(iter_files(globstr)) == [str(tmp_path / 'a.md')]
+
+            os.utime(tmp_path, ns=(0, 0))
+            assert list(iter_files(globstr)) == [
+                str(tmp_path / 'a.md'),
+                str(tmp_path / 'b.md'),
+            ]
+        finally:
+            enable_files_cache(enable=False)
+
+
+    def test_files_cache_unexistent_directory(self, tmp_path):
+        filepath = os.path.join(tmp_path, 'unexistent', 'README.md')
+
+        enable_files_cache()
+        try:
+            assert list(iter_files(filepath)) == []
+            assert list(iter_files(filepath)) == []
+
+            (tmp_path / 'unexistent').mkdir()
+            (tmp_path / 'unexistent' / 'README.md').write_text('')
+            assert list(iter_files(filepath)) == [filepath]
+        finally:
+            enable_files_cache(enable=False)
+
 class TestToGlobOrContent:
     def test_glob(self):
         is_glob, parsed = to_files_or_content(EMPTY_FILES_GLOBSTR)
@@ -108,6 +228,35 @@ class TestToGlobOrContent:
         assert not is_glob
         assert parsed == content
 
+    @pytest.mark.parametrize(
+        'content',
+        ('*\n', '[' * (MAX_PATH_LENGTH + 1)),
+        ids=('newline', 'long'),
+    )
+    def test_content_not_globbed(self, content, monkeypatch):
+        def fail(*_args, **_kwargs):
+            raise AssertionError('content must not access the file system')
+
+        monkeypatch.setattr(glob, 'glob', fail)
+        monkeypatch.setattr(os.path, 'isfile', fail)
+        assert to_files_or_content(content) == (False, content)
+        assert to_file_content_if_is_file(content) == content
+
+    def test_explicit_kind(self, tmp_file):
+        with tmp_file('foo\n', '.md') as foo_path:
+            assert to_files_or_content(foo_path, kind='content') == (
+                False,
+                foo_path,
+            )
+            assert to_files_or_content(foo_path, kind='paths') == (
+                True,
+                [foo_path],
+            )
+        assert to_files_or_content('# foo', kind='paths') == (True, ['# foo'])
+
+        with pytest.raises(ValueError, match="Invalid kind 'foo'"):
+            to_files_or_content('foo', kind='foo')
+
 
 class TestToFileContentIfIsFile:
     def test_file(self, tmp_file):
@@ -121,7 +270,67 @@ class TestToFileContentIfIsFile:
         ) == MD_CONTENT_EXAMPLE
 
 
+def test_external_sorter(monkeypatch):
+    monkeypatch.setattr(ExternalSorter, 'MAX_RUNS', 3)
+    items = [(i * 7919 % 1000, str(i)) for i in range(1000)]
+
+    sorter = ExternalSorter(9)
+    for item in items:
+        sorter.add(item)
+    assert len(sorter) == len(items)
+    assert len(sorter._runs) <= ExternalSorter.MAX_RUNS + 1
+    assert list(sorter) == sorted(items)
+    assert list(sorter) == []
+
+    with pytest.raises(ValueError, match='must be positive'):
+        ExternalSorter(0)
+
+
 def test_save_file_checking_file_changed(tmp_file):
     with tmp_file('') as temp_fpath:
         assert save_file_checking_file_changed(temp_fpath, 'foo\n')
         assert not save_file_checking_file_changed(temp_fpath, 'foo\n')
+
+
+def test_run_in_executor_semaphore():
+    running, max_running = [0], [0]
+
+    def work(value):
+        running[0] += 1
+        max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        running[0] -= 1
+        return value * 2
+
+    async def main():
+        semaphore = asyncio.Semaphore(2)
+        return await asyncio.gather(*(
+            run_in_executor(work, value, semaphore=semaphore)
+            for value in range(6)
+        ))
+
+    assert asyncio.run(main()) == [0, 2, 4, 6, 8, 10]
+    assert max_running[0] <= 2
+
+
+def test_run_in_executor_cancellation():
+    executed = []
+
+    async def main():
+        semaphore = asyncio.Semaphore(1)
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            first = asyncio.create_task(run_in_executor(
+                time.sleep, 0.05, executor=executor, semaphore=semaphore,
+            ))
+            second = asyncio.create_task(run_in_executor(
+                executed.append, 'second', executor=executor,
+                semaphore=semaphore,
+            ))
+            await asyncio.sleep(0.01)
+            second.cancel()
+            await first
+            with pytest.raises(asyncio.CancelledError):
+                await second
+
+    asyncio.run(main())
+    assert executed == []
@@ -0,0 +1,70 @@
+"""Tests for mdpo Markdown utilities."""
+
+import pytest
+
+from mdpo.md import find_link_reference_target, parse_link_references
+
+
+@pytest.mark.parametrize(
+    ('content', 'expected_result'),
+    (
+        ('', []),
+        ('Text without link references\n', []),
+        ('[foo]: https://foo.bar', [('foo', 'https://foo.bar', None)]),
+        (
+            '[foo]: https://foo.bar "Foo title"\n',
+            [('foo', 'https://foo.bar', 'Foo title')],
+        ),
+        (
+            '   [foo]: <https://foo.bar> (Foo title)   \n',
+            [('foo', 'https://foo.bar', 'Foo title')],
+        ),
+        (
+            'Some [text][foo].\n\n[foo]: https://foo.bar\n[baz]: /baz\n',
+            [('foo', 'https://foo.bar', None), ('baz', '/baz', None)],
+        ),
+        # definitions are always contained in a single line
+        ('[foo]:\nhttps://foo.bar\n', []),
+        ('[foo]: https://foo.bar\r\n[baz]: /baz\r\n', [
+            ('foo', 'https://foo.bar', None),
+            ('baz', '/baz', None),
+        ]),
+        # unicode line boundary
+        ('[foo]: /foo\u2028[baz]: /baz', [
+            ('foo', '/foo', None),
+            ('baz', '/baz', None),
+        ]),
+        ('text [foo]: /foo\n', []),
+    ),
+)
+def test_parse_link_references(content, expected_result):
+    assert parse_link_references(content) == expected_result
+
+
+def test_parse_link_references_cached_result_not_shared():
+    content = '[foo]: https://foo.bar\n'
+    link_references = parse_link_references(content)
+    link_references.append(('baz', '/baz', None))
+    assert parse_link_references(content) == [
+        ('foo', 'https://foo.bar', None),
+    ]
+
+
+@pytest.mark.parametrize(
+    ('href', 'title', 'expected_result'),
+    (
+        ('/foo', None, 'foo'),
+        ('/foo', 'Foo title', 'foo'),
+        ('/foo', 'Other title', None),
+        ('/bar', None, 'bar'),
+        ('/baz', None, None),
+    ),
+)
+def test_find_link_reference_target(href, title, expected_result):
+    link_references = [
+        ('foo', '/foo', 'Foo title'),
+        ('bar', '/bar', None),
+    ]
+    assert find_link_reference_target(
+        link_references, href, title,
+    ) == expected_result
@@ -98,6 +98,101 @@ msgstr ""
 '''
 
 
+def test_ignore_msgids_patterns():
+    content = 'foo\n\nbar 1\n\nbar 2\n\nbaz\n\nqux 10\n'
+    md2po = Md2Po(content, ignore_msgids=['glob:bar *', r're:qux \d+'])
+    assert str(md2po.extract(content)) == '''#
+msgid ""
+msgstr ""
+
+msgid "foo"
+msgstr ""
+
+msgid "baz"
+msgstr ""
+'''
+
+
+def test_content_and_paths_arguments(tmp_file):
+    with tmp_file('foo\n', '.md') as foo_path:
+        pofile = Md2Po(content=foo_path, location=False).extract()
+        assert [entry.msgid for entry in pofile] == [foo_path]
+
+        pofile = Md2Po(paths=foo_path, location=False).extract()
+        assert [entry.msgid for entry in pofile] == ['foo']
+
+    with pytest.raises(ValueError, match='Only one of'):
+        Md2Po('foo', content='foo')
+    with pytest.raises(ValueError, match='must be defined'):
+        Md2Po()
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    (
+        {},
+        {'mark_not_found_as_obsolete': False},
+        {'preserve_not_found': False},
+        {'location': False},
+    ),
+)
+def test_max_entries_in_memory(kwargs, tmp_dir):
+    pofile_content = '''#
+msgid ""
+msgstr ""
+
+msgid "foo"
+msgstr "FOO"
+
+msgid "removed"
+msgstr "REMOVED"
+
+msgctxt "ctx"
+msgid "bar"
+msgstr "BAR"
+
+#, fuzzy
+msgid "baz"
+msgstr "BAZ"
+
+#~ msgid "bar"
+#~ msgstr "OBSOLETE BAR"
+
+#~ msgid "qux"
+#~ msgstr "QUX"
+'''
+    with tmp_dir({
+        'a.md': 'foo\n\nbar\n\n<!-- mdpo-context ctx -->\nbar\n',
+        'b.md': 'baz\n\nfoo\n\nqux\n\nnew\n',
+        'expected.po': pofile_content,
+        'bounded.po': pofile_content,
+    }) as dirpath:
+        glob = os.path.join(dirpath, '*.md')
+        expected_filepath = os.path.join(dirpath, 'expected.po')
+        bounded_filepath = os.path.join(dirpath, 'bounded.po')
+
+        Md2Po(glob, **kwargs).extract(
+            po_filepath=expected_filepath,
+            save=True,
+        )
+        pofile = Md2Po(glob, max_entries_in_memory=2, **kwargs).extract(
+            po_filepath=bounded_filepath,
+            save=True,
+        )
+        assert len(pofile) == 0
+        assert pofile.fpath == bounded_filepath
+
+        with open(expected_filepath, encoding='utf-8') as f:
+            expected_content = f.read()
+        with open(bounded_filepath, encoding='utf-8') as f:
+            assert f.read() == expected_content
+
+        with pytest.raises(ValueError, match='requires to save'):
+            Md2Po(glob, max_entries_in_memory=2).extract(
+                po_filepath=bounded_filepath,
+            )
+
+
 def test_md2po_save_without_po_filepath():
     content = 'foo\n\nbar\n\nbaz\n'
     md2po = Md2Po(content)
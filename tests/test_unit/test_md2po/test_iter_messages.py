@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+from mdpo.md2po import ExtractedMessage, iter_messages, markdown_to_pofile
+
+
+def test_iter_messages_same_as_pofile(tmp_dir):
+    with tmp_dir({
+        'a.md': (
+            '# Title\n\nSome *text*\n\n'
+            '<!-- mdpo-context greeting -->\nHello\n'
+        ),
+        'b.md': (
+            '<!-- mdpo-translator Comment for translators -->\nGoodbye\n\n'
+            '<!-- mdpo-disable-next-line -->\nDisabled\n'
+        ),
+    }) as dirpath:
+        glob = os.path.join(dirpath, '*.md')
+        messages = list(iter_messages(glob, ignore_msgids=['Title']))
+        pofile = markdown_to_pofile(glob, ignore_msgids=['Title'])
+
+    assert all(isinstance(message, ExtractedMessage) for message in messages)
+    assert [
+        (
+            message.msgid,
+            message.msgctxt,
+            message.tcomment,
+            message.fuzzy,
+            [message.occurrence],
+        ) for message in messages
+    ] == [
+        (
+            entry.msgid,
+            entry.msgctxt,
+            entry.comment or None,
+            entry.fuzzy,
+            entry.occurrences,
+        ) for entry in pofile
+    ]
+    assert [message.msgid for message in messages] == [
+        'Some *text*', 'Hello', 'Goodbye',
+    ]
+
+
+def test_iter_messages_repeated_and_content():
+    messages = list(
+        iter_messages(
+            content='Foo\n\nFoo\n\n`bar`',
+            plaintext=True,
+        ),
+    )
+    assert [(message.msgid, message.occurrence) for message in messages] == [
+        ('Foo', None), ('Foo', None), ('bar', None),
+    ]
+
+
+def test_iter_messages_file_by_file(tmp_dir):
+    with tmp_dir({'a.md': 'Foo\n', 'b.md': 'Bar\n'}) as dirpath:
+        messages = iter_messages(os.path.join(dirpath, '*.md'))
+        assert next(messages).msgid == 'Foo'
+
+        # the next file is not read until the messages are consumed
+        os.remove(os.path.join(dirpath, 'b.md'))
+        with pytest.raises(FileNotFoundError):
+            next(messages)
@@ -571,3 +571,38 @@ msgstr ""
         output = markdown_to_pofile(os.path.join(filesdir, '*.md'))
 
     assert str(output) == expected_output
+
+
+def test_location_repeated_messages(tmp_file, wrap_location_comment):
+    markdown_content = '''Foo
+
+<!-- mdpo-context Context -->
+Foo
+
+Bar
+
+Foo
+'''
+
+    with tmp_file(markdown_content, '.md') as md_filepath:
+        expected_output = f'''#
+msgid ""
+msgstr ""
+
+{wrap_location_comment(md_filepath, 'block 1 (paragraph)')}
+msgid "Foo"
+msgstr ""
+
+{wrap_location_comment(md_filepath, 'block 3 (paragraph)')}
+msgctxt "Context"
+msgid "Foo"
+msgstr ""
+
+{wrap_location_comment(md_filepath, 'block 4 (paragraph)')}
+msgid "Bar"
+msgstr ""
+'''
+
+        output = markdown_to_pofile(md_filepath, location=True)
+
+    assert str(output) == expected_output
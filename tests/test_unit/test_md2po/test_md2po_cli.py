@@ -96,6 +96,39 @@ def test_mutliple_files(tmp_file, capsys):
         assert stderr == ''
 
 
+def test_input_kind(tmp_file, capsys):
+    with tmp_file('foo\n', '.md') as foo_path:
+        pofile, exitcode = run([foo_path, '--content', '--nowrap'])
+        stdout, _ = capsys.readouterr()
+        assert exitcode == 0
+        assert f'msgid "{foo_path}"' in stdout
+
+        pofile, exitcode = run([foo_path, '--paths'])
+        stdout, _ = capsys.readouterr()
+        assert exitcode == 0
+        assert 'msgid "foo"' in stdout
+
+
+def test_max_entries_in_memory(tmp_file, tmp_file_path, capsys):
+    po_filepath = tmp_file_path('.po')
+    with tmp_file('foo\n\nbar\n', '.md') as md_filepath:
+        pofile, exitcode = run([
+            md_filepath, '-s', '-p', po_filepath,
+            '--max-entries-in-memory', '1',
+        ])
+        stdout, _ = capsys.readouterr()
+        assert exitcode == 0
+        assert len(pofile) == 0
+
+        _, exitcode = run([md_filepath, '-s', '-p', po_filepath])
+        expected_stdout, _ = capsys.readouterr()
+        assert exitcode == 0
+    os.remove(po_filepath)
+
+    assert stdout == expected_stdout
+    assert 'msgid "bar"' in stdout
+
+
 def test_multiple_globs(tmp_dir, capsys):
     with tmp_dir({
         'baba.md': 'baba',
@@ -446,7 +479,7 @@ msgstr ""
 
 '''
 
-    with tmp_file('foo\nbaz', '.txt') as filename:
+    with tmp_file('foo\nglob:b?z', '.txt') as filename:
         pofile, exitcode = run(['foo\n\nbar\n\nbaz\n', arg, filename])
     stdout, _ = capsys.readouterr()
 
@@ -455,6 +488,16 @@ msgstr ""
     assert stdout == expected_output
 
 
+
+def test_ignore_msgids_invalid_rule(capsys, tmp_file):
+    with tmp_file('foo\nre:[', '.txt') as filename, \
+            pytest.raises(SystemExit, match='1'):
+        run(['foo\n', '--ignore-msgids', filename])
+    _, stderr = capsys.readouterr()
+
+    assert stderr.startswith("Invalid msgid pattern rule 're:['")
+    assert 'Traceback' not in stderr
+
 @pytest.mark.parametrize('arg', ('--command-alias',))
 def test_command_aliases(capsys, arg):
     markdown_content = '''<!-- :off -->
@@ -919,3 +962,29 @@ msgstr "Hola"
     assert f'{pofile}\n' == po_input
     assert stdout == po_input
     assert stderr == ''
+
+
+@pytest.mark.parametrize('value', (None, 'md2po.prof'))
+def test_profile(value, capsys, tmp_dir):
+    with tmp_dir({}) as dirpath:
+        if value is None:
+            args = [EXAMPLE['input'], '--profile']
+        else:
+            dump_filepath = os.path.join(dirpath, value)
+            args = [f'--profile={dump_filepath}', EXAMPLE['input']]
+
+        pofile, exitcode = run(args)
+        stdout, stderr = capsys.readouterr()
+
+        assert exitcode == 0
+        assert stdout == EXAMPLE['output']
+
+        lines = stderr.splitlines()
+        assert lines[0].split() == ['phase', 'seconds', '%']
+        for name in (
+            'PO loading', 'md4c parsing', 'event callbacks', 'total', 'blocks',
+        ):
+            assert any(line.startswith(f'{name} ') for line in lines)
+
+        if value is not None:
+            assert os.path.isfile(dump_filepath)
@@ -102,6 +102,23 @@ from mdpo.md2po2md.__main__ import run
             },
             id='es-{lang}',
         ),
+        pytest.param(
+            ['es'],
+            '**/*.md',
+            'locale/{lang}',
+            {'README.md': 'Foo\n', 'docs/guide.md': 'Bar\n'},
+            {
+                'locale/es/README.md.po': (
+                    '#\nmsgid ""\nmsgstr ""\n\nmsgid "Foo"\nmsgstr ""\n'
+                ),
+                'locale/es/README.md': 'Foo\n',
+                'locale/es/guide.md.po': (
+                    '#\nmsgid ""\nmsgstr ""\n\nmsgid "Bar"\nmsgstr ""\n'
+                ),
+                'locale/es/guide.md': 'Bar\n',
+            },
+            id='recursive-glob',
+        ),
         pytest.param(
             ['es'],
             '[s-m]',
@@ -0,0 +1,143 @@
+"""Tests for md2po2md watch mode."""
+
+import os
+import queue
+import threading
+
+from mdpo.md2po2md import (
+    markdown_to_pofile_to_markdown,
+    watch_markdown_to_pofile_to_markdown,
+)
+
+
+def _read(filepath):
+    with open(filepath, encoding='utf-8') as f:
+        return f.read()
+
+
+def _write(filepath, content):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def test_watch(tmp_dir):
+    files = {'README.md': '# Hello\n', 'CHANGELOG.md': '# Changes\n'}
+    with tmp_dir(files) as dirpath:
+        input_paths_glob = os.path.join(dirpath, '*.md')
+        output_paths_schema = os.path.join(dirpath, 'locale', '{lang}')
+        langs = ['es', 'fr']
+        markdown_to_pofile_to_markdown(
+            langs,
+            input_paths_glob,
+            output_paths_schema,
+        )
+
+        rebuilds = queue.Queue()
+        ready, stop = threading.Event(), threading.Event()
+        watcher = threading.Thread(
+            target=watch_markdown_to_pofile_to_markdown,
+            args=(langs, input_paths_glob, output_paths_schema),
+            kwargs={
+                'interval': 0.01,
+                'debounce': 0.05,
+                'on_rebuild': rebuilds.put,
+                'on_ready': ready.set,
+                'stop': stop,
+            },
+        )
+        watcher.start()
+        assert ready.wait(timeout=5)
+        try:
+            readme_filepath = os.path.join(dirpath, 'README.md')
+            _write(readme_filepath, '# Hello\n\nWorld\n')
+            assert sorted(rebuilds.get(timeout=5)) == [
+                (readme_filepath, 'es'),
+                (readme_filepath, 'fr'),
+            ]
+            assert '"World"' in _read(
+                os.path.join(dirpath, 'locale', 'es', 'README.md.po'),
+            )
+
+            po_filepath = os.path.join(dirpath, 'locale', 'fr', 'README.md.po')
+            _write(
+                po_filepath,
+                _read(po_filepath).replace(
+                    'msgid "World"\nmsgstr ""',
+                    'msgid "World"\nmsgstr "Monde"',
+                ),
+            )
+            assert rebuilds.get(timeout=5) == [(readme_filepath, 'fr')]
+            assert _read(
+                os.path.join(dirpath, 'locale', 'fr', 'README.md'),
+            ) == '# Hello\n\nMonde\n'
+        finally:
+            stop.set()
+            watcher.join()
+        assert rebuilds.empty()
+
+        # same outputs as a full run
+        outputs = {}
+        for root, _, filenames in os.walk(os.path.join(dirpath, 'locale')):
+            for filename in filenames:
+                outputs[filename, root] = _read(os.path.join(root, filename))
+        markdown_to_pofile_to_markdown(
+            langs,
+            input_paths_glob,
+            output_paths_schema,
+        )
+        for (filename, root), content in outputs.items():
+            assert _read(os.path.join(root, filename)) == content
+
+
+def test_watch_rebuild_error(tmp_dir):
+    with tmp_dir({'README.md': '# Hello\n'}) as dirpath:
+        input_paths_glob = os.path.join(dirpath, '*.md')
+        output_paths_schema = os.path.join(dirpath, 'locale', '{lang}')
+        markdown_to_pofile_to_markdown(
+            ['es'],
+            input_paths_glob,
+            output_paths_schema,
+        )
+        readme_filepath = os.path.join(dirpath, 'README.md')
+        po_filepath = os.path.join(dirpath, 'locale', 'es', 'README.md.po')
+        pofile_content = _read(po_filepath)
+
+        rebuilds, errors = queue.Queue(), queue.Queue()
+        ready, stop = threading.Event(), threading.Event()
+        watcher = threading.Thread(
+            target=watch_markdown_to_pofile_to_markdown,
+            args=(['es'], input_paths_glob, output_paths_schema),
+            kwargs={
+                'interval': 0.01,
+                'debounce': 0.05,
+                'on_rebuild': rebuilds.put,
+                'on_error': lambda *args: errors.put(args),
+                'on_ready': ready.set,
+                'stop': stop,
+            },
+        )
+        watcher.start()
+        assert ready.wait(timeout=5)
+        try:
+            # half saved PO file
+            _write(po_filepath, pofile_content[:-5])
+            filepath, lang, _ = errors.get(timeout=5)
+            assert (filepath, lang) == (readme_filepath, 'es')
+
+            # keeps watching
+            _write(
+                po_filepath,
+                pofile_content.replace(
+                    'msgid "Hello"\nmsgstr ""',
+                    'msgid "Hello"\nmsgstr "Hola"',
+                ),
+            )
+            assert rebuilds.get(timeout=5) == [(readme_filepath, 'es')]
+            assert _read(
+                os.path.join(dirpath, 'locale', 'es', 'README.md'),
+            ) == '# Hola\n'
+        finally:
+            stop.set()
+            watcher.join()
+        assert rebuilds.empty()
+        assert errors.empty()
@@ -1,6 +1,37 @@
+import glob
+import os
+
+import polib
 import pytest
 
-from mdpo.po import po_escaped_string
+from mdpo.po import (
+    POFILE_READERS,
+    EntryRecord,
+    MsgidMatcher,
+    find_entry_in_entries,
+    find_entry_in_index,
+    index_entries,
+    po_escaped_string,
+    pofile_to_string,
+    read_pofile,
+    set_pofile_reader,
+    write_pofile,
+    write_pofile_entries,
+)
+
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POENTRY_ATTRIBUTES = (
+    'msgid', 'msgstr', 'msgid_plural', 'msgstr_plural', 'msgctxt',
+    'obsolete', 'encoding', 'comment', 'tcomment', 'occurrences', 'flags',
+    'previous_msgctxt', 'previous_msgid', 'previous_msgid_plural', 'linenum',
+)
+
+POFILE_ATTRIBUTES = (
+    'fpath', 'wrapwidth', 'encoding', 'check_for_duplicates', 'header',
+    'metadata', 'metadata_is_fuzzy',
+)
 
 
 @pytest.mark.parametrize(
@@ -15,3 +46,310 @@ from mdpo.po import po_escaped_string
 )
 def test_po_escaped_string(string, escaped):
     assert po_escaped_string(string) == escaped
+
+
+def test_entry_record_to_poentry():
+    record = EntryRecord('foo', 'bar', 'ctx', 'comment', ('fuzzy',))
+    assert record.fuzzy
+
+    entry = record.to_poentry()
+    assert isinstance(entry, polib.POEntry)
+    assert entry.msgid == 'foo'
+    assert entry.msgstr == 'bar'
+    assert entry.msgctxt == 'ctx'
+    assert entry.tcomment == 'comment'
+    assert entry.flags == ['fuzzy']
+    assert not EntryRecord('foo').fuzzy
+
+
+def assert_same_pofiles(pofile, expected_pofile):
+    for attribute in POFILE_ATTRIBUTES:
+        assert getattr(pofile, attribute) == getattr(
+            expected_pofile,
+            attribute,
+        ), attribute
+    assert len(pofile) == len(expected_pofile)
+    for entry, expected_entry in zip(pofile, expected_pofile):
+        for attribute in POENTRY_ATTRIBUTES:
+            assert getattr(entry, attribute) == getattr(
+                expected_entry,
+                attribute,
+            ), (entry.msgid, attribute)
+    assert str(pofile) == str(expected_pofile)
+
+
+@pytest.mark.parametrize(
+    'po_filepath',
+    sorted(glob.glob(os.path.join(TESTS_DIR, '**', '*.po'), recursive=True)),
+)
+def test_read_pofile_corpus(po_filepath):
+    assert_same_pofiles(
+        POFILE_READERS['mdpo'](po_filepath),
+        polib.pofile(po_filepath),
+    )
+
+
+@pytest.mark.parametrize(
+    'content',
+    (
+        pytest.param(
+            '''# Header comment
+#
+## Other header comment
+#, fuzzy
+msgid ""
+msgstr ""
+"Project-Id-Version: foo\\n"
+"Content-Type: text/plain; charset=utf-8\\n"
+"X-Multiline: a\\n"
+"continued\\n"
+
+#. generated comment
+#. other generated comment
+#: foo.md:12 bar.md block 3 (header) :5 a:b
+#, fuzzy, python-format
+msgctxt "Context"
+"continued"
+msgid "Hello \\"world\\" \\\\ \\t"
+"next line\\n"
+msgstr ""
+"Hola"
+
+# translator comment
+#  indented translator comment
+msgid "a"
+msgstr "b"
+
+#~ msgid "obsolete"
+#~ "continued"
+#~ msgstr "obsoleto"
+''',
+            id='all-supported-syntax',
+        ),
+        pytest.param(
+            '\ufeff# header\r\nmsgid ""\r\nmsgstr ""\r\n'
+            '"Content-Type: text/plain; charset=utf-8\\\\n"\r\n\r\n'
+            'msgid "café"\r\nmsgstr "x"\r\n',
+            id='bom-crlf',
+        ),
+        pytest.param('', id='empty'),
+        pytest.param('# a\n# b\n', id='only-comments'),
+        pytest.param(
+            'msgid "a"\nmsgstr ""\n\n#: x.md\n',
+            id='trailing-comment',
+        ),
+        pytest.param(
+            '#~| msgid "old"\n#~ msgid "a"\n#~ msgstr "b"\n',
+            id='obsolete-previous-msgid',
+        ),
+        pytest.param('msgid "foo\\"\n"n"\nmsgstr ""\n', id='split-escape'),
+        pytest.param(
+            'msgid "a"\n# c\nmsgstr "b"\n',
+            id='tcomment-before-msgstr',
+        ),
+        pytest.param(
+            'msgid ""\nmsgstr "A: 1\\\\n"\n\n'
+            'msgctxt "c"\nmsgid ""\nmsgstr "B: 2\\\\n"\n',
+            id='metadata-with-context',
+        ),
+        pytest.param(
+            'msgid "a"\nmsgid_plural "as"\nmsgstr[0] "b"\nmsgstr[1] "bs"\n',
+            id='plurals-fallback',
+        ),
+        pytest.param(
+            '#| msgid "old"\nmsgid "a"\nmsgstr "b"\n',
+            id='previous-fallback',
+        ),
+    ),
+)
+def test_read_pofile(content, tmp_file):
+    with tmp_file(content, '.po') as po_filepath:
+        assert_same_pofiles(read_pofile(po_filepath), polib.pofile(po_filepath))
+
+
+@pytest.mark.parametrize(
+    'content',
+    (
+        pytest.param('msgid "a"b"\nmsgstr ""\n', id='unescaped-quote'),
+        pytest.param(
+            'msgctxt "a"\n# c\nmsgid "x"\nmsgstr ""\n',
+            id='bad-order',
+        ),
+        pytest.param('msgid\nmsgstr ""\n', id='missing-value'),
+    ),
+)
+def test_read_pofile_syntax_errors(content, tmp_file):
+    with tmp_file(content, '.po') as po_filepath, pytest.raises(
+        OSError,
+        match='Syntax error in po file',
+    ):
+        read_pofile(po_filepath)
+
+
+def test_set_pofile_reader(tmp_file):
+    calls = []
+
+    def reader(po_filepath, encoding=None, wrapwidth=78):
+        calls.append(po_filepath)
+        return polib.pofile(po_filepath, encoding=encoding, wrapwidth=wrapwidth)
+
+    with tmp_file('msgid "a"\nmsgstr "b"\n', '.po') as po_filepath:
+        set_pofile_reader(reader)
+        try:
+            pofile = read_pofile(po_filepath)
+        finally:
+            set_pofile_reader('mdpo')
+        assert read_pofile(po_filepath, reader='polib')[0].msgstr == 'b'
+
+    assert calls == [po_filepath]
+    assert pofile[0].msgstr == 'b'
+
+    with pytest.raises(ValueError, match="Unknown PO file reader 'foo'"):
+        set_pofile_reader('foo')
+
+
+@pytest.mark.parametrize('wrapwidth', (0, 30, 78, 200))
+@pytest.mark.parametrize(
+    'po_filepath',
+    sorted(glob.glob(os.path.join(TESTS_DIR, '**', '*.po'), recursive=True)),
+)
+def test_pofile_to_string_corpus(po_filepath, wrapwidth):
+    pofile = polib.pofile(po_filepath, wrapwidth=wrapwidth)
+    assert pofile_to_string(pofile) == str(pofile)
+
+
+def test_pofile_to_string(tmp_file_path):
+    pofile = polib.POFile(wrapwidth=40)
+    pofile.header = 'Header\n, flag-like\n: location-like'
+    pofile.metadata = {'Content-Type': 'text/plain; charset=utf-8'}
+    pofile.metadata_is_fuzzy = True
+    pofile.append(
+        polib.POEntry(
+            msgid='A long message with "quotes" and\ttabs that is wrapped',
+            msgstr='Multiline\nmessage\n',
+            msgctxt='Context',
+            tcomment='A long translator comment that must be wrapped too',
+            comment='Generated comment',
+            occurrences=[
+                ('path/to/a-long-file-name.md', 'block 1 (paragraph)'),
+                ('other.md', ''),
+            ],
+            flags=['fuzzy', 'python-format'],
+            previous_msgid='A previous message',
+        ),
+    )
+    pofile.append(
+        polib.POEntry(
+            msgid='apple',
+            msgid_plural='apples',
+            msgstr_plural={1: 'manzanas', 0: 'manzana'},
+        ),
+    )
+    pofile.append(
+        polib.POEntry(
+            msgid='Obsolete message',
+            msgstr='Mensaje obsoleto',
+            tcomment='Obsolete comment',
+            comment='Not written',
+            occurrences=[('not-written.md', '')],
+            obsolete=True,
+        ),
+    )
+    expected_content = str(pofile)
+
+    assert pofile_to_string(pofile) == expected_content
+    # wrapped lines are cached, so the second serialization reuses them
+    assert pofile_to_string(pofile) == expected_content
+
+    filepath = tmp_file_path('.po')
+    write_pofile(pofile, filepath)
+    with open(filepath, encoding='utf-8') as f:
+        assert f.read() == expected_content
+    assert pofile.fpath == filepath
+    os.remove(filepath)
+
+    # entries taken from an iterable, obsolete ones at the end
+    head_pofile = polib.POFile(wrapwidth=40)
+    head_pofile.header = pofile.header
+    head_pofile.metadata = pofile.metadata
+    head_pofile.metadata_is_fuzzy = True
+    write_pofile_entries(head_pofile, iter(pofile), filepath)
+    with open(filepath, encoding='utf-8') as f:
+        assert f.read() == expected_content
+    os.remove(filepath)
+
+
+def test_find_entry_in_index():
+    entries = [
+        polib.POEntry(msgid='foo', msgstr='a', occurrences=[('a.md', '1')]),
+        polib.POEntry(msgid='foo', msgctxt='', msgstr='b'),
+        polib.POEntry(msgid='foo', msgctxt='ctx', msgstr='c'),
+        polib.POEntry(msgid='bar', msgstr='d', obsolete=True),
+    ]
+    index = index_entries(entries)
+    assert index == {
+        ('0', 'foo'): entries[:2],
+        ('ctx', 'foo'): [entries[2]],
+        ('0', 'bar'): [entries[3]],
+    }
+
+    for entry, kwargs in (
+        (polib.POEntry(msgid='foo', msgstr='b'), {}),
+        (polib.POEntry(msgid='foo'), {'compare_msgstr': False}),
+        (
+            polib.POEntry(msgid='foo', msgstr='a'),
+            {'compare_occurrences': False},
+        ),
+        (polib.POEntry(msgid='foo', msgctxt='ctx', msgstr='c'), {}),
+        (polib.POEntry(msgid='bar', msgstr='d'), {}),
+        (polib.POEntry(msgid='bar', msgstr='d'), {'compare_obsolete': False}),
+        (polib.POEntry(msgid='baz'), {}),
+    ):
+        assert find_entry_in_index(
+            entry,
+            index,
+            **kwargs,
+        ) is find_entry_in_entries(entry, entries, **kwargs)
+
+
+def test_msgid_matcher():
+    matcher = MsgidMatcher([
+        'foo',
+        'glob:Chapter *',
+        're:v\\d+\\.\\d+',
+        'exact:re:bar',
+        'glob:[!a-z]?',
+    ])
+    assert matcher
+    assert matcher.exact == {'foo', 're:bar'}
+
+    for msgid in ('foo', 'Chapter 1', 'Chapter ', 'v1.2', 're:bar', 'A1'):
+        assert msgid in matcher, msgid
+    for msgid in ('fooo', 'Chapter', 'v1.2.3', 'xv1.2', 'bar', 'a1', 'A12'):
+        assert msgid not in matcher, msgid
+
+    assert not MsgidMatcher()
+    assert 'foo' not in MsgidMatcher()
+
+    with pytest.raises(ValueError, match="Invalid msgid pattern rule 're:\\('"):
+        MsgidMatcher(['re:('])
+    with pytest.raises(ValueError, match="rule 're:\\[': unterminated"):
+        MsgidMatcher(['re:['])
+    with pytest.raises(ValueError, match="rule 're:a\\)\\|\\(b'"):
+        MsgidMatcher(['re:a)|(b', 're:c'])
+
+
+def test_msgid_matcher_groups():
+    matcher = MsgidMatcher([
+        're:(a)\\1',
+        're:(?P<x>b)(?P=x)',
+        're:(?P<x>c)-(?P=x)',
+        're:d',
+        're:(?i)e',
+        'glob:f*g*h',
+    ])
+    assert len(matcher.patterns) == 4
+    for msgid in ('aa', 'bb', 'c-c', 'd', 'E', 'fxgyh'):
+        assert msgid in matcher, msgid
+    for msgid in ('a', 'ab', 'b', 'c-b', 'dd', 'fgx', 'x'):
+        assert msgid not in matcher, msgid
@@ -51,6 +51,19 @@ def test_quiet(capsys, arg, tmp_file):
         assert stderr == ''
 
 
+def test_workers(capsys, tmp_file):
+    with tmp_file(EXAMPLE['pofile'], '.po') as po_filepath:
+        output, exitcode = run([
+            EXAMPLE['markdown-input'],
+            '-p', po_filepath, '--workers', '2',
+        ])
+        stdout, _ = capsys.readouterr()
+
+        assert exitcode == 0
+        assert f'{output}\n' == EXAMPLE['markdown-output']
+        assert stdout == EXAMPLE['markdown-output']
+
+
 @pytest.mark.parametrize('arg', ('-D', '--debug'))
 def test_debug(capsys, arg, tmp_file):
     with tmp_file(EXAMPLE['pofile'], '.po') as po_filepath, \
@@ -83,6 +96,39 @@ def test_debug(capsys, arg, tmp_file):
         assert md_output_checked
 
 
+def test_debug_file(capsys, tmp_file, tmp_dir):
+    with tmp_file(EXAMPLE['pofile'], '.po') as po_filepath, \
+            tmp_file(EXAMPLE['markdown-input'], '.md') as input_md_filepath, \
+            tmp_dir({}) as dirpath:
+        debug_filepath = os.path.join(dirpath, 'debug.log')
+
+        output, exitcode = run([
+            input_md_filepath, '-p', po_filepath,
+            '--debug-file', debug_filepath, '--debug-level', 'msgid',
+        ])
+        stdout, _ = capsys.readouterr()
+
+        assert exitcode == 0
+        assert stdout == EXAMPLE['markdown-output']
+
+        with open(debug_filepath, encoding='utf-8') as f:
+            debug_lines = f.read().splitlines()
+        assert debug_lines
+        for line in debug_lines:
+            assert re.match(r'^po2md\[DEBUG\]::[\d\s:.-]+::msgid::', line)
+
+
+def test_debug_invalid_sample_rate(capsys, tmp_file):
+    with tmp_file(EXAMPLE['pofile'], '.po') as po_filepath, \
+            pytest.raises(SystemExit):
+        run(['foo', '-p', po_filepath, '--debug-sample-rate', '5'])
+    _, stderr = capsys.readouterr()
+    assert stderr == (
+        "Invalid debug sample rate '5.0'. It must be a number between"
+        ' 0 and 1.\n'
+    )
+
+
 @pytest.mark.parametrize('arg', ('-s', '--save'))
 def test_save(capsys, arg, tmp_file):
     with tmp_file(EXAMPLE['pofile'], '.po') as po_filepath, \
@@ -0,0 +1,111 @@
+import glob
+import os
+
+import pytest
+
+from mdpo.po2md import Po2Md, pofile_to_markdown
+
+
+EXAMPLES_DIR = os.path.join(
+    os.path.abspath(os.path.dirname(__file__)), 'translate-examples',
+)
+EXAMPLES = sorted(
+    os.path.basename(fp) for fp in glob.glob(EXAMPLES_DIR + os.sep + '*.md')
+    if not fp.endswith('.expect.md')
+)
+
+CONTENT = (
+    '# Title\n\n'
+    'Some paragraph with trailing spaces\n\n'
+    '<!-- mdpo-disable-next-line -->\n'
+    'Disabled\n\n'
+    '```\ncode\n```\n\n'
+    'A [referenced link][ref]\n\n'
+    '[ref]: https://example.com\n'
+)
+
+POFILES = {
+    'es': '''#
+msgid ""
+msgstr ""
+
+msgid "Title"
+msgstr "Título"
+
+msgid "Some paragraph with trailing spaces"
+msgstr "Un párrafo con espacios al final   "
+
+msgid "code\\n"
+msgstr "código\\n\\n"
+
+msgid "A [referenced link][ref]"
+msgstr "Un [enlace referenciado][ref]"
+
+msgid "[ref]: https://example.com"
+msgstr "[ref]: https://example.es  "
+''',
+    'fr': '''#
+msgid ""
+msgstr ""
+
+msgid "Title"
+msgstr "Titre"
+
+msgid "Disabled"
+msgstr "Désactivé"
+
+msgid "A [referenced link][ref]"
+msgstr "Un [lien référencé][ref] qui est assez long pour être coupé en deux"
+''',
+    'en': '#\nmsgid ""\nmsgstr ""\n',
+}
+
+
+@pytest.mark.parametrize('filename', EXAMPLES)
+def test_translate_languages_same_output(filename):
+    filepath_in = os.path.join(EXAMPLES_DIR, filename)
+    po_filepath = os.path.splitext(filepath_in)[0] + '.po'
+
+    with open(filepath_in + '.expect.md', encoding='utf-8') as f:
+        expected_output = f.read()
+    assert pofile_to_markdown(
+        filepath_in,
+        {'es': po_filepath, 'en': []},
+    ) == {'es': expected_output, 'en': pofile_to_markdown(filepath_in, [])}
+
+
+def test_translate_languages(tmp_dir):
+    with tmp_dir({
+        f'{lang}.po': content for lang, content in POFILES.items()
+    }) as dirpath:
+        pofiles = {
+            lang: os.path.join(dirpath, f'{lang}.po') for lang in POFILES
+        }
+        expected_translators = {
+            lang: Po2Md(pofile, wrapwidth=40)
+            for lang, pofile in pofiles.items()
+        }
+        expected_outputs = {
+            lang: translator.translate(CONTENT)
+            for lang, translator in expected_translators.items()
+        }
+
+        po2md = Po2Md(pofiles, wrapwidth=40)
+        save = {lang: os.path.join(dirpath, f'{lang}.md') for lang in POFILES}
+        output = po2md.translate(CONTENT, save=save)
+
+        for lang, filepath in save.items():
+            with open(filepath, encoding='utf-8') as f:
+                assert f.read() == expected_outputs[lang]
+
+    assert po2md.languages == ('es', 'fr', 'en')
+    assert output == expected_outputs
+    assert len(set(output.values())) == 3
+    assert {
+        lang: [entry.msgid for entry in entries]
+        for lang, entries in po2md.translated_entries.items()
+    } == {
+        lang: [entry.msgid for entry in translator.translated_entries]
+        for lang, translator in expected_translators.items()
+    }
+    assert [entry.msgid for entry in po2md.disabled_entries] == ['Disabled']
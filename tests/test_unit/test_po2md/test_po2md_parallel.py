@@ -0,0 +1,136 @@
+import glob
+import os
+
+import pytest
+
+from mdpo.po2md import Po2Md, pofile_to_markdown, split_in_chunks
+from mdpo.profiling import Profile
+
+
+EXAMPLES_DIR = os.path.join(
+    os.path.abspath(os.path.dirname(__file__)), 'translate-examples',
+)
+EXAMPLES = sorted(
+    os.path.basename(fp) for fp in glob.glob(EXAMPLES_DIR + os.sep + '*.md')
+    if not fp.endswith('.expect.md')
+)
+
+
+@pytest.mark.parametrize('filename', EXAMPLES)
+def test_translate_parallel_same_output(filename):
+    filepath_in = os.path.join(EXAMPLES_DIR, filename)
+    po_filepath = os.path.splitext(filepath_in)[0] + '.po'
+
+    with open(filepath_in + '.expect.md', encoding='utf-8') as f:
+        expected_output = f.read()
+    assert pofile_to_markdown(
+        filepath_in,
+        po_filepath,
+        workers=2,
+        parallel_chunk_lines=1,
+    ) == expected_output
+
+
+def test_split_in_chunks():
+    content = (
+        'Foo\n\n'
+        '```\nbar\n\nbaz\n```\n\n'
+        '- qux\n\n'
+        '- quux\n\n'
+        '<!-- mdpo-off -->\n\n'
+        'corge\n\n'
+        '<pre>\n\ngrault\n</pre>\n\n'
+        '[ref]: https://example.com\n\n'
+        '<!-- mdpo-enable -->\n'
+        'garply\n'
+    )
+    chunks, definitions = split_in_chunks(
+        content,
+        1,
+        command_aliases={'mdpo-off': 'mdpo-disable'},
+    )
+    assert [
+        (content[start:end], disable) for start, end, disable in chunks
+    ] == [
+        ('Foo\n\n', False),
+        ('```\nbar\n\nbaz\n```\n\n- qux\n\n- quux\n\n', False),
+        ('<!-- mdpo-off -->\n\ncorge\n\n', False),
+        ('<pre>\n\ngrault\n</pre>\n\n[ref]: https://example.com\n\n', True),
+        ('<!-- mdpo-enable -->\ngarply\n', True),
+    ]
+    assert definitions == [
+        (content.index('[ref]'), '[ref]: https://example.com\n'),
+    ]
+
+    assert len(split_in_chunks(content, 100)[0]) == 1
+
+
+def test_translate_parallel_state_between_chunks(tmp_file):
+    content = (
+        'Foo\n\n'
+        '<!-- mdpo-disable -->\n\n'
+        'Bar\n\n'
+        'See [baz][ref]\n\n'
+        '<!-- mdpo-enable -->\n\n'
+        'Qux\n\n'
+        '[ref]: https://example.com\n'
+    )
+    pofile_content = '''#
+msgid ""
+msgstr ""
+
+msgid "Foo"
+msgstr "Foo es"
+
+msgid "Bar"
+msgstr "Bar es"
+
+msgid "See [baz][ref]"
+msgstr "See [baz es][ref]"
+
+msgid "Qux"
+msgstr "Qux es"
+'''
+    with tmp_file(pofile_content, '.po') as po_filepath:
+        expected_po2md = Po2Md(po_filepath)
+        expected_output = expected_po2md.translate(content)
+
+        profile = Profile()
+        po2md = Po2Md(
+            po_filepath,
+            workers=2,
+            parallel_chunk_lines=1,
+            profile=profile,
+        )
+        output = po2md.translate(content)
+
+    assert output == expected_output
+    assert 'Bar es' not in output
+    assert profile.counters['parallel chunks'] > 1
+    assert [entry.msgid for entry in po2md.translated_entries] == [
+        entry.msgid for entry in expected_po2md.translated_entries
+    ]
+    assert [entry.msgid for entry in po2md.disabled_entries] == [
+        'Bar', 'See [baz][ref]',
+    ]
+
+
+def test_translate_parallel_with_events_is_sequential(tmp_file):
+    texts = []
+
+    def text_event(_self, _block, text):
+        texts.append(text)
+
+    profile = Profile()
+    with tmp_file('#\nmsgid ""\nmsgstr ""\n', '.po') as po_filepath:
+        output = pofile_to_markdown(
+            'Foo\n\nBar\n',
+            po_filepath,
+            events={'text': text_event},
+            workers=2,
+            parallel_chunk_lines=1,
+            profile=profile,
+        )
+    assert output == 'Foo\n\nBar\n'
+    assert texts == ['Foo', 'Bar']
+    assert 'parallel chunks' not in profile.counters
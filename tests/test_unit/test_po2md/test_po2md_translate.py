@@ -1,10 +1,11 @@
+import asyncio
 import glob
 import os
 
 import pytest
 
-from mdpo.md2po import markdown_to_pofile
-from mdpo.po2md import pofile_to_markdown
+from mdpo.md2po import amarkdown_to_pofile, markdown_to_pofile
+from mdpo.po2md import apofile_to_markdown, pofile_to_markdown
 
 
 EXAMPLES_DIR = os.path.join(
@@ -58,3 +59,20 @@ def test_translate_save(filename, tmp_file):
 
         with open(filepath_out, encoding='utf-8') as expect_file:
             assert result == expect_file.read()
+
+
+def test_async_translate(tmp_file):
+    markdown_content = '# Header\n\nSome text\n'
+
+    async def main(po_filepath):
+        pofile = await amarkdown_to_pofile(markdown_content)
+        pofile[0].msgstr = 'Encabezado'
+        pofile.save(po_filepath)
+        return await asyncio.gather(*(
+            apofile_to_markdown(markdown_content, po_filepath)
+            for _ in range(3)
+        ))
+
+    with tmp_file('', '.po') as po_filepath:
+        outputs = asyncio.run(main(po_filepath))
+    assert outputs == ['# Encabezado\n\nSome text\n'] * 3
@@ -32,3 +32,14 @@ this should be in disabled_entries
     assert translated_entry.msgstr == 'translated foo'
     assert translated_entry.msgctxt == 'Context'
     assert translated_entry.tcomment == 'Message for translator'
+
+
+def test_translated_entries_collection_disabled(tmp_file):
+    po_content = '#\nmsgid ""\nmsgstr ""\n\nmsgid "foo"\nmsgstr "bar"\n'
+
+    with tmp_file(po_content, '.po') as po_filepath:
+        po2md = Po2Md(po_filepath, collect_translated_entries=False)
+        output = po2md.translate('# foo\n')
+
+    assert output == '# bar\n'
+    assert po2md.translated_entries == []
@@ -6,7 +6,11 @@ import os
 
 import pytest
 
-from mdpo.po2md import pofile_to_markdown
+from mdpo.po2md import (
+    pofile_to_markdown,
+    set_wrap_cache_size,
+    wrap_cache_info,
+)
 
 
 EXAMPLES_DIR = os.path.join(
@@ -35,3 +39,26 @@ def test_wrapwidth(filename, wrapwidth):
     with open(filepath_out, encoding='utf-8') as f:
         expected_output = f.read()
     assert output == expected_output
+
+
+def test_wrap_cache(tmp_file):
+    paragraph = 'This is a long paragraph that needs to be wrapped. ' * 3
+    markdown_content = f'# Short header\n\n{paragraph}\n\n{paragraph}\n'
+
+    set_wrap_cache_size(16)
+    try:
+        with tmp_file('#\nmsgid ""\nmsgstr ""\n', '.po') as po_filepath:
+            output = pofile_to_markdown(markdown_content, po_filepath)
+
+        cache_info = wrap_cache_info()
+        # short header doesn't reach the cache
+        assert cache_info.currsize == 1
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
+        set_wrap_cache_size(0)
+        with tmp_file('#\nmsgid ""\nmsgstr ""\n', '.po') as po_filepath:
+            assert pofile_to_markdown(markdown_content, po_filepath) == output
+        assert wrap_cache_info().currsize == 0
+    finally:
+        set_wrap_cache_size()
@@ -0,0 +1,111 @@
+"""Tests for mdpo profiling utilities."""
+
+import time
+
+from mdpo.md2po import Md2Po
+from mdpo.po2md import Po2Md
+from mdpo.profiling import NULL_PROFILE, Profile
+
+
+def test_nested_phases_are_exclusive():
+    profile = Profile()
+    with profile.phase('outer'):
+        time.sleep(0.01)
+        with profile.phase('inner'):
+            time.sleep(0.02)
+
+    assert list(profile.timings) == ['outer', 'inner']
+    assert 0.01 <= profile.timings['outer'] < 0.02
+    assert profile.timings['inner'] >= 0.02
+
+
+def test_wrap():
+    profile = Profile()
+    wrapped = profile.wrap('adding', lambda a, b: a + b)
+    assert wrapped(1, 2) == 3
+    assert wrapped(3, 4) == 7
+    assert list(profile.timings) == ['adding']
+    assert profile.counters == {}
+
+    wrapped = profile.wrap('adding', lambda a, b: a + b, counter='additions')
+    assert profile.counters == {'additions': 0}
+    wrapped(1, 2)
+    wrapped(3, 4)
+    assert profile.counters == {'additions': 2}
+
+
+def test_count():
+    profile = Profile()
+    profile.count('bytes read', 10)
+    profile.count('texts')
+    profile.count('bytes read', 5)
+    assert profile.as_dict() == {
+        'timings': {},
+        'counters': {'bytes read': 15, 'texts': 1},
+    }
+
+
+def test_summary():
+    profile = Profile()
+    profile.timings.update({'parsing': 3.0, 'writing': 1.0})
+
+    assert profile.summary() == (
+        'phase      seconds       %\n'
+        'parsing     3.0000   75.00\n'
+        'writing     1.0000   25.00\n'
+        'total       4.0000  100.00\n'
+    )
+
+    profile.count('blocks', 12)
+    profile.count('texts', 3)
+    assert profile.summary().endswith(
+        'total       4.0000  100.00\n'
+        '\n'
+        'blocks         12\n'
+        'texts           3\n',
+    )
+
+
+def test_null_profile():
+    def func():
+        return None
+
+    assert not NULL_PROFILE.enabled
+    assert NULL_PROFILE.wrap('phase', func) is func
+    assert NULL_PROFILE.wrap('phase', func, counter='calls') is func
+    NULL_PROFILE.count('calls')
+    with NULL_PROFILE.phase('phase'):
+        pass
+
+
+def test_md2po_po2md_profile(tmp_file):
+    markdown_content = '# Header\n\nSome *text*\n\nOther text\n'
+
+    profile = Profile()
+    pofile = Md2Po(markdown_content, profile=profile).extract()
+    assert {'PO loading', 'md4c parsing', 'event callbacks'} <= set(
+        profile.timings,
+    )
+    assert profile.counters == {
+        'blocks': 4,
+        'spans': 1,
+        'texts': 4,
+        'msgids extracted': 3,
+    }
+
+    pofile[1].msgstr = 'Algún *texto*'
+    po_content = str(pofile)
+    with tmp_file(po_content, '.po') as po_filepath:
+        profile = Profile()
+        output = Po2Md([po_filepath], profile=profile).translate(
+            markdown_content,
+        )
+    assert output == '# Header\n\nAlgún *texto*\n\nOther text\n'
+    assert {'PO loading', 'merging', 'md4c parsing', 'serialization'} <= set(
+        profile.timings,
+    )
+    counters = profile.counters
+    assert counters['bytes read'] == len(po_content.encode('utf-8'))
+    assert counters['msgids translated'] == 1
+    assert counters['msgids untranslated'] == 2
+    assert counters['blocks'] == 4
@@ -0,0 +1,141 @@
+"""Tests for mdpo server."""
+
+import contextlib
+import io
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+from mdpo.entrypoints.mdpo import run
+from mdpo.io import enable_files_cache
+from mdpo.po import enable_pofiles_cache, paths_or_globs_to_unique_pofiles
+from mdpo.server import (
+    create_server,
+    default_socket_path,
+    execute_request,
+    forward_to_server,
+    send_request,
+)
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'),
+    reason='Unix sockets not supported',
+)
+
+
+@contextlib.contextmanager
+def running_server(socket_path):
+    server = create_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        enable_pofiles_cache(enable=False)
+        enable_files_cache(enable=False)
+
+
+def test_execute_request():
+    response = execute_request({
+        'program': 'md2po',
+        'args': ['--no-location', '--nowrap'],
+        'stdin': '# Hello',
+    })
+    assert response == {
+        'exitcode': 0,
+        'stdout': '#\nmsgid ""\nmsgstr ""\n\nmsgid "Hello"\nmsgstr ""\n\n',
+        'stderr': '',
+    }
+
+
+def test_execute_request_exit():
+    response = execute_request({'program': 'po2md', 'args': ['-p', 'foo']})
+    assert response == {
+        'exitcode': 1,
+        'stdout': '',
+        'stderr': 'Files or content to translate not specified\n',
+    }
+
+    response = execute_request({'program': 'foo', 'args': []})
+    assert response == {
+        'exitcode': 1,
+        'stdout': '',
+        'stderr': "Unknown program 'foo'\n",
+    }
+
+
+def test_server(tmp_dir):
+    pofile_content = '#\nmsgid ""\nmsgstr ""\n\nmsgid "Hello"\nmsgstr "Hola"\n'
+    with tmp_dir([('es.po', pofile_content)]) as (dirpath, po_filepath), \
+            running_server(os.path.join(dirpath, 'mdpo.sock')) as server:
+        socket_path = server.server_address
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+        with pytest.raises(OSError, match='already listening'):
+            create_server(socket_path)
+
+        request = {
+            'program': 'po2md',
+            'args': ['Hello', '-p', 'es.po'],
+            'cwd': dirpath,
+        }
+        assert send_request(socket_path, request) == {
+            'exitcode': 0,
+            'stdout': 'Hola\n\n',
+            'stderr': '',
+        }
+
+        # PO files are cached while they are not modified
+        pofiles = paths_or_globs_to_unique_pofiles(po_filepath, [])
+        assert paths_or_globs_to_unique_pofiles(po_filepath, []) == pofiles
+        with open(po_filepath, 'a', encoding='utf-8') as f:
+            f.write('\nmsgid "Bye"\nmsgstr "Adiós"\n')
+        assert paths_or_globs_to_unique_pofiles(po_filepath, []) != pofiles
+
+        request['args'][0] = 'Bye'
+        assert send_request(socket_path, request)['stdout'] == 'Adiós\n\n'
+
+
+def test_forward_to_server(tmp_dir, monkeypatch, capsys):
+    with tmp_dir({}) as dirpath:
+        socket_path = os.path.join(dirpath, 'mdpo.sock')
+
+        monkeypatch.setenv('MDPO_SERVER_SOCKET', socket_path)
+        monkeypatch.setattr('sys.stdin', io.StringIO('Hello'))
+
+        # server not running, STDIN is preserved for local execution
+        assert forward_to_server('md2po', ['--no-location']) is None
+        assert sys.stdin.read() == 'Hello'
+
+        monkeypatch.setattr('sys.stdin', io.StringIO('Hello'))
+        with running_server(socket_path):
+            assert forward_to_server('md2po', ['--no-location']) == 0
+        stdout, stderr = capsys.readouterr()
+        assert stdout == (
+            '#\nmsgid ""\nmsgstr ""\n\nmsgid "Hello"\nmsgstr ""\n\n'
+        )
+        assert stderr == ''
+
+    monkeypatch.delenv('MDPO_SERVER_SOCKET')
+    assert forward_to_server('md2po', []) is None
+
+
+def test_unix_sockets_not_supported(monkeypatch, capsys):
+    monkeypatch.delattr(socket, 'AF_UNIX')
+    monkeypatch.delenv('MDPO_SERVER_SOCKET', raising=False)
+
+    with pytest.raises(OSError, match='Unix sockets are not supported'):
+        default_socket_path()
+    with pytest.raises(OSError, match='Unix sockets are not supported'):
+        create_server('mdpo.sock')
+
+    assert run(['serve']) == 1
+    _, stderr = capsys.readouterr()
+    assert stderr == 'Unix sockets are not supported in this platform\n'
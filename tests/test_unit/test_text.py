@@ -1,6 +1,8 @@
 """Tests for mdpo text utilities."""
 
 
+import random
+
 import pytest
 
 from mdpo.text import (
@@ -30,6 +32,31 @@ def test_min_not_max_chars_in_a_row(char, text, expected_result):
     assert min_not_max_chars_in_a_row(char, text) == expected_result
 
 
+def _reference_min_not_max_chars_in_a_row(char, text, default=1):
+    in_a_rows, current = (set(), 0)
+    for ch in text + '\0':
+        if ch == char:
+            current += 1
+        elif current:
+            in_a_rows.add(current)
+            current = 0
+    if not in_a_rows:
+        return default
+    return min(set(range(1, max(in_a_rows) + 2)) - in_a_rows)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_min_not_max_chars_in_a_row_random_texts(seed):
+    rand = random.Random(seed)
+    for _ in range(100):
+        text = ''.join(
+            rand.choice('``` a') for _ in range(rand.randint(0, 60))
+        )
+        assert min_not_max_chars_in_a_row('`', text) == (
+            _reference_min_not_max_chars_in_a_row('`', text)
+        ), text
+
+
 @pytest.mark.parametrize(
     ('text', 'expected_result'),
     (